@@ -0,0 +1,223 @@
+"""Fixtures driving Hundesystem against an in-process Home Assistant."""
+from __future__ import annotations
+
+import asyncio
+import uuid
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.setup import async_setup_component
+from homeassistant.util import slugify
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hundesystem.const import (
+    DOMAIN,
+    CONF_CREATE_DASHBOARD,
+    CONF_DOG_NAME,
+    CONF_DOGS,
+    CONF_DOOR_SENSOR,
+    CONF_PERSON_TRACKING,
+    CONF_PUSH_DEVICES,
+    HELPER_DEFINITIONS,
+)
+from custom_components.hundesystem.helpers import (
+    _build_service_data_ultra_safe,
+    build_helper_manifest,
+)
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+DOG_COUNTS = [1, 5, 20, 100]
+ROUNDS = 5
+
+# State of a freshly created helper whose service data has no initial value
+DEFAULT_HELPER_STATES = {
+    "input_boolean": "off",
+    "counter": "0",
+    "input_datetime": "00:00:00",
+    "input_text": "",
+    "input_number": "0",
+    "input_select": "",
+}
+
+PREFLIGHT_TEST_ENTITY = ("input_boolean", "Hundesystem Test Entity")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+def expected_lingering_timers() -> bool:
+    """Delayed store saves and debounce timers may outlive a benchmark."""
+    return True
+
+
+@pytest.fixture(params=DOG_COUNTS, ids=lambda count: f"{count}_dogs")
+def dog_names(request) -> List[str]:
+    """Return the dog names of one benchmark size."""
+    return [f"hund{index:03d}" for index in range(request.param)]
+
+
+class FakeHelperBackend:
+    """Stand-in for the create/update/remove services the helpers rely on.
+
+    Home Assistant creates helpers through websocket collections only; the
+    integration calls <domain>.create instead. This backend registers those
+    services and turns each call into a state with the manifest entity ID
+    of the helper, so provisioning runs its real code path.
+    """
+
+    def __init__(self, hass: HomeAssistant, dog_names: List[str]) -> None:
+        """Initialize the backend."""
+        self._hass = hass
+        self._dog_names = dog_names
+        self._entity_ids: Dict[Tuple[str, str], str] = {
+            PREFLIGHT_TEST_ENTITY: "input_boolean.hundesystem_test_entity",
+        }
+        self.calls = 0
+
+    async def async_setup(self) -> None:
+        """Set up the components the integration depends on and register the services."""
+        for component in ("system_log", "persistent_notification", *HELPER_DEFINITIONS):
+            assert await async_setup_component(self._hass, component, {})
+
+        # A create call only carries the service data; map it back to its manifest entity
+        for dog_name in self._dog_names:
+            for domain, entities in build_helper_manifest(dog_name, {}).items():
+                for entity_id, entity_data in entities.items():
+                    service_data = await _build_service_data_ultra_safe(domain, entity_data, dog_name)
+                    key = (domain, service_data["name"])
+                    assert key not in self._entity_ids, f"{entity_id} collides with {self._entity_ids[key]}"
+                    self._entity_ids[key] = entity_id
+
+        for domain in HELPER_DEFINITIONS:
+            self._hass.services.async_register(domain, "create", partial(self._async_create, domain))
+            self._hass.services.async_register(domain, "update", self._async_update)
+            self._hass.services.async_register(domain, "remove", self._async_remove)
+
+    async def async_seed(self) -> None:
+        """Create every helper of every dog, as after a previous start."""
+        for dog_name in self._dog_names:
+            for domain, entities in build_helper_manifest(dog_name, {}).items():
+                for entity_id, entity_data in entities.items():
+                    service_data = await _build_service_data_ultra_safe(domain, entity_data, dog_name)
+                    self._async_set_helper(domain, service_data, entity_id)
+
+    @callback
+    def async_clear(self) -> None:
+        """Remove every helper state, as on a first start."""
+        for entity_id in self._entity_ids.values():
+            self._hass.states.async_remove(entity_id)
+
+    @callback
+    def _async_create(self, domain: str, call: ServiceCall) -> None:
+        """Handle <domain>.create."""
+        self.calls += 1
+        self._async_set_helper(domain, call.data)
+
+    @callback
+    def _async_update(self, call: ServiceCall) -> None:
+        """Handle <domain>.update."""
+        self.calls += 1
+
+    @callback
+    def _async_remove(self, call: ServiceCall) -> None:
+        """Handle <domain>.remove."""
+        self.calls += 1
+        self._hass.states.async_remove(call.data["entity_id"])
+
+    @callback
+    def _async_set_helper(
+        self, domain: str, service_data: Dict[str, Any], entity_id: Optional[str] = None
+    ) -> None:
+        """Write the state of a created helper."""
+        name = service_data["name"]
+        if entity_id is None:
+            entity_id = self._entity_ids.get((domain, name), f"{domain}.{slugify(name)}")
+        state = service_data.get("initial", DEFAULT_HELPER_STATES[domain])
+        self._hass.states.async_set(entity_id, str(state), {"friendly_name": name})
+
+
+@pytest.fixture
+async def helper_backend(hass: HomeAssistant, dog_names: List[str]) -> FakeHelperBackend:
+    """Return the helper services with no helpers created yet."""
+    backend = FakeHelperBackend(hass, dog_names)
+    await backend.async_setup()
+    return backend
+
+
+def create_entry(hass: HomeAssistant, dog_names: List[str]) -> MockConfigEntry:
+    """Add a single-dog or household entry as the config flow would store it."""
+    data: Dict[str, Any] = {
+        CONF_PUSH_DEVICES: [],
+        CONF_PERSON_TRACKING: False,
+        CONF_CREATE_DASHBOARD: False,
+        CONF_DOOR_SENSOR: "",
+    }
+    if len(dog_names) == 1:
+        data[CONF_DOG_NAME] = dog_names[0]
+        unique_id = dog_names[0]
+    else:
+        data[CONF_DOGS] = {dog_name: {} for dog_name in dog_names}
+        unique_id = f"household_{uuid.uuid4().hex}"
+
+    entry = MockConfigEntry(domain=DOMAIN, data=data, unique_id=unique_id)
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Unload an entry and wait for its background work."""
+    if entry.state is ConfigEntryState.LOADED:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.fixture
+async def loaded_entry(
+    hass: HomeAssistant, helper_backend: FakeHelperBackend, dog_names: List[str]
+) -> MockConfigEntry:
+    """Return a loaded entry whose helpers already exist and deferred setup is done."""
+    await helper_backend.async_seed()
+    entry = create_entry(hass, dog_names)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    await async_unload_entry(hass, entry)
+
+
+AsyncTarget = Callable[[], Awaitable[Any]]
+
+
+@pytest.fixture
+def benchmark_async(hass: HomeAssistant, benchmark) -> Callable[..., Awaitable[None]]:
+    """Benchmark an async callable on the Home Assistant event loop.
+
+    pytest-benchmark times synchronous callables, so the rounds run in an
+    executor thread that submits each coroutine to the loop and waits; the
+    loop stays free to run it in the meantime. The thread is not a tracked
+    Home Assistant job, so a round may await async_block_till_done.
+    """
+
+    def _blocking(target: AsyncTarget) -> Callable[[], Any]:
+        return lambda: asyncio.run_coroutine_threadsafe(target(), hass.loop).result()
+
+    async def _run(target: AsyncTarget, setup: Optional[AsyncTarget] = None, rounds: int = ROUNDS) -> None:
+        await hass.loop.run_in_executor(
+            None,
+            partial(
+                benchmark.pedantic,
+                _blocking(target),
+                setup=_blocking(setup) if setup is not None else None,
+                rounds=rounds,
+                iterations=1,
+            )
+        )
+
+    return _run
@@ -0,0 +1,83 @@
+"""Benchmark and checks of the analytics over synthetic recorder rows."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+
+from custom_components.hundesystem.analytics import (
+    ANALYTICS_DAYS,
+    SERIES_ACTIVITY_TOTAL,
+    analytics_series,
+    analyze_history,
+)
+from custom_components.hundesystem.entity_ids import dog_entity_ids
+
+from .conftest import ROUNDS
+
+START = datetime(2026, 1, 1)
+NOW = START + timedelta(days=ANALYTICS_DAYS - 1, hours=14, minutes=30)
+SPIKE_DAY = 50          # Day with four times the usual walks
+OUTSIDE_FIRST_DAY = 80  # The outside counter is only recorded from this day
+
+
+def _row(state: Any, timestamp: datetime) -> Dict[str, Any]:
+    """Return a compressed recorder row."""
+    return {COMPRESSED_STATE_STATE: str(state), COMPRESSED_STATE_LAST_UPDATED: timestamp.timestamp()}
+
+
+def _counter_rows(per_day: int, first_day: int = 0) -> List[Dict[str, Any]]:
+    """Return the rows of a counter reset at midnight and increased per_day times a day."""
+    rows = []
+    for day in range(first_day, ANALYTICS_DAYS):
+        midnight = START + timedelta(days=day)
+        rows.append(_row(0, midnight))
+        for count in range(1, per_day * (4 if day == SPIKE_DAY else 1) + 1):
+            rows.append(_row(count, midnight + timedelta(hours=7, minutes=count * 10)))
+    return rows
+
+
+def _dog_rows(dog_name: str) -> Dict[str, List[Dict[str, Any]]]:
+    """Return the recorded rows of one dog."""
+    ids = dog_entity_ids(dog_name)
+    return {
+        ids.activities["walk"]["count"]: _counter_rows(3),
+        ids.activities["outside"]["count"]: _counter_rows(5, OUTSIDE_FIRST_DAY),
+        ids.get("input_number", "weight"): [
+            _row(20, START),
+            _row("unknown", START + timedelta(days=10)),
+            _row(21, START + timedelta(days=30, hours=5)),
+        ],
+    }
+
+
+def test_analyze_history(benchmark, dog_names: List[str]) -> None:
+    """Analyse 90 days of recorded helpers of every dog."""
+    history = [(_dog_rows(dog_name), analytics_series(dog_name)) for dog_name in dog_names]
+
+    def _analyze() -> List[Dict[str, Dict[str, Any]]]:
+        return [analyze_history(rows, series, START, NOW) for rows, series in history]
+
+    results = benchmark.pedantic(_analyze, rounds=ROUNDS, iterations=1)[0]
+
+    walk = results["walk"]
+    assert walk["days"] == ANALYTICS_DAYS - 1
+    assert walk["today"] == 3
+    assert walk["moving_average"] == 3
+    assert [anomaly["date"] for anomaly in walk["anomalies"]] == [
+        (START + timedelta(days=SPIKE_DAY)).date().isoformat()
+    ]
+    assert walk["hourly_profile"][7] > 0 and walk["hourly_profile"][12] == 0
+
+    # The total only covers the days both activities were recorded
+    total = results[SERIES_ACTIVITY_TOTAL]
+    assert total["days"] == ANALYTICS_DAYS - 1 - OUTSIDE_FIRST_DAY
+    assert total["mean"] == 8 and total["variance"] == 0 and total["slope"] == 0
+    assert total["today"] == 8
+
+    weight = results["weight"]
+    assert weight["today"] == 21
+    assert weight["slope"] > 0
+
+    assert "play" not in results and "feeding" not in results
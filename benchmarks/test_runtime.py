@@ -0,0 +1,64 @@
+"""Benchmarks of the daily reset, activity logging and sensor recomputes."""
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hundesystem.const import DOMAIN, SERVICE_LOG_ACTIVITY
+from custom_components.hundesystem.daily_reset import async_perform_daily_reset
+
+ACTIVITY_BURST = 100
+
+
+async def test_daily_reset(
+    hass: HomeAssistant, benchmark_async, loaded_entry: MockConfigEntry, dog_names: List[str]
+) -> None:
+    """Reset the helpers of all dogs at once."""
+
+    async def _reset() -> None:
+        await async_perform_daily_reset(hass, dog_names)
+
+    await benchmark_async(_reset)
+
+
+async def test_log_activity_burst(
+    hass: HomeAssistant, benchmark_async, loaded_entry: MockConfigEntry, dog_names: List[str]
+) -> None:
+    """Handle a burst of log_activity calls spread over all dogs."""
+
+    async def _burst() -> None:
+        await asyncio.gather(*(
+            hass.services.async_call(
+                DOMAIN, SERVICE_LOG_ACTIVITY,
+                {"activity_type": "walk", "dog_name": dog_names[index % len(dog_names)]},
+                blocking=True,
+            )
+            for index in range(ACTIVITY_BURST)
+        ))
+
+    await benchmark_async(_burst)
+
+
+async def test_full_recompute(
+    hass: HomeAssistant, benchmark_async, loaded_entry: MockConfigEntry, dog_names: List[str]
+) -> None:
+    """Recompute the coordinator data of every dog and the state of every entity."""
+    coordinator = hass.data[DOMAIN][loaded_entry.entry_id]["coordinator"]
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        for entity in platform.entities.values()
+        if hasattr(entity, "_async_update_state")
+    ]
+    assert entities
+
+    async def _recompute() -> None:
+        coordinator._last_full_refresh = None  # Force the periodic full refresh
+        await coordinator.async_refresh()
+        await asyncio.gather(*(entity._async_update_state() for entity in entities))
+
+    await benchmark_async(_recompute)
@@ -0,0 +1,60 @@
+"""Benchmarks of entry setup and helper provisioning."""
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.hundesystem.helpers import async_create_helpers
+
+from .conftest import FakeHelperBackend, async_unload_entry, create_entry
+
+
+async def test_setup_entry(
+    hass: HomeAssistant, benchmark_async, helper_backend: FakeHelperBackend, dog_names: List[str]
+) -> None:
+    """End-to-end async_setup_entry of an entry whose helpers already exist."""
+    await helper_backend.async_seed()
+    entry = create_entry(hass, dog_names)
+
+    async def _unload() -> None:
+        await async_unload_entry(hass, entry)
+
+    async def _setup() -> None:
+        assert await hass.config_entries.async_setup(entry.entry_id)
+
+    await benchmark_async(_setup, setup=_unload)
+    await _unload()
+
+
+async def test_helper_provisioning(
+    hass: HomeAssistant, benchmark_async, helper_backend: FakeHelperBackend, dog_names: List[str]
+) -> None:
+    """Create every helper of every dog from scratch."""
+
+    async def _clear() -> None:
+        helper_backend.async_clear()
+
+    async def _provision() -> None:
+        await asyncio.gather(*(
+            async_create_helpers(hass, dog_name, {}, report=False) for dog_name in dog_names
+        ))
+
+    await benchmark_async(_provision, setup=_clear)
+    assert helper_backend.calls > 0
+
+
+async def test_helper_reconciliation(
+    hass: HomeAssistant, benchmark_async, helper_backend: FakeHelperBackend, dog_names: List[str]
+) -> None:
+    """Reconcile helpers that are all up to date (the cost of every restart)."""
+    await helper_backend.async_seed()
+
+    async def _reconcile() -> None:
+        await asyncio.gather(*(
+            async_create_helpers(hass, dog_name, {}, report=False) for dog_name in dog_names
+        ))
+
+    await benchmark_async(_reconcile)
+    assert helper_backend.calls == 0
@@ -1,3 +1,21 @@
+"""The Hundesystem integration - CORRECTED VERSION."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_time_change, async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
+
 from .const import (
     DOMAIN,
     CONF_DOG_NAME,
@@ -5,22 +23,58 @@ from .const import (
     CONF_PERSON_TRACKING,
     CONF_CREATE_DASHBOARD,
     CONF_DOOR_SENSOR,
+    CONF_NOTIFICATION_WINDOW,
+    DEFAULT_NOTIFICATION_WINDOW,
     SERVICE_TRIGGER_FEEDING_REMINDER,
     SERVICE_DAILY_RESET,
     SERVICE_SEND_NOTIFICATION,
     SERVICE_SET_VISITOR_MODE,
     SERVICE_LOG_ACTIVITY,
-    SERVICE_ADD_DOG,
+    SERVICE_LOG_BATCH,
+    SERVICE_QUERY_JOURNAL,
     SERVICE_TEST_NOTIFICATION,
     SERVICE_EMERGENCY_CONTACT,
     SERVICE_HEALTH_CHECK,
     MEAL_TYPES,
     ACTIVITY_TYPES,
-    FEEDING_TYPES,
-    ICONS,
+    JOURNAL_CATEGORIES,
+)
+from .activity_batch import MAX_BATCH_RECORDS, async_log_batch
+from .analytics import DATA_ANALYTICS_LOCK, async_get_analytics, get_dog_analytics
+from .helpers import (
+    DATA_HELPER_PROVISIONING,
+    async_report_helper_creation,
+    verify_helper_creation_ultra,
 )
-from .helpers import async_create_helpers, verify_helper_creation
-from .dashboard import async_create_dashboard
+from .readiness import async_wait_for_entities, async_wait_for_helper_domains
+from .coordinator import async_get_coordinator
+from .daily_reset import async_perform_daily_reset
+from .entity_ids import dog_entity_ids
+from .event_store import async_get_event_store, get_dog_event_store
+from .history import async_get_history
+from .household import (
+    entry_config,
+    entry_dog_names,
+    find_dog_data,
+    get_dog_data,
+    iter_dog_data,
+)
+from .idempotency import DATA_ACTIVITY_DEDUPLICATOR
+from .journal import JOURNAL_MAX_ENTRIES, async_get_journal, get_dog_journal
+from .notification_handler import activity_action, async_setup_notification_actions
+from .notification_queue import async_get_notification_queue, async_stop_notification_queue
+from .notification_router import async_get_notification_router, async_stop_notification_router
+from .reminders import FeedingReminderScheduler
+from .profiling import DATA_PROFILER, async_get_profiler
+from .service_dispatcher import (
+    ATTR_DOG_NAME,
+    DOG_NAMES,
+    async_get_service_dispatcher,
+    async_stop_service_dispatcher,
+)
+from .snapshot import async_get_snapshot
+from .startup import STAGE_DEFERRED, SetupTimings
+from .dashboard import async_create_dashboard, async_create_overview_dashboard
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,28 +88,28 @@ PLATFORMS: List[Platform] = [
 TRIGGER_FEEDING_REMINDER_SCHEMA = vol.Schema({
     vol.Required("meal_type"): vol.In(MEAL_TYPES.keys()),
     vol.Optional("message"): cv.string,
-    vol.Optional("dog_name"): cv.string,
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
 })
 
 SEND_NOTIFICATION_SCHEMA = vol.Schema({
     vol.Required("title"): cv.string,
     vol.Required("message"): cv.string,
     vol.Optional("target"): cv.string,
-    vol.Optional("dog_name"): cv.string,
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
     vol.Optional("data"): dict,
 })
 
 SET_VISITOR_MODE_SCHEMA = vol.Schema({
     vol.Required("enabled"): cv.boolean,
     vol.Optional("visitor_name", default=""): cv.string,
-    vol.Optional("dog_name"): cv.string,
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
 })
 
 LOG_ACTIVITY_SCHEMA = vol.Schema({
     vol.Required("activity_type"): vol.In(ACTIVITY_TYPES.keys()),
     vol.Optional("duration"): vol.Range(min=1, max=480),
     vol.Optional("notes", default=""): cv.string,
-    vol.Optional("dog_name"): cv.string,
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
 })
 
 ADD_DOG_SCHEMA = vol.Schema({
@@ -66,7 +120,11 @@ ADD_DOG_SCHEMA = vol.Schema({
 })
 
 TEST_NOTIFICATION_SCHEMA = vol.Schema({
-    vol.Optional("dog_name"): cv.string,
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
+})
+
+DAILY_RESET_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
 })
 
 EMERGENCY_CONTACT_SCHEMA = vol.Schema({
@@ -74,7 +132,19 @@ EMERGENCY_CONTACT_SCHEMA = vol.Schema({
     vol.Required("message"): cv.string,
     vol.Optional("location", default=""): cv.string,
     vol.Optional("contact_vet", default=False): cv.boolean,
-    vol.Required("dog_name"): cv.string,
+    vol.Required(ATTR_DOG_NAME): DOG_NAMES,
+})
+
+LOG_BATCH_SCHEMA = vol.Schema({
+    vol.Required("records"): vol.All(cv.ensure_list, vol.Length(min=1, max=MAX_BATCH_RECORDS)),
+})
+
+QUERY_JOURNAL_SCHEMA = vol.Schema({
+    vol.Optional("start"): cv.datetime,
+    vol.Optional("end"): cv.datetime,
+    vol.Optional("category"): vol.In(list(JOURNAL_CATEGORIES)),
+    vol.Optional("limit", default=50): vol.All(vol.Coerce(int), vol.Range(min=1, max=JOURNAL_MAX_ENTRIES)),
+    vol.Optional(ATTR_DOG_NAME): DOG_NAMES,
 })
 
 HEALTH_CHECK_SCHEMA = vol.Schema({
@@ -82,125 +152,232 @@ HEALTH_CHECK_SCHEMA = vol.Schema({
     vol.Optional("notes", default=""): cv.string,
     vol.Optional("temperature"): vol.Range(min=35.0, max=42.0),
     vol.Optional("weight"): vol.Range(min=0.1, max=100.0),
-    vol.Required("dog_name"): cv.string,
+    vol.Required(ATTR_DOG_NAME): DOG_NAMES,
 })
 
+# Entities checked by the final verification of every dog
+KEY_ENTITIES = [
+    ("input_boolean", "feeding_morning"),
+    ("input_boolean", "outside"),
+    ("counter", "outside_count"),
+    ("sensor", "status"),
+    ("binary_sensor", "feeding_complete"),
+]
+
 # Global services registry to prevent double registration
 _SERVICES_REGISTERED = False
+_DAILY_RESET_LISTENER: Optional[Callable[[], None]] = None
+_NOTIFICATION_ACTION_LISTENER: Optional[Callable[[], None]] = None
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Hundesystem from a config entry with improved error handling."""
+    """Set up Hundesystem from a config entry (one dog or a household) with improved error handling."""
     global _SERVICES_REGISTERED
     
     hass.data.setdefault(DOMAIN, {})
     
-    dog_name = entry.data[CONF_DOG_NAME]
-    _LOGGER.info("=== HUNDESYSTEM SETUP START for %s ===", dog_name)
+    dog_names = entry_dog_names(entry)
+    label = ", ".join(dog_names)
+    _LOGGER.info("=== HUNDESYSTEM SETUP START for %s ===", label)
     
-    # Store config data
+    # Store the shared config once; per-dog data only keeps the dog's overrides
     hass.data[DOMAIN][entry.entry_id] = {
-        "config": entry.data,
-        "dog_name": dog_name,
-        "store": Store(hass, 1, f"{DOMAIN}_{dog_name}"),
+        "config": entry_config(entry),
+        "dogs": {},
         "listeners": [],  # Track event listeners for cleanup
     }
+    # Index the dogs for the service dispatcher until the entry is unloaded
+    dispatcher = async_get_service_dispatcher(hass)
+    for dog_name in dog_names:
+        dispatcher.async_add_dog(get_dog_data(hass, entry, dog_name))
+        hass.data[DOMAIN][entry.entry_id]["listeners"].append(
+            partial(dispatcher.async_remove_dog, dog_name)
+        )
+    
+    timings = SetupTimings(async_get_profiler(hass))
+    hass.data[DOMAIN][entry.entry_id]["setup_timings"] = timings
     
     try:
-        # Step 1: Wait for core domains to be ready
-        _LOGGER.info("Step 1: Waiting for core domains to be ready...")
-        if not await _wait_for_core_domains(hass):
-            _LOGGER.error("Core domains not ready, setup may be incomplete")
+        # Critical path: everything entities need to read the cached state
         
-        # Step 2: Create helper entities with improved robustness
-        _LOGGER.info("Step 2: Creating helper entities for %s", dog_name)
-        await async_create_helpers_robust(hass, dog_name, entry.data)
-        _LOGGER.info("Helper entities created successfully for %s", dog_name)
+        # Step 1: Wait for core domains to be ready (once for all dogs)
+        _LOGGER.info("Step 1: Waiting for core domains to be ready...")
+        with timings.stage("core_domains"):
+            if not await _wait_for_core_domains(hass):
+                _LOGGER.error("Core domains not ready, setup may be incomplete")
         
-        # Step 3: Verify helper creation
-        _LOGGER.info("Step 3: Verifying helper entities...")
-        verification_results = await verify_helper_creation(hass, dog_name)
-        if verification_results["success_rate"] < 70:
-            _LOGGER.warning("Helper creation success rate low: %.1f%%", verification_results["success_rate"])
+        # Step 2: Reconcile helper entities of all dogs concurrently (reports are deferred)
+        _LOGGER.info("Step 2: Creating helper entities for %s", label)
+        with timings.stage("helpers"):
+            helper_results = await asyncio.gather(*[
+                async_create_helpers_robust(hass, dog_name, _dog_config(hass, entry, dog_name))
+                for dog_name in dog_names
+            ])
+        _LOGGER.info("Helper entities created successfully for %s", label)
         
-        # Step 4: Wait for entities to stabilize
-        _LOGGER.info("Step 4: Waiting for entities to stabilize...")
-        await asyncio.sleep(3.0)
+        # Step 3: Set up platforms (one coordinator shared by all dogs of the entry)
+        _LOGGER.info("Step 3: Setting up platforms for %s", label)
+        with timings.stage("stores"):
+            await asyncio.gather(*[
+                loader(hass, entry, dog_name)
+                for dog_name in dog_names
+                for loader in (async_get_event_store, async_get_history, async_get_journal, async_get_analytics)
+            ])
+        with timings.stage("coordinator"):
+            await async_get_coordinator(hass, entry).async_refresh()
+        with timings.stage("platforms"):
+            await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        _LOGGER.info("Platforms set up successfully for %s", label)
         
-        # Step 5: Set up platforms
-        _LOGGER.info("Step 5: Setting up platforms for %s", dog_name)
-        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-        _LOGGER.info("Platforms set up successfully for %s", dog_name)
+        # Step 4: Register services (only once globally)
+        with timings.stage("services"):
+            if not _SERVICES_REGISTERED:
+                _LOGGER.info("Step 4: Registering global services")
+                await _register_services(hass)
+                _SERVICES_REGISTERED = True
+            else:
+                _LOGGER.debug("Services already registered, skipping")
         
-        # Step 6: Register services (only once globally)
-        if not _SERVICES_REGISTERED:
-            _LOGGER.info("Step 6: Registering global services")
-            await _register_services(hass)
-            _SERVICES_REGISTERED = True
-        else:
-            _LOGGER.debug("Services already registered, skipping")
+        # Step 5: Setup automations and listeners (listener registration only)
+        _LOGGER.info("Step 5: Setting up automations for %s", label)
+        with timings.stage("automations"):
+            await _setup_automations(hass, entry, dog_names)
         
-        # Step 7: Create dashboard if requested
-        if entry.data.get(CONF_CREATE_DASHBOARD, True):
-            _LOGGER.info("Step 7: Creating dashboard for %s", dog_name)
-            try:
-                await async_create_dashboard(hass, dog_name, entry.data)
-            except Exception as e:
-                _LOGGER.warning("Dashboard creation failed for %s: %s", dog_name, e)
+        timings.critical_done()
         
-        # Step 8: Setup automations and listeners
-        _LOGGER.info("Step 8: Setting up automations for %s", dog_name)
-        await _setup_automations(hass, entry, dog_name)
+        # Steps 6-10 (reports, verification, dashboards, analytics) run once Home Assistant has started
+        async def _deferred_setup(hass: HomeAssistant) -> None:
+            """Run the non-critical setup stages in the background."""
+            await _async_deferred_setup(hass, entry, dog_names, helper_results)
         
-        # Step 9: Final verification
-        _LOGGER.info("Step 9: Final verification for %s", dog_name)
-        await _final_verification(hass, dog_name)
+        hass.data[DOMAIN][entry.entry_id]["listeners"].extend([
+            async_at_started(hass, _deferred_setup),
+            entry.add_update_listener(_async_entry_updated),
+        ])
         
-        _LOGGER.info("=== HUNDESYSTEM SETUP COMPLETE for %s ===", dog_name)
+        _LOGGER.info(
+            "=== HUNDESYSTEM SETUP COMPLETE for %s in %.2fs (deferred stages pending) ===",
+            label, timings.critical_duration,
+        )
         return True
         
     except Exception as e:
-        _LOGGER.error("=== HUNDESYSTEM SETUP FAILED for %s: %s ===", dog_name, e, exc_info=True)
+        _LOGGER.error("=== HUNDESYSTEM SETUP FAILED for %s: %s ===", label, e, exc_info=True)
         # Clean up partial setup
         await _cleanup_partial_setup(hass, entry)
         return False
 
 
-async def _wait_for_core_domains(hass: HomeAssistant, timeout: int = 30) -> bool:
-    """Wait for core domains to be available."""
-    required_domains = ["input_boolean", "counter", "input_datetime", "input_text", "input_number", "input_select"]
+async def _async_deferred_setup(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    dog_names: List[str],
+    helper_results: List[Optional[Dict[str, Any]]],
+) -> None:
+    """Verify helpers, send the creation reports and write dashboards after startup."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is None:
+        return  # Unloaded before Home Assistant finished starting
+    timings: SetupTimings = entry_data["setup_timings"]
+    label = ", ".join(dog_names)
     
-    for _ in range(timeout):
-        all_ready = True
-        for domain in required_domains:
-            if not hass.services.has_service(domain, "create"):
-                all_ready = False
-                break
+    try:
+        # Step 6: Detailed report of freshly created helpers
+        with timings.stage("helper_reports", STAGE_DEFERRED):
+            await asyncio.gather(*[
+                async_report_helper_creation(hass, dog_name, results)
+                for dog_name, results in zip(dog_names, helper_results)
+                if results is not None
+            ])
+        
+        # Step 7: Verify helper creation
+        _LOGGER.info("Step 7: Verifying helper entities for %s", label)
+        with timings.stage("helper_verification", STAGE_DEFERRED):
+            verification_results = await asyncio.gather(*[
+                verify_helper_creation_ultra(hass, dog_name) for dog_name in dog_names
+            ])
+        for dog_name, result in zip(dog_names, verification_results):
+            if result["success_rate"] < 70:
+                _LOGGER.warning("Helper creation success rate low for %s: %.1f%%", dog_name, result["success_rate"])
+        
+        # Step 8: Create dashboards if requested
+        with timings.stage("dashboards", STAGE_DEFERRED):
+            for dog_name in dog_names:
+                dog_config = _dog_config(hass, entry, dog_name)
+                if dog_config.get(CONF_CREATE_DASHBOARD, True):
+                    _LOGGER.info("Step 8: Creating dashboard for %s", dog_name)
+                    try:
+                        await async_create_dashboard(hass, dog_name, dog_config)
+                    except Exception as e:
+                        _LOGGER.warning("Dashboard creation failed for %s: %s", dog_name, e)
+            
+            # One overview dashboard covering the dogs of all entries
+            await _update_overview_dashboard(hass)
         
-        if all_ready:
-            _LOGGER.debug("All core domains ready")
-            return True
+        # Step 9: Start the hourly trend analytics; the recorder is up once Home Assistant started
+        with timings.stage("analytics", STAGE_DEFERRED):
+            for dog_name in dog_names:
+                analytics = get_dog_analytics(hass, dog_name)
+                if analytics is not None:
+                    analytics.async_start()
         
-        await asyncio.sleep(1)
+        # Step 10: Final verification
+        _LOGGER.info("Step 10: Final verification for %s", label)
+        with timings.stage("final_verification", STAGE_DEFERRED):
+            await _final_verification(hass, dog_names)
+        
+    except Exception as e:
+        _LOGGER.error("Deferred setup failed for %s: %s", label, e, exc_info=True)
+    
+    timings.deferred_done()
+    _LOGGER.info("Deferred setup stages finished for %s: %s", label, timings.as_dict()["stages"])
+
+
+def _dog_config(hass: HomeAssistant, entry: ConfigEntry, dog_name: str) -> Dict[str, Any]:
+    """Return the effective config of one dog of an entry."""
+    return get_dog_data(hass, entry, dog_name)["config"]
+
+
+async def _update_overview_dashboard(hass: HomeAssistant) -> None:
+    """Render the overview dashboard from all loaded dogs that want a dashboard."""
+    dog_names = [
+        dog_data["dog_name"] for dog_data in iter_dog_data(hass)
+        if dog_data["config"].get(CONF_CREATE_DASHBOARD, True)
+    ]
+    try:
+        await async_create_overview_dashboard(hass, dog_names)
+    except Exception as e:
+        _LOGGER.warning("Overview dashboard update failed: %s", e)
+
+
+async def _wait_for_core_domains(hass: HomeAssistant, timeout: int = 30) -> bool:
+    """Wait for core domains to be available."""
+    if await async_wait_for_helper_domains(hass, timeout):
+        _LOGGER.debug("All core domains ready")
+        return True
     
     _LOGGER.warning("Timeout waiting for core domains")
     return False
 
 
-async def async_create_helpers_robust(hass: HomeAssistant, dog_name: str, config: dict) -> None:
-    """Create helper entities with maximum robustness and error recovery."""
+async def async_create_helpers_robust(hass: HomeAssistant, dog_name: str, config: dict) -> Optional[Dict[str, Any]]:
+    """Create helper entities with maximum robustness and error recovery.
+    
+    Returns the creation results to report later, or None if nothing was created.
+    """
     
     try:
         # Import the improved helpers function
         from .helpers import async_create_helpers
         
-        # Call the improved helper creation function
-        await async_create_helpers(hass, dog_name, config)
+        # Call the improved helper creation function; the report is sent after startup
+        return await async_create_helpers(hass, dog_name, config, report=False)
         
     except Exception as e:
         _LOGGER.error("Helper creation failed for %s: %s", dog_name, e)
         # Try alternative approach or create minimal set
         await _create_minimal_helpers(hass, dog_name)
+        return None
 
 
 async def _create_minimal_helpers(hass: HomeAssistant, dog_name: str) -> None:
@@ -232,17 +409,26 @@ async def _create_minimal_helpers(hass: HomeAssistant, dog_name: str) -> None:
             )
             
             _LOGGER.debug("Created minimal helper: %s.%s", domain, entity_name)
-            await asyncio.sleep(0.5)
             
         except Exception as e:
             _LOGGER.error("Failed to create minimal helper %s: %s", entity_name, e)
 
 
+async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so changed dogs and options take effect."""
+    if entry.entry_id not in hass.data.get(DOMAIN, {}):
+        return
+    
+    # Dogs and per-dog settings are snapshotted at setup
+    _LOGGER.info("Configuration of %s changed, reloading", entry.title)
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry with proper cleanup."""
     global _SERVICES_REGISTERED
     
-    _LOGGER.info("Unloading Hundesystem entry for %s", entry.data[CONF_DOG_NAME])
+    _LOGGER.info("Unloading Hundesystem entry for %s", ", ".join(entry_dog_names(entry)))
     
     # Clean up listeners
     entry_data = hass.data[DOMAIN].get(entry.entry_id, {})
@@ -253,15 +439,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         except Exception as e:
             _LOGGER.warning("Error removing listener: %s", e)
     
+    # Write pending events and journal entries now, so a reload does not load a stale file
+    for dog_data in entry_data.get("dogs", {}).values():
+        for store in (dog_data.get("event_store"), dog_data.get("journal")):
+            if store is not None:
+                await store.async_flush()
+    
     # Unload platforms
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
         
+        # Drop this entry's dogs from the overview dashboard
+        if hass.data[DOMAIN]:
+            await _update_overview_dashboard(hass)
+        
         # Remove services if no more instances
         if not hass.data[DOMAIN]:
             await _unregister_services(hass)
+            async_stop_notification_queue(hass)
+            async_stop_notification_router(hass)
+            hass.data.pop(DATA_PROFILER, None)
+            hass.data.pop(DATA_ACTIVITY_DEDUPLICATOR, None)
+            hass.data.pop(DATA_HELPER_PROVISIONING, None)
+            hass.data.pop(DATA_ANALYTICS_LOCK, None)
             _SERVICES_REGISTERED = False
             _LOGGER.info("All Hundesystem instances removed, services unregistered")
     
@@ -269,259 +471,167 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 
 async def _register_services(hass: HomeAssistant) -> None:
-    """Register services for the integration with comprehensive error handling."""
-    
-    # Check if already registered
-    if hass.services.has_service(DOMAIN, SERVICE_TRIGGER_FEEDING_REMINDER):
-        _LOGGER.debug("Services already registered")
-        return
+    """Register the services with the shared dispatcher, which routes them per dog."""
+    dispatcher = async_get_service_dispatcher(hass)
     
-    async def trigger_feeding_reminder(call: ServiceCall) -> None:
-        """Handle feeding reminder service call."""
+    async def trigger_feeding_reminder(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle feeding reminder service call for one dog."""
+        meal_type = data["meal_type"]
+        message = data.get("message", f"🐶 Zeit für {MEAL_TYPES[meal_type]}!")
+        dog = dog_data["dog_name"]
+        
         try:
-            meal_type = call.data["meal_type"]
-            message = call.data.get("message", f"🐶 Zeit für {MEAL_TYPES[meal_type]}!")
-            dog_name = call.data.get("dog_name")
+            # Update feeding datetime
+            datetime_entity = dog_entity_ids(dog).meals[meal_type]["last_time"]
+            if hass.states.get(datetime_entity):
+                await hass.services.async_call(
+                    "input_datetime", "set_datetime",
+                    {
+                        "entity_id": datetime_entity,
+                        "datetime": datetime.now().isoformat()
+                    },
+                    blocking=True
+                )
             
-            if meal_type not in MEAL_TYPES:
-                raise ServiceValidationError(f"Invalid meal_type: {meal_type}")
+            # Send notification; tapping "Gefüttert" logs the meal
+            await _send_notification(
+                hass, dog_data["config"], f"🍽️ Fütterungszeit - {dog.title()}", message,
+                data=_feeding_reminder_data(dog, meal_type),
+            )
             
-            # Get target config entries
-            target_entries = await _get_target_entries(hass, dog_name)
+            _LOGGER.info("Feeding reminder sent for %s: %s", dog, meal_type)
             
-            for entry_data in target_entries:
-                config = entry_data["config"]
-                dog = entry_data["dog_name"]
-                
-                try:
-                    # Update feeding datetime
-                    datetime_entity = f"input_datetime.{dog}_last_feeding_{meal_type}"
-                    if hass.states.get(datetime_entity):
-                        await hass.services.async_call(
-                            "input_datetime", "set_datetime",
-                            {
-                                "entity_id": datetime_entity,
-                                "datetime": datetime.now().isoformat()
-                            },
-                            blocking=True
-                        )
-                    
-                    # Send notification
-                    await _send_notification(hass, config, f"🍽️ Fütterungszeit - {dog.title()}", message)
-                    
-                    _LOGGER.info("Feeding reminder sent for %s: %s", dog, meal_type)
-                    
-                except Exception as e:
-                    _LOGGER.error("Failed to send feeding reminder for %s: %s", dog, e)
-                    continue
-                    
-        except ServiceValidationError:
-            raise
         except Exception as e:
-            _LOGGER.error("Unexpected error in feeding reminder service: %s", e)
-            raise ServiceValidationError(f"Service execution failed: {e}")
+            _LOGGER.error("Failed to send feeding reminder for %s: %s", dog, e)
     
-    async def daily_reset(call: ServiceCall) -> None:
-        """Handle daily reset service call."""
-        try:
-            dog_name = call.data.get("dog_name")
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                dog = entry_data["dog_name"]
-                config = entry_data["config"]
-                
-                try:
-                    await _perform_daily_reset(hass, dog)
-                    
-                    # Send confirmation
-                    await _send_notification(
-                        hass, config,
-                        f"🔄 Tagesreset - {dog.title()}", 
-                        "Alle Statistiken wurden zurückgesetzt"
-                    )
-                    
-                    _LOGGER.info("Daily reset completed for %s", dog)
-                    
-                except Exception as e:
-                    _LOGGER.error("Error during daily reset for %s: %s", dog, e)
-                    continue
-                    
-        except Exception as e:
-            _LOGGER.error("Unexpected error in daily reset service: %s", e)
-            raise ServiceValidationError(f"Daily reset failed: {e}")
+    async def daily_reset(targets: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+        """Handle daily reset service call - all target dogs in one batch."""
+        await async_perform_daily_reset(hass, [dog_data["dog_name"] for dog_data in targets])
+        
+        # Send confirmations concurrently
+        results = await asyncio.gather(
+            *[
+                _send_notification(
+                    hass, dog_data["config"],
+                    f"🔄 Tagesreset - {dog_data['dog_name'].title()}", 
+                    "Alle Statistiken wurden zurückgesetzt"
+                )
+                for dog_data in targets
+            ],
+            return_exceptions=True,
+        )
+        for dog_data, result in zip(targets, results):
+            if isinstance(result, Exception):
+                _LOGGER.error("Error sending reset confirmation for %s: %s", dog_data["dog_name"], result)
     
-    async def send_notification(call: ServiceCall) -> None:
-        """Handle send notification service call."""
-        try:
-            title = call.data["title"]
-            message = call.data["message"]
-            target = call.data.get("target")
-            dog_name = call.data.get("dog_name")
-            data = call.data.get("data", {})
-            
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                config = entry_data["config"]
-                await _send_notification(hass, config, title, message, target, data)
-                
-        except Exception as e:
-            _LOGGER.error("Error in send notification service: %s", e)
-            raise ServiceValidationError(f"Notification failed: {e}")
+    async def send_notification(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle send notification service call for one dog."""
+        await _send_notification(
+            hass, dog_data["config"], data["title"], data["message"], data.get("target"), data.get("data", {})
+        )
     
-    async def set_visitor_mode(call: ServiceCall) -> None:
-        """Handle set visitor mode service call."""
-        try:
-            enabled = call.data["enabled"]
-            visitor_name = call.data.get("visitor_name", "")
-            dog_name = call.data.get("dog_name")
-            
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                dog = entry_data["dog_name"]
-                
-                # Set visitor mode input_boolean
-                visitor_entity = f"input_boolean.{dog}_visitor_mode_input"
-                if hass.states.get(visitor_entity):
-                    action = "turn_on" if enabled else "turn_off"
-                    await hass.services.async_call(
-                        "input_boolean", action,
-                        {"entity_id": visitor_entity},
-                        blocking=True
-                    )
-                
-                # Set visitor name
-                if visitor_name:
-                    name_entity = f"input_text.{dog}_visitor_name"
-                    if hass.states.get(name_entity):
-                        await hass.services.async_call(
-                            "input_text", "set_value",
-                            {"entity_id": name_entity, "value": visitor_name},
-                            blocking=True
-                        )
-                
-                _LOGGER.info("Visitor mode %s for %s", "enabled" if enabled else "disabled", dog)
-                
-        except Exception as e:
-            _LOGGER.error("Error in visitor mode service: %s", e)
-            raise ServiceValidationError(f"Visitor mode failed: {e}")
+    async def set_visitor_mode(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle set visitor mode service call for one dog."""
+        enabled = data["enabled"]
+        visitor_name = data.get("visitor_name", "")
+        dog = dog_data["dog_name"]
+        ids = dog_entity_ids(dog)
+        
+        # Set visitor mode input_boolean
+        visitor_entity = ids.get("input_boolean", "visitor_mode_input")
+        if hass.states.get(visitor_entity):
+            action = "turn_on" if enabled else "turn_off"
+            await hass.services.async_call(
+                "input_boolean", action,
+                {"entity_id": visitor_entity},
+                blocking=True
+            )
+        
+        # Set visitor name
+        if visitor_name:
+            name_entity = ids.get("input_text", "visitor_name")
+            if hass.states.get(name_entity):
+                await hass.services.async_call(
+                    "input_text", "set_value",
+                    {"entity_id": name_entity, "value": visitor_name},
+                    blocking=True
+                )
+        
+        _LOGGER.info("Visitor mode %s for %s", "enabled" if enabled else "disabled", dog)
     
-    async def log_activity(call: ServiceCall) -> None:
-        """Handle log activity service call."""
-        try:
-            activity_type = call.data["activity_type"]
-            duration = call.data.get("duration", 0)
-            notes = call.data.get("notes", "")
-            dog_name = call.data.get("dog_name")
-            
-            if activity_type not in ACTIVITY_TYPES:
-                raise ServiceValidationError(f"Invalid activity_type: {activity_type}")
-            
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                dog = entry_data["dog_name"]
-                
-                await _log_activity_for_dog(hass, dog, activity_type, duration, notes)
-                _LOGGER.info("Activity logged for %s: %s", dog, activity_type)
-                
-        except ServiceValidationError:
-            raise
-        except Exception as e:
-            _LOGGER.error("Error in log activity service: %s", e)
-            raise ServiceValidationError(f"Activity logging failed: {e}")
+    async def log_activity(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle log activity service call for one dog."""
+        dog = dog_data["dog_name"]
+        activity_type = data["activity_type"]
+        await _log_activity_for_dog(hass, dog, activity_type, data.get("duration", 0), data.get("notes", ""))
+        _LOGGER.info("Activity logged for %s: %s", dog, activity_type)
     
-    async def test_notification(call: ServiceCall) -> None:
-        """Handle test notification service call."""
-        try:
-            dog_name = call.data.get("dog_name")
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                config = entry_data["config"]
-                dog = entry_data["dog_name"]
-                
-                await _send_notification(
-                    hass, config,
-                    f"🧪 Test - {dog.title()}", 
-                    "Test-Benachrichtigung funktioniert! 🐶"
-                )
-                
-        except Exception as e:
-            _LOGGER.error("Error in test notification service: %s", e)
-            raise ServiceValidationError(f"Test notification failed: {e}")
+    async def log_batch(targets: List[Dict[str, Any]], data: Dict[str, Any]) -> ServiceResponse:
+        """Handle log batch service call - records of any dogs, helper updates grouped by domain."""
+        return await async_log_batch(hass, data["records"], {dog_data["dog_name"] for dog_data in targets})
     
-    async def emergency_contact(call: ServiceCall) -> None:
-        """Handle emergency contact service call."""
-        try:
-            emergency_type = call.data["emergency_type"]
-            message = call.data["message"]
-            location = call.data.get("location", "")
-            contact_vet = call.data.get("contact_vet", False)
-            dog_name = call.data["dog_name"]
-            
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                dog = entry_data["dog_name"]
-                config = entry_data["config"]
-                
-                # Set emergency mode
-                emergency_entity = f"input_boolean.{dog}_emergency_mode"
-                if hass.states.get(emergency_entity):
-                    await hass.services.async_call(
-                        "input_boolean", "turn_on",
-                        {"entity_id": emergency_entity},
-                        blocking=True
-                    )
-                
-                # Send high priority notification
-                emergency_message = f"🚨 NOTFALL - {dog.title()}\n\n"
-                emergency_message += f"Art: {emergency_type}\n"
-                emergency_message += f"Beschreibung: {message}\n"
-                if location:
-                    emergency_message += f"Standort: {location}\n"
-                
-                await _send_notification(
-                    hass, config,
-                    f"🚨 NOTFALL - {dog.title()}",
-                    emergency_message,
-                    data={"priority": "high", "ttl": 0}
-                )
-                
-                _LOGGER.warning("Emergency activated for %s: %s", dog, emergency_type)
-                
-        except Exception as e:
-            _LOGGER.error("Error in emergency contact service: %s", e)
-            raise ServiceValidationError(f"Emergency contact failed: {e}")
+    async def query_journal(dog_data: Dict[str, Any], data: Dict[str, Any]) -> ServiceResponse:
+        """Handle query journal service call for one dog - newest entries first."""
+        journal = dog_data.get("journal")
+        if journal is None:
+            return {"entries": [], "total": 0}
+        return {
+            "entries": journal.query(data.get("start"), data.get("end"), data.get("category"), data["limit"]),
+            "total": len(journal),
+        }
     
-    async def health_check(call: ServiceCall) -> None:
-        """Handle health check service call."""
-        try:
-            check_type = call.data.get("check_type", "general")
-            notes = call.data.get("notes", "")
-            temperature = call.data.get("temperature")
-            weight = call.data.get("weight")
-            dog_name = call.data["dog_name"]
-            
-            target_entries = await _get_target_entries(hass, dog_name)
-            
-            for entry_data in target_entries:
-                dog = entry_data["dog_name"]
-                
-                await _perform_health_check(hass, dog, check_type, notes, temperature, weight)
-                _LOGGER.info("Health check completed for %s", dog)
-                
-        except Exception as e:
-            _LOGGER.error("Error in health check service: %s", e)
-            raise ServiceValidationError(f"Health check failed: {e}")
+    async def test_notification(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle test notification service call for one dog."""
+        await _send_notification(
+            hass, dog_data["config"],
+            f"🧪 Test - {dog_data['dog_name'].title()}", 
+            "Test-Benachrichtigung funktioniert! 🐶"
+        )
     
-    # Register all services
+    async def emergency_contact(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle emergency contact service call for one dog."""
+        emergency_type = data["emergency_type"]
+        location = data.get("location", "")
+        dog = dog_data["dog_name"]
+        
+        # Set emergency mode
+        emergency_entity = dog_entity_ids(dog).get("input_boolean", "emergency_mode")
+        if hass.states.get(emergency_entity):
+            await hass.services.async_call(
+                "input_boolean", "turn_on",
+                {"entity_id": emergency_entity},
+                blocking=True
+            )
+        
+        # Send high priority notification
+        emergency_message = f"🚨 NOTFALL - {dog.title()}\n\n"
+        emergency_message += f"Art: {emergency_type}\n"
+        emergency_message += f"Beschreibung: {data['message']}\n"
+        if location:
+            emergency_message += f"Standort: {location}\n"
+        
+        await _send_notification(
+            hass, dog_data["config"],
+            f"🚨 NOTFALL - {dog.title()}",
+            emergency_message,
+            data={"priority": "high", "ttl": 0},
+            immediate=True
+        )
+        
+        _LOGGER.warning("Emergency activated for %s: %s", dog, emergency_type)
+    
+    async def health_check(dog_data: Dict[str, Any], data: Dict[str, Any]) -> None:
+        """Handle health check service call for one dog."""
+        dog = dog_data["dog_name"]
+        await _perform_health_check(
+            hass, dog, data.get("check_type", "general"), data.get("notes", ""),
+            data.get("temperature"), data.get("weight"),
+        )
+        _LOGGER.info("Health check completed for %s", dog)
+    
+    # Register all services; the dispatcher validates, resolves dog_name and runs the dogs concurrently
     services = [
         (SERVICE_TRIGGER_FEEDING_REMINDER, trigger_feeding_reminder, TRIGGER_FEEDING_REMINDER_SCHEMA),
-        (SERVICE_DAILY_RESET, daily_reset, None),
         (SERVICE_SEND_NOTIFICATION, send_notification, SEND_NOTIFICATION_SCHEMA),
         (SERVICE_SET_VISITOR_MODE, set_visitor_mode, SET_VISITOR_MODE_SCHEMA),
         (SERVICE_LOG_ACTIVITY, log_activity, LOG_ACTIVITY_SCHEMA),
@@ -532,102 +642,80 @@ async def _register_services(hass: HomeAssistant) -> None:
     
     for service_name, service_func, schema in services:
         try:
-            hass.services.async_register(
-                DOMAIN, service_name, service_func, schema
-            )
-            _LOGGER.debug("Registered service: %s", service_name)
+            dispatcher.async_register(service_name, schema, service_func)
         except Exception as e:
             _LOGGER.error("Failed to register service %s: %s", service_name, e)
     
+    try:
+        dispatcher.async_register(SERVICE_DAILY_RESET, DAILY_RESET_SCHEMA, daily_reset, batch=True)
+    except Exception as e:
+        _LOGGER.error("Failed to register service %s: %s", SERVICE_DAILY_RESET, e)
+    
+    try:
+        dispatcher.async_register(
+            SERVICE_LOG_BATCH, LOG_BATCH_SCHEMA, log_batch,
+            batch=True, supports_response=SupportsResponse.OPTIONAL,
+        )
+    except Exception as e:
+        _LOGGER.error("Failed to register service %s: %s", SERVICE_LOG_BATCH, e)
+    
+    try:
+        dispatcher.async_register(
+            SERVICE_QUERY_JOURNAL, QUERY_JOURNAL_SCHEMA, query_journal,
+            supports_response=SupportsResponse.ONLY,
+        )
+    except Exception as e:
+        _LOGGER.error("Failed to register service %s: %s", SERVICE_QUERY_JOURNAL, e)
+    
+    # Schedule one daily reset at 23:59 covering all dogs
+    @callback
+    def daily_reset_trigger(now: datetime) -> None:
+        """Daily reset trigger."""
+        _async_daily_reset_callback(hass)
+    
+    global _DAILY_RESET_LISTENER
+    if _DAILY_RESET_LISTENER is None:
+        _DAILY_RESET_LISTENER = async_track_time_change(
+            hass, daily_reset_trigger,
+            hour=23, minute=59, second=0
+        )
+    
+    # Tapped notification actions log activities, deduplicated like button presses
+    global _NOTIFICATION_ACTION_LISTENER
+    if _NOTIFICATION_ACTION_LISTENER is None:
+        _NOTIFICATION_ACTION_LISTENER = async_setup_notification_actions(hass)
+    
     _LOGGER.info("All Hundesystem services registered successfully")
 
 
 async def _unregister_services(hass: HomeAssistant) -> None:
     """Unregister all services."""
-    services = [
-        SERVICE_TRIGGER_FEEDING_REMINDER,
-        SERVICE_DAILY_RESET,
-        SERVICE_SEND_NOTIFICATION,
-        SERVICE_SET_VISITOR_MODE,
-        SERVICE_LOG_ACTIVITY,
-        SERVICE_TEST_NOTIFICATION,
-        SERVICE_EMERGENCY_CONTACT,
-        SERVICE_HEALTH_CHECK,
-    ]
-    
-    for service_name in services:
-        if hass.services.has_service(DOMAIN, service_name):
-            hass.services.async_remove(DOMAIN, service_name)
-            _LOGGER.debug("Unregistered service: %s", service_name)
-
-
-async def _get_target_entries(hass: HomeAssistant, dog_name: Optional[str]) -> List[Dict[str, Any]]:
-    """Get target entries based on dog name."""
-    if dog_name:
-        # Find specific dog
-        for entry_data in hass.data[DOMAIN].values():
-            if isinstance(entry_data, dict) and entry_data.get("dog_name") == dog_name:
-                return [entry_data]
-        raise ServiceValidationError(f"Dog '{dog_name}' not found")
-    else:
-        # All dogs
-        return [data for data in hass.data[DOMAIN].values() if isinstance(data, dict)]
-
-
-async def _perform_daily_reset(hass: HomeAssistant, dog_name: str) -> None:
-    """Perform daily reset for a specific dog."""
-    
-    # Reset all feeding input_booleans
-    for meal in FEEDING_TYPES:
-        entity_id = f"input_boolean.{dog_name}_feeding_{meal}"
-        if hass.states.get(entity_id):
-            await hass.services.async_call(
-                "input_boolean", "turn_off",
-                {"entity_id": entity_id},
-                blocking=True
-            )
+    global _DAILY_RESET_LISTENER
+    if _DAILY_RESET_LISTENER is not None:
+        _DAILY_RESET_LISTENER()
+        _DAILY_RESET_LISTENER = None
     
-    # Reset activity booleans
-    activity_entities = [
-        f"input_boolean.{dog_name}_outside",
-        f"input_boolean.{dog_name}_poop_done",
-        f"input_boolean.{dog_name}_visitor_mode_input"
-    ]
-    
-    for entity_id in activity_entities:
-        if hass.states.get(entity_id):
-            await hass.services.async_call(
-                "input_boolean", "turn_off",
-                {"entity_id": entity_id},
-                blocking=True
-            )
-    
-    # Reset counters
-    counter_types = FEEDING_TYPES + ["outside", "walk", "play", "training", "poop", "activity"]
-    for counter_type in counter_types:
-        entity_id = f"counter.{dog_name}_{counter_type}_count"
-        if hass.states.get(entity_id):
-            await hass.services.async_call(
-                "counter", "reset",
-                {"entity_id": entity_id},
-                blocking=True
-            )
+    global _NOTIFICATION_ACTION_LISTENER
+    if _NOTIFICATION_ACTION_LISTENER is not None:
+        _NOTIFICATION_ACTION_LISTENER()
+        _NOTIFICATION_ACTION_LISTENER = None
     
-    # Clear daily notes
-    notes_entity = f"input_text.{dog_name}_daily_notes"
-    if hass.states.get(notes_entity):
-        await hass.services.async_call(
-            "input_text", "set_value",
-            {"entity_id": notes_entity, "value": ""},
-            blocking=True
-        )
+    async_stop_service_dispatcher(hass)
 
 
 async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_type: str, duration: int, notes: str) -> None:
     """Log activity for a specific dog."""
     
+    # Append to the persistent event log
+    event_store = get_dog_event_store(hass, dog_name)
+    if event_store is not None:
+        event_store.async_append(activity_type, duration, notes)
+    
+    ids = dog_entity_ids(dog_name)
+    activity_ids = ids.activities[activity_type]
+    
     # Increment activity counter
-    counter_entity = f"counter.{dog_name}_{activity_type}_count"
+    counter_entity = activity_ids["count"]
     if hass.states.get(counter_entity):
         await hass.services.async_call(
             "counter", "increment",
@@ -636,7 +724,7 @@ async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_typ
         )
     
     # Increment general activity counter
-    general_counter = f"counter.{dog_name}_activity_count"
+    general_counter = ids.get("counter", "activity_count")
     if hass.states.get(general_counter):
         await hass.services.async_call(
             "counter", "increment",
@@ -645,7 +733,7 @@ async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_typ
         )
     
     # Update last activity datetime
-    datetime_entity = f"input_datetime.{dog_name}_last_activity"
+    datetime_entity = ids.get("input_datetime", "last_activity")
     if hass.states.get(datetime_entity):
         await hass.services.async_call(
             "input_datetime", "set_datetime",
@@ -657,7 +745,7 @@ async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_typ
         )
     
     # Update activity-specific datetime
-    specific_datetime_entity = f"input_datetime.{dog_name}_last_{activity_type}"
+    specific_datetime_entity = activity_ids["last_time"]
     if hass.states.get(specific_datetime_entity):
         await hass.services.async_call(
             "input_datetime", "set_datetime",
@@ -670,13 +758,17 @@ async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_typ
     
     # Update notes if provided
     if notes:
-        notes_entity = f"input_text.{dog_name}_last_activity_notes"
+        activity_note = f"{ACTIVITY_TYPES[activity_type]}"
+        if duration:
+            activity_note += f" ({duration} min)"
+        activity_note += f": {notes}"
+        
+        journal = get_dog_journal(hass, dog_name)
+        if journal is not None:
+            journal.async_append(activity_type, notes)
+        
+        notes_entity = ids.get("input_text", "last_activity_notes")
         if hass.states.get(notes_entity):
-            activity_note = f"{ACTIVITY_TYPES[activity_type]}"
-            if duration:
-                activity_note += f" ({duration} min)"
-            activity_note += f": {notes}"
-            
             await hass.services.async_call(
                 "input_text", "set_value",
                 {"entity_id": notes_entity, "value": activity_note},
@@ -686,10 +778,11 @@ async def _log_activity_for_dog(hass: HomeAssistant, dog_name: str, activity_typ
 
 async def _perform_health_check(hass: HomeAssistant, dog_name: str, check_type: str, notes: str, temperature: Optional[float], weight: Optional[float]) -> None:
     """Perform health check for a specific dog."""
+    ids = dog_entity_ids(dog_name)
     
     # Update temperature if provided
     if temperature is not None:
-        temp_entity = f"input_number.{dog_name}_temperature"
+        temp_entity = ids.get("input_number", "temperature")
         if hass.states.get(temp_entity):
             await hass.services.async_call(
                 "input_number", "set_value",
@@ -699,7 +792,7 @@ async def _perform_health_check(hass: HomeAssistant, dog_name: str, check_type:
     
     # Update weight if provided
     if weight is not None:
-        weight_entity = f"input_number.{dog_name}_weight"
+        weight_entity = ids.get("input_number", "weight")
         if hass.states.get(weight_entity):
             await hass.services.async_call(
                 "input_number", "set_value",
@@ -709,7 +802,11 @@ async def _perform_health_check(hass: HomeAssistant, dog_name: str, check_type:
     
     # Update health notes
     if notes:
-        health_notes_entity = f"input_text.{dog_name}_health_notes"
+        journal = get_dog_journal(hass, dog_name)
+        if journal is not None:
+            journal.async_append("health_check", f"{check_type}: {notes}")
+        
+        health_notes_entity = ids.get("input_text", "health_notes")
         if hass.states.get(health_notes_entity):
             timestamp = datetime.now().strftime("%d.%m. %H:%M")
             health_note = f"[{timestamp}] {check_type}: {notes}"
@@ -721,34 +818,37 @@ async def _perform_health_check(hass: HomeAssistant, dog_name: str, check_type:
             )
 
 
+def _feeding_reminder_data(dog_name: str, meal_type: str) -> Dict[str, Any]:
+    """Return the notification data of a feeding reminder with a quick-log action."""
+    return {
+        "actions": [activity_action(dog_name, f"feeding_{meal_type}", "✅ Gefüttert")],
+        "tag": f"{dog_name}_feeding_{meal_type}",
+        "group": f"hundesystem_{dog_name}",
+    }
+
+
 async def _send_notification(
     hass: HomeAssistant, 
     config: dict, 
     title: str, 
     message: str, 
     target: Optional[str] = None,
-    data: Optional[dict] = None
+    data: Optional[dict] = None,
+    immediate: bool = False
 ) -> None:
-    """Send notification via configured services with improved error handling."""
+    """Queue a notification for the configured services (deduplicated and rate limited)."""
     
     try:
         push_devices = config.get(CONF_PUSH_DEVICES, [])
         person_tracking = config.get(CONF_PERSON_TRACKING, False)
         
-        # Determine notification targets
+        router = async_get_notification_router(hass)
+        
+        # Determine notification targets (present persons come from the router index)
         notification_targets = []
         
         if person_tracking and not target:
-            # Get home persons
-            for entity_id in hass.states.async_entity_ids("person"):
-                state = hass.states.get(entity_id)
-                if state and state.state == "home":
-                    person_name = entity_id.replace("person.", "")
-                    mobile_app = f"mobile_app_{person_name}"
-                    
-                    # Check if this mobile app service exists
-                    if hass.services.has_service("notify", mobile_app):
-                        notification_targets.append(mobile_app)
+            notification_targets = router.home_targets()
         
         # Fallback to configured devices
         if not notification_targets:
@@ -758,27 +858,14 @@ async def _send_notification(
         if not notification_targets:
             notification_targets = ["persistent_notification"]
         
-        # Prepare notification data
-        notification_data = {"title": title, "message": message}
-        if data:
-            notification_data["data"] = data
-        
-        # Send notifications
-        for device in notification_targets:
-            try:
-                service_name = device.replace("notify.", "") if device.startswith("notify.") else device
-                
-                await hass.services.async_call(
-                    "notify", service_name,
-                    notification_data,
-                    blocking=False
-                )
-                
-                _LOGGER.debug("Notification sent to %s: %s", service_name, title)
-                
-            except Exception as e:
-                _LOGGER.warning("Failed to send notification to %s: %s", device, e)
-                continue
+        # Queue per recipient; the queue coalesces, deduplicates and rate limits
+        async_get_notification_queue(hass).async_enqueue(
+            notification_targets, title, message, data,
+            dog_name=config.get(CONF_DOG_NAME, ""),
+            window=config.get(CONF_NOTIFICATION_WINDOW, DEFAULT_NOTIFICATION_WINDOW),
+            immediate=immediate,
+        )
+        _LOGGER.debug("Notification queued for %d targets: %s", len(notification_targets), title)
         
     except Exception as e:
         _LOGGER.error("Error in notification system: %s", e)
@@ -797,61 +884,84 @@ async def _send_notification(
             _LOGGER.error("Even fallback notification failed: %s", fallback_error)
 
 
-async def _setup_automations(hass: HomeAssistant, entry: ConfigEntry, dog_name: str) -> None:
-    """Setup automations and event listeners for a dog."""
+async def _setup_automations(hass: HomeAssistant, entry: ConfigEntry, dog_names: List[str]) -> None:
+    """Setup automations and event listeners for the dogs of an entry."""
     
     entry_data = hass.data[DOMAIN][entry.entry_id]
     listeners = entry_data["listeners"]
+    door_sensor_dogs: Dict[str, List[str]] = {}
     
-    try:
-        # Setup daily reset automation
-        def daily_reset_callback(now):
-            """Daily reset callback."""
-            hass.async_create_task(_async_daily_reset_callback(hass, dog_name))
-        
-        # Schedule daily reset at 23:59
-        remove_listener = async_track_time_change(
-            hass, daily_reset_callback,
-            hour=23, minute=59, second=0
-        )
-        listeners.append(remove_listener)
-        
-        # Setup door sensor automation if configured
-        door_sensor = entry.data.get(CONF_DOOR_SENSOR)
-        if door_sensor:
-            def door_sensor_callback(event):
+    for dog_name in dog_names:
+        try:
+            dog_data = get_dog_data(hass, entry, dog_name)
+            dog_config = dog_data["config"]
+            
+            # The 23:59 daily reset is scheduled once for all dogs in _register_services
+            
+            # Setup feeding reminders (one timer per meal at its next reminder time)
+            async def send_feeding_reminder(
+                meal_type: str, scheduled_time: str, dog_name: str = dog_name, dog_config=dog_config
+            ) -> None:
+                """Send a scheduled feeding reminder."""
+                await _send_notification(
+                    hass, dog_config,
+                    f"🍽️ Fütterungszeit - {dog_name.title()}",
+                    f"Erinnerung: {MEAL_TYPES[meal_type]} ist für {scheduled_time[:5]} geplant",
+                    data=_feeding_reminder_data(dog_name, meal_type),
+                )
+            
+            reminder_scheduler = FeedingReminderScheduler(
+                hass, async_get_snapshot(hass, entry, dog_name), send_feeding_reminder
+            )
+            reminder_scheduler.async_start()
+            dog_data["reminder_scheduler"] = reminder_scheduler
+            listeners.append(reminder_scheduler.async_stop)
+            
+            # Dogs sharing a door sensor share one listener
+            door_sensor = dog_config.get(CONF_DOOR_SENSOR)
+            if door_sensor:
+                door_sensor_dogs.setdefault(door_sensor, []).append(dog_name)
+            
+            _LOGGER.info("Automations set up successfully for %s", dog_name)
+            
+        except Exception as e:
+            _LOGGER.error("Failed to setup automations for %s: %s", dog_name, e)
+    
+    # Setup door sensor automations if configured
+    for door_sensor, sensor_dogs in door_sensor_dogs.items():
+        try:
+            def door_sensor_callback(event, sensor_dogs=sensor_dogs):
                 """Handle door sensor state changes."""
-                hass.async_create_task(_async_door_sensor_callback(hass, dog_name, event))
+                for dog_name in sensor_dogs:
+                    _async_door_sensor_callback(hass, dog_name, event)
             
             remove_listener = async_track_state_change_event(
                 hass, [door_sensor], door_sensor_callback
             )
             listeners.append(remove_listener)
             
-            _LOGGER.info("Door sensor automation set up for %s with sensor %s", dog_name, door_sensor)
-        
-        _LOGGER.info("Automations set up successfully for %s", dog_name)
-        
-    except Exception as e:
-        _LOGGER.error("Failed to setup automations for %s: %s", dog_name, e)
+            _LOGGER.info("Door sensor automation set up for %s with sensor %s", ", ".join(sensor_dogs), door_sensor)
+            
+        except Exception as e:
+            _LOGGER.error("Failed to setup door sensor %s: %s", door_sensor, e)
 
 
 @callback
-def _async_daily_reset_callback(hass: HomeAssistant, dog_name: str):
+def _async_daily_reset_callback(hass: HomeAssistant):
     """Async daily reset callback - CORRECTED: @callback without async def."""
-    hass.async_create_task(_perform_daily_reset_task(hass, dog_name))
+    hass.async_create_task(_perform_daily_reset_task(hass))
 
 
-async def _perform_daily_reset_task(hass: HomeAssistant, dog_name: str) -> None:
-    """Perform daily reset task."""
+async def _perform_daily_reset_task(hass: HomeAssistant) -> None:
+    """Perform the scheduled daily reset for all dogs at once."""
     try:
         await hass.services.async_call(
             DOMAIN, SERVICE_DAILY_RESET,
-            {"dog_name": dog_name},
+            {},
             blocking=True
         )
     except Exception as err:
-        _LOGGER.error("Daily reset failed for %s: %s", dog_name, err)
+        _LOGGER.error("Scheduled daily reset failed: %s", err)
 
 
 @callback 
@@ -874,7 +984,7 @@ async def _handle_door_sensor_event(hass: HomeAssistant, dog_name: str, event) -
             await asyncio.sleep(2)  # Wait a moment
             
             # Check if we should ask (avoid spam)
-            last_ask_entity = f"input_datetime.{dog_name}_last_door_ask"
+            last_ask_entity = dog_entity_ids(dog_name).get("input_datetime", "last_door_ask")
             last_ask_state = hass.states.get(last_ask_entity)
             
             should_ask = True
@@ -898,17 +1008,14 @@ async def _handle_door_sensor_event(hass: HomeAssistant, dog_name: str, event) -
                     )
                 
                 # Find config for this dog
-                config = None
-                for entry_data in hass.data[DOMAIN].values():
-                    if isinstance(entry_data, dict) and entry_data.get("dog_name") == dog_name:
-                        config = entry_data["config"]
-                        break
+                dog_data = find_dog_data(hass, dog_name)
+                config = dog_data["config"] if dog_data else None
                 
                 if config:
                     # Send interactive notification
                     notification_data = {
                         "actions": [
-                            {"action": f"dog_outside_yes_{dog_name}", "title": "✅ Ja"},
+                            activity_action(dog_name, "outside", "✅ Ja"),
                             {"action": f"dog_outside_no_{dog_name}", "title": "❌ Nein"}
                         ],
                         "tag": f"{dog_name}_door_question",
@@ -928,47 +1035,50 @@ async def _handle_door_sensor_event(hass: HomeAssistant, dog_name: str, event) -
         _LOGGER.error("Error handling door sensor event for %s: %s", dog_name, e)
 
 
-async def _final_verification(hass: HomeAssistant, dog_name: str) -> None:
+async def _final_verification(hass: HomeAssistant, dog_names: List[str]) -> None:
     """Perform final verification of setup."""
     
-    # Check some key entities
-    key_entities = [
-        f"input_boolean.{dog_name}_feeding_morning",
-        f"input_boolean.{dog_name}_outside",
-        f"counter.{dog_name}_outside_count",
-        f"sensor.{dog_name}_status",
-        f"binary_sensor.{dog_name}_feeding_complete",
-    ]
-    
-    existing_entities = []
-    missing_entities = []
-    
-    for entity_id in key_entities:
-        if hass.states.get(entity_id):
-            existing_entities.append(entity_id)
-        else:
-            missing_entities.append(entity_id)
+    # Check some key entities of every dog
+    key_entities = {
+        dog_name: [dog_entity_ids(dog_name).get(domain, suffix) for domain, suffix in KEY_ENTITIES]
+        for dog_name in dog_names
+    }
     
-    success_rate = len(existing_entities) / len(key_entities) * 100
+    # Platform entities may still be adding; wait on their first state event (one wait for all dogs)
+    missing_entities = set(await async_wait_for_entities(
+        hass, [entity_id for entities in key_entities.values() for entity_id in entities], 5.0
+    ))
     
-    _LOGGER.info("Final verification for %s: %.1f%% entities exist (%d/%d)", 
-                 dog_name, success_rate, len(existing_entities), len(key_entities))
+    total = 0
+    existing = 0
+    for dog_name, entities in key_entities.items():
+        missing = [entity_id for entity_id in entities if entity_id in missing_entities]
+        total += len(entities)
+        existing += len(entities) - len(missing)
+        
+        _LOGGER.info("Final verification for %s: %.1f%% entities exist (%d/%d)", 
+                     dog_name, (len(entities) - len(missing)) / len(entities) * 100,
+                     len(entities) - len(missing), len(entities))
+        
+        if missing:
+            _LOGGER.warning("Missing entities for %s: %s", dog_name, missing)
     
-    if missing_entities:
-        _LOGGER.warning("Missing entities for %s: %s", dog_name, missing_entities)
+    success_rate = existing / total * 100 if total else 0.0
     
-    # Send setup notification
+    # Send one setup notification per entry
     status = "✅ Erfolgreich" if success_rate >= 80 else "⚠️ Teilweise"
+    title_names = ", ".join(dog_name.title() for dog_name in dog_names)
     
     try:
         await hass.services.async_call(
             "persistent_notification", "create",
             {
-                "title": f"🐶 Hundesystem für {dog_name.title()}",
+                "title": f"🐶 Hundesystem für {title_names}",
                 "message": f"""
 Setup {status} abgeschlossen!
 
-**Erstellte Entitäten:** {len(existing_entities)}/{len(key_entities)}
+**Hunde:** {len(dog_names)}
+**Erstellte Entitäten:** {existing}/{total}
 
 **Verfügbare Services:**
 - hundesystem.trigger_feeding_reminder
@@ -982,7 +1092,7 @@ Gehen Sie zu Einstellungen > Geräte & Dienste > Hundesystem um alle Entitäten
 
 **Erfolgsrate:** {success_rate:.1f}%
                 """,
-                "notification_id": f"hundesystem_setup_{dog_name}"
+                "notification_id": f"hundesystem_setup_{'_'.join(dog_names)}"
             },
             blocking=False
         )
@@ -1011,35 +1121,7 @@ async def _cleanup_partial_setup(hass: HomeAssistant, entry: ConfigEntry) -> Non
         except Exception:
             pass
         
-        _LOGGER.info("Cleaned up partial setup for %s", entry.data.get(CONF_DOG_NAME, "unknown"))
+        _LOGGER.info("Cleaned up partial setup for %s", ", ".join(entry_dog_names(entry)))
         
     except Exception as e:
-        _LOGGER.error("Error during cleanup: %s", e)"""The Hundesystem integration - CORRECTED VERSION."""
-from __future__ import annotations
-
-import asyncio
-import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-
-import voluptuous as vol
-
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall, callback
-from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-from homeassistant.helpers.storage import Store
-from homeassistant.helpers.event import async_track_time_change, async_track_state_change_event
-from homeassistant.exceptions import ServiceValidationError
-
-from .const import (
-    DOMAIN,
-    CONF_DOG_NAME,
-    CONF_PUSH_DEVICES,
-    CONF_PERSON_TRACKING,
-    CONF_CREATE_DASHBOARD,
-    CONF_DOOR_SENSOR,
-    SERVICE_TRIGGER_FEEDING_REMINDER,
-    SERVICE_DAILY_RESET,
-    SERVICE_SEND_NOTIFICATION
+        _LOGGER.error("Error during cleanup: %s", e)
@@ -0,0 +1,219 @@
+"""Bulk logging of many activity and feeding records across dogs."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import ACTIVITY_TYPES, FEEDING_TYPES, MEAL_TYPES
+from .entity_ids import dog_entity_ids
+from .event_store import get_dog_event_store
+from .journal import get_dog_journal
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_BATCH_RECORDS = 500
+
+# Activities a record may log; feedings are logged as feeding_<meal>
+BATCH_ACTIVITIES = [*ACTIVITY_TYPES, *(f"feeding_{meal}" for meal in FEEDING_TYPES)]
+
+BATCH_RECORD_SCHEMA = vol.Schema({
+    vol.Required("dog_name"): cv.string,
+    vol.Required("activity"): vol.In(BATCH_ACTIVITIES),
+    vol.Optional("timestamp"): cv.datetime,
+    vol.Optional("duration", default=0): vol.All(vol.Coerce(int), vol.Range(min=0, max=480)),
+    vol.Optional("notes", default=""): cv.string,
+})
+
+
+def validate_records(
+    records: Iterable[Any], dog_names: Set[str], now: datetime
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Validate all records in one pass.
+
+    Returns the valid records (with index and a naive local timestamp) and
+    one result per record; invalid records already carry their error.
+    """
+    valid = []
+    results = []
+    for index, raw in enumerate(records):
+        result: Dict[str, Any] = {"index": index, "status": "logged"}
+        results.append(result)
+        try:
+            record = BATCH_RECORD_SCHEMA(raw)
+        except vol.Invalid as e:
+            result.update(status="invalid", error=str(e))
+            continue
+
+        result.update(dog_name=record["dog_name"], activity=record["activity"])
+        if record["dog_name"] not in dog_names:
+            result.update(status="invalid", error=f"Dog '{record['dog_name']}' not found")
+            continue
+
+        timestamp = record.get("timestamp") or now
+        if timestamp.tzinfo is not None:
+            timestamp = dt_util.as_local(timestamp).replace(tzinfo=None)
+        result["timestamp"] = timestamp.isoformat()
+
+        valid.append({**record, "index": index, "timestamp": timestamp})
+    return valid, results
+
+
+def _record_entities(record: Dict[str, Any]) -> Tuple[List[str], List[str], List[str]]:
+    """Return the (turn on, increment, set to timestamp) entities of one record."""
+    ids = dog_entity_ids(record["dog_name"])
+    activity = record["activity"]
+    last_activity = ids.get("input_datetime", "last_activity")
+
+    if activity.startswith("feeding_"):
+        meal = ids.meals[activity[len("feeding_"):]]
+        return [meal["fed"]], [meal["count"]], [meal["last_time"], last_activity]
+
+    activity_ids = ids.activities[activity]
+    return (
+        [],
+        [activity_ids["count"], ids.get("counter", "activity_count")],
+        [activity_ids["last_time"], last_activity],
+    )
+
+
+def _journal_entry(record: Dict[str, Any]) -> Tuple[str, str]:
+    """Return the journal category and text of a record with notes."""
+    activity = record["activity"]
+    if activity.startswith("feeding_"):
+        return "feeding", f"{MEAL_TYPES[activity[len('feeding_'):]]}: {record['notes']}"
+    return activity, record["notes"]
+
+
+def _current_datetime(hass: HomeAssistant, entity_id: str) -> Optional[datetime]:
+    """Return the datetime an input_datetime currently holds."""
+    state = hass.states.get(entity_id)
+    try:
+        return datetime.fromisoformat(state.state)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def build_log_batch_calls(
+    hass: HomeAssistant, records: List[Dict[str, Any]]
+) -> List[Tuple[str, str, Dict[str, Any], Set[int]]]:
+    """Group the helper updates of all records into as few service calls as possible.
+
+    input_boolean.turn_on is one call. counter.increment is one call per
+    round, where round n covers the counters incremented more than n times.
+    input_datetime.set_datetime is one call per distinct timestamp; each
+    entity gets the latest timestamp of the batch, unless it already holds a
+    later one. Each call carries the indices of the records it serves.
+    """
+    turn_on: Dict[str, Set[int]] = {}
+    increments: Dict[str, List[int]] = {}
+    latest: Dict[str, Tuple[datetime, Set[int]]] = {}
+
+    for record in records:
+        index = record["index"]
+        on_entities, counter_entities, datetime_entities = _record_entities(record)
+        for entity_id in on_entities:
+            turn_on.setdefault(entity_id, set()).add(index)
+        for entity_id in counter_entities:
+            increments.setdefault(entity_id, []).append(index)
+        for entity_id in datetime_entities:
+            timestamp, indices = latest.get(entity_id, (record["timestamp"], set()))
+            indices.add(index)
+            latest[entity_id] = (max(timestamp, record["timestamp"]), indices)
+
+    def _exists(entity_id: str) -> bool:
+        return hass.states.get(entity_id) is not None
+
+    calls = []
+
+    on_entities = [entity_id for entity_id in turn_on if _exists(entity_id)]
+    if on_entities:
+        calls.append((
+            "input_boolean", "turn_on", {"entity_id": on_entities},
+            {index for entity_id in on_entities for index in turn_on[entity_id]},
+        ))
+
+    counters = {entity_id: indices for entity_id, indices in increments.items() if _exists(entity_id)}
+    for round_index in range(max((len(indices) for indices in counters.values()), default=0)):
+        entity_ids = [entity_id for entity_id, indices in counters.items() if len(indices) > round_index]
+        calls.append((
+            "counter", "increment", {"entity_id": entity_ids},
+            {counters[entity_id][round_index] for entity_id in entity_ids},
+        ))
+
+    by_timestamp: Dict[datetime, List[str]] = {}
+    for entity_id, (timestamp, _indices) in latest.items():
+        if not _exists(entity_id):
+            continue
+        current = _current_datetime(hass, entity_id)
+        if current is not None and current >= timestamp:
+            continue
+        by_timestamp.setdefault(timestamp, []).append(entity_id)
+    for timestamp, entity_ids in by_timestamp.items():
+        calls.append((
+            "input_datetime", "set_datetime",
+            {"entity_id": entity_ids, "datetime": timestamp.isoformat()},
+            {index for entity_id in entity_ids for index in latest[entity_id][1]},
+        ))
+
+    return calls
+
+
+async def async_log_batch(
+    hass: HomeAssistant, records: Iterable[Any], dog_names: Set[str]
+) -> Dict[str, Any]:
+    """Log many records of the given dogs with one concurrent batch of service calls.
+
+    Returns the per-record results in request order.
+    """
+    now = datetime.now()
+    valid, results = validate_records(records, dog_names, now)
+
+    calls = build_log_batch_calls(hass, valid)
+    call_results = await asyncio.gather(
+        *[
+            hass.services.async_call(domain, service, service_data, blocking=True)
+            for domain, service, service_data, _indices in calls
+        ],
+        return_exceptions=True,
+    )
+
+    for (domain, service, _service_data, indices), result in zip(calls, call_results):
+        if not isinstance(result, Exception):
+            continue
+        _LOGGER.error("Batch %s.%s failed: %s", domain, service, result)
+        for index in indices:
+            results[index].update(status="failed", error=f"{domain}.{service}: {result}")
+
+    # Only records whose helper updates succeeded enter the persistent event log and journal
+    for record in valid:
+        if results[record["index"]]["status"] != "logged":
+            continue
+        event_store = get_dog_event_store(hass, record["dog_name"])
+        if event_store is not None:
+            event_store.async_append(
+                record["activity"], record["duration"], record["notes"], record["timestamp"]
+            )
+        if record["notes"]:
+            journal = get_dog_journal(hass, record["dog_name"])
+            if journal is not None:
+                journal.async_append(*_journal_entry(record), record["timestamp"])
+
+    logged = sum(1 for result in results if result["status"] == "logged")
+    _LOGGER.info(
+        "📋 Batch logged %d of %d records in %d service calls",
+        logged, len(results), len(calls),
+    )
+    return {
+        "logged": logged,
+        "failed": len(results) - logged,
+        "service_calls": len(calls),
+        "results": results,
+    }
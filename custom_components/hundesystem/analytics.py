@@ -0,0 +1,424 @@
+"""Trend and anomaly analytics over a dog's recorded helper history."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import zlib
+from datetime import date, datetime, timedelta
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, FEEDING_TYPES
+from .coordinator import TRACKED_ACTIVITIES
+from .entity_ids import dog_entity_ids
+from .household import find_dog_data, get_dog_data
+
+_LOGGER = logging.getLogger(__name__)
+
+ANALYTICS_DAYS = 90                              # Days of history analysed
+ANALYTICS_REFRESH_INTERVAL = timedelta(hours=1)  # Interval between recorder queries
+MOVING_AVERAGE_DAYS = 7                          # Window of the moving average
+ANOMALY_Z_SCORE = 2.5                            # |z| from which a day is an anomaly
+ANOMALIES_REPORTED = 5                           # Most recent anomalies reported per series
+
+HOURS = 24
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+KIND_COUNTER = "counter"  # Daily reset counter; increments are binned
+KIND_GAUGE = "gauge"      # Measured value; the last value of each day is kept
+
+SERIES_ACTIVITY_TOTAL = "activity_total"
+
+# Serializes the recorder queries of all dogs
+DATA_ANALYTICS_LOCK = f"{DOMAIN}_analytics_lock"
+
+
+def analytics_series(dog_name: str) -> Dict[str, Tuple[str, List[str]]]:
+    """Return series name -> (kind, entity IDs summed into the series) of a dog."""
+    ids = dog_entity_ids(dog_name)
+    series = {
+        activity: (KIND_COUNTER, [ids.activities[activity]["count"]])
+        for activity in TRACKED_ACTIVITIES
+    }
+    series["feeding"] = (KIND_COUNTER, [ids.meals[meal]["count"] for meal in FEEDING_TYPES])
+    series["weight"] = (KIND_GAUGE, [ids.get("input_number", "weight")])
+    return series
+
+
+def _points(rows: Sequence[Dict[str, Any]]) -> Tuple[List[float], List[float]]:
+    """Return the timestamps and numeric values of compressed recorder rows."""
+    times = []
+    values = []
+    for row in rows:
+        try:
+            value = float(row[COMPRESSED_STATE_STATE])
+            timestamp = float(row[COMPRESSED_STATE_LAST_UPDATED])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if math.isfinite(value):
+            times.append(timestamp)
+            values.append(value)
+    return times, values
+
+
+def hourly_increments(times: List[float], values: List[float], start: float, bins: int) -> List[float]:
+    """Sum the increments of a daily reset counter into fixed hourly bins from start.
+
+    A drop of the value is a reset; the new value then counts as increments.
+    """
+    timestamps = np.asarray(times, dtype=float)
+    counts = np.asarray(values, dtype=float)
+    deltas = np.diff(counts, prepend=counts[:1])
+    deltas = np.where(deltas < 0, counts, deltas)
+    index = np.floor((timestamps - start) / SECONDS_PER_HOUR).astype(int)
+    keep = (index >= 0) & (index < bins)
+    return np.bincount(index[keep], weights=deltas[keep], minlength=bins).tolist()
+
+
+def daily_last_values(times: List[float], values: List[float], start: float, days: int) -> List[float]:
+    """Return the last value of each day from start, carried over days without changes.
+
+    Days before the first value are NaN.
+    """
+    index = np.clip(
+        np.floor((np.asarray(times, dtype=float) - start) / SECONDS_PER_DAY).astype(int), 0, days - 1
+    )
+    counts = np.asarray(values, dtype=float)
+    last_of_day = np.append(index[1:] != index[:-1], True)
+    daily = np.full(days, np.nan)
+    daily[index[last_of_day]] = counts[last_of_day]
+    filled = np.where(np.isnan(daily), 0, np.arange(days))
+    return daily[np.maximum.accumulate(filled)].tolist()
+
+
+def _add(first: Sequence[float], second: Sequence[float]) -> List[float]:
+    """Return the element-wise sum of two bin arrays."""
+    return np.add(first, second).tolist()
+
+
+def _daily_sums(hourly: Sequence[float], days: int, hours: int = HOURS) -> List[float]:
+    """Return the sum of the first hours bins of every day."""
+    return np.asarray(hourly).reshape(days, HOURS)[:, :hours].sum(axis=1).tolist()
+
+
+def _hourly_profile(hourly: Sequence[float], days: int, first_day: int, last_day: int) -> List[float]:
+    """Return the mean of each hour of the day over days [first_day, last_day)."""
+    if last_day <= first_day:
+        return []
+    return np.asarray(hourly).reshape(days, HOURS)[first_day:last_day].mean(axis=0).tolist()
+
+
+def _mean_variance(values: List[float]) -> Tuple[Optional[float], Optional[float]]:
+    """Return the mean and population variance of values."""
+    if not values:
+        return None, None
+    array = np.asarray(values, dtype=float)
+    return float(array.mean()), float(array.var())
+
+
+def _z_scores(values: List[float], mean: float, variance: float) -> List[float]:
+    """Return the z-score of every value; all zero if the values do not vary."""
+    std = math.sqrt(variance)
+    if std == 0:
+        return [0.0] * len(values)
+    return ((np.asarray(values, dtype=float) - mean) / std).tolist()
+
+
+def _moving_average(values: List[float], window: int) -> List[float]:
+    """Return the trailing moving averages of values over window days."""
+    if len(values) < window:
+        return []
+    cumulative = np.cumsum(np.insert(np.asarray(values, dtype=float), 0, 0.0))
+    return ((cumulative[window:] - cumulative[:-window]) / window).tolist()
+
+
+def _slope(values: List[float]) -> Optional[float]:
+    """Return the least squares slope of values per day."""
+    if len(values) < 2:
+        return None
+    y = np.asarray(values, dtype=float)
+    x = np.arange(len(y), dtype=float)
+    x -= x.mean()
+    return float(x @ (y - y.mean()) / (x @ x))
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    """Round a statistic for the state attributes."""
+    return None if value is None else round(value, 3)
+
+
+def summarize_days(values: List[float], first_date: date) -> Dict[str, Any]:
+    """Return mean, variance, moving average, slope and anomalies of complete days."""
+    mean, variance = _mean_variance(values)
+    summary: Dict[str, Any] = {
+        "days": len(values),
+        "mean": _round(mean),
+        "variance": _round(variance),
+        "std": _round(math.sqrt(variance)) if variance is not None else None,
+        "moving_average": None,
+        "moving_average_change": None,
+        "slope": _round(_slope(values)),
+        "anomalies": [],
+    }
+    if mean is None:
+        return summary
+
+    averages = _moving_average(values, MOVING_AVERAGE_DAYS)
+    if averages:
+        summary["moving_average"] = _round(averages[-1])
+        if len(averages) > MOVING_AVERAGE_DAYS:
+            summary["moving_average_change"] = _round(averages[-1] - averages[-1 - MOVING_AVERAGE_DAYS])
+
+    anomalies = [
+        {"date": (first_date + timedelta(days=index)).isoformat(), "value": _round(value), "z_score": _round(z)}
+        for index, (value, z) in enumerate(zip(values, _z_scores(values, mean, variance)))
+        if abs(z) >= ANOMALY_Z_SCORE
+    ]
+    summary["anomalies"] = anomalies[-ANOMALIES_REPORTED:]
+    return summary
+
+
+def summarize_counter(
+    hourly: Sequence[float], days: int, first_day: int, today: int, hours_today: int, start_date: date
+) -> Dict[str, Any]:
+    """Summarize a counter series; today is compared with earlier days up to the same hour."""
+    daily = _daily_sums(hourly, days)
+    first_day = min(first_day, today)
+    summary = summarize_days(daily[first_day:today], start_date + timedelta(days=first_day))
+
+    until_now = _daily_sums(hourly, days, hours_today)[first_day:today]
+    mean, variance = _mean_variance(until_now)
+    summary["today"] = _round(daily[today])
+    summary["today_z_score"] = (
+        _round(_z_scores([daily[today]], mean, variance)[0]) if mean is not None else None
+    )
+    summary["hourly_profile"] = [_round(value) for value in _hourly_profile(hourly, days, first_day, today)]
+    return summary
+
+
+def summarize_gauge(daily: Sequence[float], today: int, start_date: date) -> Dict[str, Any]:
+    """Summarize a measured series from its daily last values."""
+    values = [float(value) for value in daily[:today + 1]]
+    first_day = next((index for index, value in enumerate(values) if not math.isnan(value)), len(values))
+    summary = summarize_days(values[first_day:today], start_date + timedelta(days=first_day))
+    summary["today"] = _round(values[today]) if first_day <= today else None
+    return summary
+
+
+def analyze_history(
+    rows: Dict[str, List[Dict[str, Any]]],
+    series: Dict[str, Tuple[str, List[str]]],
+    start: datetime,
+    now: datetime,
+    days: int = ANALYTICS_DAYS,
+) -> Dict[str, Dict[str, Any]]:
+    """Bin the recorded rows of every series and compute its statistics.
+
+    Bins are fixed spans of one hour and one day from start (local midnight
+    of the first day); the last day is today and still incomplete.
+    """
+    start_ts = start.timestamp()
+    elapsed = max(now.timestamp() - start_ts, 0.0)
+    today = min(int(elapsed // SECONDS_PER_DAY), days - 1)
+    hours_today = min(int(elapsed // SECONDS_PER_HOUR) - today * HOURS + 1, HOURS)
+    bins = days * HOURS
+
+    results: Dict[str, Dict[str, Any]] = {}
+    total: Optional[List[float]] = None
+    total_first_day = 0
+
+    for name, (kind, entity_ids) in series.items():
+        if kind == KIND_GAUGE:
+            times, values = _points(rows.get(entity_ids[0], []))
+            if times:
+                results[name] = summarize_gauge(
+                    daily_last_values(times, values, start_ts, days), today, start.date()
+                )
+            continue
+
+        hourly: Optional[List[float]] = None
+        first_day = today
+        for entity_id in entity_ids:
+            times, values = _points(rows.get(entity_id, []))
+            if not times:
+                continue
+            first_day = min(first_day, max(int((times[0] - start_ts) // SECONDS_PER_DAY), 0))
+            increments = hourly_increments(times, values, start_ts, bins)
+            hourly = increments if hourly is None else _add(hourly, increments)
+        if hourly is None:
+            continue
+
+        results[name] = summarize_counter(hourly, days, first_day, today, hours_today, start.date())
+        if name in TRACKED_ACTIVITIES:
+            total = hourly if total is None else _add(total, hourly)
+            # The total only covers days recorded for all its activities
+            total_first_day = max(total_first_day, first_day)
+
+    if total is not None:
+        results[SERIES_ACTIVITY_TOTAL] = summarize_counter(
+            total, days, total_first_day, today, hours_today, start.date()
+        )
+    return results
+
+
+def _fetch_and_analyze(
+    hass: HomeAssistant,
+    series: Dict[str, Tuple[str, List[str]]],
+    start: datetime,
+    now: datetime,
+) -> Dict[str, Dict[str, Any]]:
+    """Load the history of all series with one recorder query and analyze it (executor)."""
+    # Imported here so the recorder stack is only loaded when the recorder runs
+    from homeassistant.components.recorder import history
+
+    rows = history.get_significant_states(
+        hass,
+        start,
+        entity_ids=[entity_id for _kind, entity_ids in series.values() for entity_id in entity_ids],
+        include_start_time_state=True,
+        significant_changes_only=False,
+        minimal_response=True,
+        no_attributes=True,
+        compressed_state_format=True,
+    )
+    return analyze_history(rows, series, start, now)
+
+
+class DogAnalytics:
+    """Trend and anomaly statistics of one dog over the last ANALYTICS_DAYS days.
+
+    A refresh loads the history of all analysed helpers with one recorder
+    query, bins it into fixed hourly and daily bins and computes every
+    statistic on whole arrays. It runs in the recorder executor once an
+    hour, at a fixed per-dog offset within the hour, and the queries of all
+    dogs run one at a time; listeners are called with the new results.
+    """
+
+    def __init__(self, hass: HomeAssistant, dog_name: str) -> None:
+        """Initialize the analytics."""
+        self._hass = hass
+        self._dog_name = dog_name
+        self._series = analytics_series(dog_name)
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._refreshed: Optional[datetime] = None
+        self._listeners: List[Callable[[], None]] = []
+        self._unsub_refresh: Optional[Callable[[], None]] = None
+
+    @property
+    def results(self) -> Dict[str, Dict[str, Any]]:
+        """Return the statistics per series of the last refresh."""
+        return self._results
+
+    @property
+    def refreshed(self) -> Optional[datetime]:
+        """Return the time of the last refresh."""
+        return self._refreshed
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call update_callback after every refresh."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @property
+    def refresh_offset(self) -> timedelta:
+        """Return the stable offset of this dog's refreshes within the interval."""
+        interval = int(ANALYTICS_REFRESH_INTERVAL.total_seconds())
+        return timedelta(seconds=zlib.crc32(self._dog_name.encode("utf-8")) % interval)
+
+    @callback
+    def async_start(self) -> None:
+        """Refresh now and then every ANALYTICS_REFRESH_INTERVAL from the dog's offset."""
+        if self._unsub_refresh is not None:
+            return
+        self._unsub_refresh = async_call_later(
+            self._hass, self.refresh_offset, self._async_start_interval
+        )
+        self._hass.async_create_task(self.async_refresh())
+
+    async def _async_start_interval(self, now: datetime) -> None:
+        """Switch from the initial offset to the periodic refresh."""
+        self._unsub_refresh = async_track_time_interval(
+            self._hass, self._async_scheduled_refresh, ANALYTICS_REFRESH_INTERVAL
+        )
+        await self.async_refresh()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the periodic refresh."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    async def _async_scheduled_refresh(self, now: datetime) -> None:
+        """Periodic refresh."""
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Recompute all statistics from the recorder."""
+        if "recorder" not in self._hass.config.components:
+            _LOGGER.debug("Recorder not loaded, no analytics for %s", self._dog_name)
+            return
+
+        from homeassistant.components.recorder import get_instance
+
+        async with _async_get_refresh_lock(self._hass):
+            now = dt_util.now()
+            start = dt_util.start_of_local_day(now - timedelta(days=ANALYTICS_DAYS - 1))
+            try:
+                self._results = await get_instance(self._hass).async_add_executor_job(
+                    partial(_fetch_and_analyze, self._hass, self._series, start, now)
+                )
+            except Exception as e:
+                _LOGGER.error("Error refreshing analytics for %s: %s", self._dog_name, e)
+                return
+
+        self._refreshed = now
+        _LOGGER.debug(
+            "📈 Analytics refreshed for %s in %.0f ms (%d series)",
+            self._dog_name, (dt_util.now() - now).total_seconds() * 1000, len(self._results),
+        )
+        for update_callback in list(self._listeners):
+            update_callback()
+
+
+@callback
+def _async_get_refresh_lock(hass: HomeAssistant) -> asyncio.Lock:
+    """Return the lock serializing the analytics queries of all dogs."""
+    lock = hass.data.get(DATA_ANALYTICS_LOCK)
+    if lock is None:
+        lock = asyncio.Lock()
+        hass.data[DATA_ANALYTICS_LOCK] = lock
+    return lock
+
+
+async def async_get_analytics(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> DogAnalytics:
+    """Return the analytics of one dog of a config entry, creating them on first use."""
+    dog_data = get_dog_data(hass, config_entry, dog_name)
+    analytics = dog_data.get("analytics")
+    if analytics is None:
+        analytics = DogAnalytics(hass, dog_name)
+        dog_data["analytics"] = analytics
+        hass.data[DOMAIN][config_entry.entry_id].setdefault("listeners", []).append(analytics.async_stop)
+    return analytics
+
+
+def get_dog_analytics(hass: HomeAssistant, dog_name: str) -> Optional[DogAnalytics]:
+    """Return the analytics of a dog, if any."""
+    dog_data = find_dog_data(hass, dog_name)
+    return dog_data.get("analytics") if dog_data else None
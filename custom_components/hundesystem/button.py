@@ -3,17 +3,18 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Any
+from typing import Optional
 
+import voluptuous as vol
 from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceNotFound, ServiceValidationError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import (
     DOMAIN,
-    CONF_DOG_NAME,
     ICONS,
     ENTITIES,
     SERVICE_DAILY_RESET,
@@ -23,50 +24,55 @@ from .const import (
     SERVICE_LOG_ACTIVITY,
     SERVICE_SET_VISITOR_MODE,
     MEAL_TYPES,
-    ACTIVITY_TYPES,
 )
+from .entity_ids import dog_entity_ids
+from .household import entry_dog_names
+from .idempotency import SOURCE_BUTTON, DedupKey, async_get_activity_deduplicator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raised before a service handler ran, so the call changed nothing
+NOT_APPLIED_ERRORS = (vol.Invalid, ServiceNotFound, ServiceValidationError)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Hundesystem buttons."""
-    dog_name = config_entry.data[CONF_DOG_NAME]
-    
-    buttons = [
-        # Basic control buttons
-        HundesystemResetButton(hass, config_entry, dog_name),
-        HundesystemFeedingReminderButton(hass, config_entry, dog_name),
-        HundesystemTestNotificationButton(hass, config_entry, dog_name),
-        
-        # Quick action buttons
-        HundesystemQuickOutsideButton(hass, config_entry, dog_name),
-        HundesystemQuickFeedingButton(hass, config_entry, dog_name),
-        HundesystemQuickPoopButton(hass, config_entry, dog_name),
-        
-        # Activity logging buttons
-        HundesystemLogWalkButton(hass, config_entry, dog_name),
-        HundesystemLogPlayButton(hass, config_entry, dog_name),
-        HundesystemLogTrainingButton(hass, config_entry, dog_name),
-        
-        # Emergency and visitor buttons
-        HundesystemEmergencyButton(hass, config_entry, dog_name),
-        HundesystemVisitorModeToggleButton(hass, config_entry, dog_name),
-        
-        # Health and medication buttons
-        HundesystemMedicationGivenButton(hass, config_entry, dog_name),
-        HundesystemHealthCheckButton(hass, config_entry, dog_name),
-        
-        # Feeding specific buttons
-        HundesystemMorningFeedingButton(hass, config_entry, dog_name),
-        HundesystemLunchFeedingButton(hass, config_entry, dog_name),
-        HundesystemEveningFeedingButton(hass, config_entry, dog_name),
-        HundesystemSnackButton(hass, config_entry, dog_name),
-    ]
+    """Set up Hundesystem buttons for every dog of a config entry."""
+    buttons = []
+    for dog_name in entry_dog_names(config_entry):
+        buttons.extend([
+            # Basic control buttons
+            HundesystemResetButton(hass, config_entry, dog_name),
+            HundesystemFeedingReminderButton(hass, config_entry, dog_name),
+            HundesystemTestNotificationButton(hass, config_entry, dog_name),
+            
+            # Quick action buttons
+            HundesystemQuickOutsideButton(hass, config_entry, dog_name),
+            HundesystemQuickFeedingButton(hass, config_entry, dog_name),
+            HundesystemQuickPoopButton(hass, config_entry, dog_name),
+            
+            # Activity logging buttons
+            HundesystemLogWalkButton(hass, config_entry, dog_name),
+            HundesystemLogPlayButton(hass, config_entry, dog_name),
+            HundesystemLogTrainingButton(hass, config_entry, dog_name),
+            
+            # Emergency and visitor buttons
+            HundesystemEmergencyButton(hass, config_entry, dog_name),
+            HundesystemVisitorModeToggleButton(hass, config_entry, dog_name),
+            
+            # Health and medication buttons
+            HundesystemMedicationGivenButton(hass, config_entry, dog_name),
+            HundesystemHealthCheckButton(hass, config_entry, dog_name),
+            
+            # Feeding specific buttons
+            HundesystemMorningFeedingButton(hass, config_entry, dog_name),
+            HundesystemLunchFeedingButton(hass, config_entry, dog_name),
+            HundesystemEveningFeedingButton(hass, config_entry, dog_name),
+            HundesystemSnackButton(hass, config_entry, dog_name),
+        ])
     
     async_add_entities(buttons)
 
@@ -85,6 +91,7 @@ class HundesystemBaseButton(ButtonEntity):
         self.hass = hass
         self._config_entry = config_entry
         self._dog_name = dog_name
+        self._ids = dog_entity_ids(dog_name)
         self._button_type = button_type
         self._attr_unique_id = f"{DOMAIN}_{dog_name}_{button_type}"
         self._attr_name = f"{dog_name.title()} {button_type.replace('_', ' ').title()}"
@@ -100,6 +107,24 @@ class HundesystemBaseButton(ButtonEntity):
             sw_version="2.0.0",
         )
 
+    def _claim_activity(self, activity: str) -> Optional[DedupKey]:
+        """Claim a press logging activity; None if the same press was just handled."""
+        key = async_get_activity_deduplicator(self.hass).claim(self._dog_name, activity, SOURCE_BUTTON)
+        if key is None:
+            _LOGGER.debug("Duplicate %s press for %s dropped", activity, self._dog_name)
+        return key
+
+    def _release_activity(self, key: Optional[DedupKey], applied: bool) -> None:
+        """Release the claim of a failed press if it changed nothing, so pressing again is accepted.
+
+        A press that already changed a helper keeps its claim; pressing again
+        would count it twice.
+        """
+        if applied:
+            _LOGGER.warning("Press for %s was only partly applied; not accepting a repeat", self._dog_name)
+            return
+        async_get_activity_deduplicator(self.hass).release(key)
+
 
 class HundesystemResetButton(HundesystemBaseButton):
     """Button to reset daily statistics."""
@@ -215,24 +240,35 @@ class HundesystemQuickOutsideButton(HundesystemBaseButton):
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            # Toggle outside status
-            outside_entity = f"input_boolean.{self._dog_name}_outside"
+            # Toggle outside status; every press toggles, also the one switching back
+            outside_entity = self._ids.get("input_boolean", "outside")
             await self.hass.services.async_call(
                 "input_boolean", "toggle",
                 {"entity_id": outside_entity},
                 blocking=True
             )
-            
+        except Exception as e:
+            _LOGGER.error("Failed to execute quick outside action for %s: %s", self._dog_name, e)
+            return
+        
+        # Only the counter and timestamp are guarded against double presses
+        key = self._claim_activity("outside")
+        if key is None:
+            return
+        
+        applied = False
+        try:
             # Increment outside counter
-            counter_entity = f"counter.{self._dog_name}_outside_count"
+            counter_entity = self._ids.get("counter", "outside_count")
             await self.hass.services.async_call(
                 "counter", "increment",
                 {"entity_id": counter_entity},
                 blocking=True
             )
+            applied = True
             
             # Update last outside datetime
-            datetime_entity = f"input_datetime.{self._dog_name}_last_outside"
+            datetime_entity = self._ids.get("input_datetime", "last_outside")
             if self.hass.states.get(datetime_entity):
                 await self.hass.services.async_call(
                     "input_datetime", "set_datetime",
@@ -245,6 +281,7 @@ class HundesystemQuickOutsideButton(HundesystemBaseButton):
             
             _LOGGER.info("Quick outside action executed for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, applied)
             _LOGGER.error("Failed to execute quick outside action for %s: %s", self._dog_name, e)
 
 
@@ -263,29 +300,35 @@ class HundesystemQuickFeedingButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        # Determine current meal based on time
+        current_hour = datetime.now().hour
+        
+        if 6 <= current_hour < 11:
+            meal = "morning"
+        elif 11 <= current_hour < 15:
+            meal = "lunch"
+        elif 17 <= current_hour < 21:
+            meal = "evening"
+        else:
+            meal = "snack"
+        
+        key = self._claim_activity(f"feeding_{meal}")
+        if key is None:
+            return
+        
+        applied = False
         try:
-            # Determine current meal based on time
-            current_hour = datetime.now().hour
-            
-            if 6 <= current_hour < 11:
-                meal = "morning"
-            elif 11 <= current_hour < 15:
-                meal = "lunch"
-            elif 17 <= current_hour < 21:
-                meal = "evening"
-            else:
-                meal = "snack"
-            
             # Set feeding status
-            feeding_entity = f"input_boolean.{self._dog_name}_feeding_{meal}"
+            feeding_entity = self._ids.meals[meal]["fed"]
             await self.hass.services.async_call(
                 "input_boolean", "turn_on",
                 {"entity_id": feeding_entity},
                 blocking=True
             )
+            applied = True
             
             # Increment feeding counter
-            counter_entity = f"counter.{self._dog_name}_feeding_{meal}_count"
+            counter_entity = self._ids.meals[meal]["count"]
             await self.hass.services.async_call(
                 "counter", "increment",
                 {"entity_id": counter_entity},
@@ -293,7 +336,7 @@ class HundesystemQuickFeedingButton(HundesystemBaseButton):
             )
             
             # Update last feeding datetime
-            datetime_entity = f"input_datetime.{self._dog_name}_last_feeding_{meal}"
+            datetime_entity = self._ids.meals[meal]["last_time"]
             if self.hass.states.get(datetime_entity):
                 await self.hass.services.async_call(
                     "input_datetime", "set_datetime",
@@ -306,6 +349,7 @@ class HundesystemQuickFeedingButton(HundesystemBaseButton):
             
             _LOGGER.info("Quick feeding (%s) executed for %s", meal, self._dog_name)
         except Exception as e:
+            self._release_activity(key, applied)
             _LOGGER.error("Failed to execute quick feeding for %s: %s", self._dog_name, e)
 
 
@@ -324,17 +368,23 @@ class HundesystemQuickPoopButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        key = self._claim_activity("poop")
+        if key is None:
+            return
+        
+        applied = False
         try:
             # Set poop status
-            poop_entity = f"input_boolean.{self._dog_name}_poop_done"
+            poop_entity = self._ids.get("input_boolean", "poop_done")
             await self.hass.services.async_call(
                 "input_boolean", "turn_on",
                 {"entity_id": poop_entity},
                 blocking=True
             )
+            applied = True
             
             # Increment poop counter
-            counter_entity = f"counter.{self._dog_name}_poop_count"
+            counter_entity = self._ids.get("counter", "poop_count")
             await self.hass.services.async_call(
                 "counter", "increment",
                 {"entity_id": counter_entity},
@@ -342,7 +392,7 @@ class HundesystemQuickPoopButton(HundesystemBaseButton):
             )
             
             # Update last poop datetime
-            datetime_entity = f"input_datetime.{self._dog_name}_last_poop"
+            datetime_entity = self._ids.get("input_datetime", "last_poop")
             if self.hass.states.get(datetime_entity):
                 await self.hass.services.async_call(
                     "input_datetime", "set_datetime",
@@ -355,6 +405,7 @@ class HundesystemQuickPoopButton(HundesystemBaseButton):
             
             _LOGGER.info("Quick poop action executed for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, applied)
             _LOGGER.error("Failed to execute quick poop action for %s: %s", self._dog_name, e)
 
 
@@ -373,6 +424,10 @@ class HundesystemLogWalkButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        key = self._claim_activity("walk")
+        if key is None:
+            return
+        
         try:
             await self.hass.services.async_call(
                 DOMAIN,
@@ -386,6 +441,7 @@ class HundesystemLogWalkButton(HundesystemBaseButton):
             )
             _LOGGER.info("Walk activity logged for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, not isinstance(e, NOT_APPLIED_ERRORS))
             _LOGGER.error("Failed to log walk activity for %s: %s", self._dog_name, e)
 
 
@@ -404,6 +460,10 @@ class HundesystemLogPlayButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        key = self._claim_activity("play")
+        if key is None:
+            return
+        
         try:
             await self.hass.services.async_call(
                 DOMAIN,
@@ -417,6 +477,7 @@ class HundesystemLogPlayButton(HundesystemBaseButton):
             )
             _LOGGER.info("Play activity logged for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, not isinstance(e, NOT_APPLIED_ERRORS))
             _LOGGER.error("Failed to log play activity for %s: %s", self._dog_name, e)
 
 
@@ -435,6 +496,10 @@ class HundesystemLogTrainingButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        key = self._claim_activity("training")
+        if key is None:
+            return
+        
         try:
             await self.hass.services.async_call(
                 DOMAIN,
@@ -448,6 +513,7 @@ class HundesystemLogTrainingButton(HundesystemBaseButton):
             )
             _LOGGER.info("Training activity logged for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, not isinstance(e, NOT_APPLIED_ERRORS))
             _LOGGER.error("Failed to log training activity for %s: %s", self._dog_name, e)
 
 
@@ -469,7 +535,7 @@ class HundesystemEmergencyButton(HundesystemBaseButton):
         """Handle the button press."""
         try:
             # Toggle emergency mode
-            emergency_entity = f"input_boolean.{self._dog_name}_emergency_mode"
+            emergency_entity = self._ids.get("input_boolean", "emergency_mode")
             await self.hass.services.async_call(
                 "input_boolean", "toggle",
                 {"entity_id": emergency_entity},
@@ -510,7 +576,7 @@ class HundesystemVisitorModeToggleButton(HundesystemBaseButton):
         """Handle the button press."""
         try:
             # Check current visitor mode status
-            visitor_entity = f"input_boolean.{self._dog_name}_visitor_mode_input"
+            visitor_entity = self._ids.get("input_boolean", "visitor_mode_input")
             current_state = self.hass.states.get(visitor_entity)
             
             if current_state:
@@ -547,17 +613,23 @@ class HundesystemMedicationGivenButton(HundesystemBaseButton):
 
     async def async_press(self) -> None:
         """Handle the button press."""
+        key = self._claim_activity("medication")
+        if key is None:
+            return
+        
+        applied = False
         try:
             # Set medication given status
-            medication_entity = f"input_boolean.{self._dog_name}_medication_given"
+            medication_entity = self._ids.get("input_boolean", "medication_given")
             await self.hass.services.async_call(
                 "input_boolean", "turn_on",
                 {"entity_id": medication_entity},
                 blocking=True
             )
+            applied = True
             
             # Increment medication counter
-            counter_entity = f"counter.{self._dog_name}_medication_count"
+            counter_entity = self._ids.get("counter", "medication_count")
             if self.hass.states.get(counter_entity):
                 await self.hass.services.async_call(
                     "counter", "increment",
@@ -567,6 +639,7 @@ class HundesystemMedicationGivenButton(HundesystemBaseButton):
             
             _LOGGER.info("Medication marked as given for %s", self._dog_name)
         except Exception as e:
+            self._release_activity(key, applied)
             _LOGGER.error("Failed to mark medication as given for %s: %s", self._dog_name, e)
 
 
@@ -590,21 +663,21 @@ class HundesystemHealthCheckButton(HundesystemBaseButton):
             health_observations = []
             
             # Check feeding status
-            feeding_complete_state = self.hass.states.get(f"binary_sensor.{self._dog_name}_feeding_complete")
+            feeding_complete_state = self.hass.states.get(self._ids.get("binary_sensor", "feeding_complete"))
             if feeding_complete_state and feeding_complete_state.state == "on":
                 health_observations.append("Fütterung vollständig")
             else:
                 health_observations.append("Fütterung unvollständig")
             
             # Check activity status
-            outside_state = self.hass.states.get(f"input_boolean.{self._dog_name}_outside")
+            outside_state = self.hass.states.get(self._ids.get("input_boolean", "outside"))
             if outside_state and outside_state.state == "on":
                 health_observations.append("War heute draußen")
             else:
                 health_observations.append("War noch nicht draußen")
             
             # Get current health status
-            health_status_state = self.hass.states.get(f"input_select.{self._dog_name}_health_status")
+            health_status_state = self.hass.states.get(self._ids.get("input_select", "health_status"))
             current_health = health_status_state.state if health_status_state else "Gut"
             health_observations.append(f"Gesundheitsstatus: {current_health}")
             
@@ -612,7 +685,7 @@ class HundesystemHealthCheckButton(HundesystemBaseButton):
             health_summary = f"Gesundheitscheck für {self._dog_name.title()}: " + "; ".join(health_observations)
             
             # Update health notes
-            health_notes_entity = f"input_text.{self._dog_name}_health_notes"
+            health_notes_entity = self._ids.get("input_text", "health_notes")
             if self.hass.states.get(health_notes_entity):
                 timestamp = datetime.now().strftime("%d.%m. %H:%M")
                 await self.hass.services.async_call(
@@ -649,17 +722,23 @@ class HundesystemMorningFeedingButton(HundesystemBaseButton):
 
     async def _handle_feeding(self, meal_type: str) -> None:
         """Handle feeding action for specific meal."""
+        key = self._claim_activity(f"feeding_{meal_type}")
+        if key is None:
+            return
+        
+        applied = False
         try:
             # Set feeding status
-            feeding_entity = f"input_boolean.{self._dog_name}_feeding_{meal_type}"
+            feeding_entity = self._ids.meals[meal_type]["fed"]
             await self.hass.services.async_call(
                 "input_boolean", "turn_on",
                 {"entity_id": feeding_entity},
                 blocking=True
             )
+            applied = True
             
             # Increment counter
-            counter_entity = f"counter.{self._dog_name}_feeding_{meal_type}_count"
+            counter_entity = self._ids.meals[meal_type]["count"]
             await self.hass.services.async_call(
                 "counter", "increment",
                 {"entity_id": counter_entity},
@@ -667,7 +746,7 @@ class HundesystemMorningFeedingButton(HundesystemBaseButton):
             )
             
             # Update datetime
-            datetime_entity = f"input_datetime.{self._dog_name}_last_feeding_{meal_type}"
+            datetime_entity = self._ids.meals[meal_type]["last_time"]
             if self.hass.states.get(datetime_entity):
                 await self.hass.services.async_call(
                     "input_datetime", "set_datetime",
@@ -680,6 +759,7 @@ class HundesystemMorningFeedingButton(HundesystemBaseButton):
             
             _LOGGER.info("%s feeding executed for %s", meal_type, self._dog_name)
         except Exception as e:
+            self._release_activity(key, applied)
             _LOGGER.error("Failed to execute %s feeding for %s: %s", meal_type, self._dog_name, e)
 
 
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import uuid
+from typing import Any, Iterable, List
 
 import voluptuous as vol
 
@@ -17,14 +18,22 @@ from homeassistant.helpers.entity_registry import async_get as async_get_entity_
 from .const import (
     DOMAIN,
     CONF_DOG_NAME,
+    CONF_DOGS,
     CONF_PUSH_DEVICES,
     CONF_PERSON_TRACKING,
     CONF_CREATE_DASHBOARD,
     CONF_DOOR_SENSOR,
+    CONF_UPDATE_DEBOUNCE,
+    CONF_NOTIFICATION_WINDOW,
+    CONF_MAX_CONCURRENT_CREATES,
     DEFAULT_DOG_NAME,
     DEFAULT_PERSON_TRACKING,
     DEFAULT_CREATE_DASHBOARD,
+    DEFAULT_UPDATE_DEBOUNCE,
+    DEFAULT_NOTIFICATION_WINDOW,
+    DEFAULT_MAX_CONCURRENT_CREATES,
 )
+from .household import configured_dog_names, entry_dog_names, is_household, parse_dog_names
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,41 +50,53 @@ class AlreadyConfigured(Exception):
     """Error to indicate dog is already configured."""
 
 
-class TooManyDogs(Exception):
-    """Error to indicate too many dogs are configured."""
-
-
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
     
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
-    dog_name = data[CONF_DOG_NAME].strip().lower()
-    
-    # Validate dog name
-    if not dog_name or len(dog_name) < 2:
-        raise InvalidDogName
-    
-    if not dog_name.replace('_', '').replace('-', '').isalnum():
-        raise InvalidDogName
-    
-    # Check if already configured
-    existing_entries = hass.config_entries.async_entries(DOMAIN)
-    if len(existing_entries) >= 5:  # Max 5 dogs
-        raise TooManyDogs
-    
-    for entry in existing_entries:
-        if entry.data.get(CONF_DOG_NAME, "").lower() == dog_name:
-            raise AlreadyConfigured
+    # Several comma separated names create one household entry
+    dog_names = parse_dog_names(data[CONF_DOG_NAME])
+    validate_dog_names(hass, dog_names)
 
     # Return info that you want to store in the config entry.
-    return {
-        CONF_DOG_NAME: dog_name,
+    info = {
         CONF_PUSH_DEVICES: data.get(CONF_PUSH_DEVICES, []),
         CONF_PERSON_TRACKING: data.get(CONF_PERSON_TRACKING, DEFAULT_PERSON_TRACKING),
         CONF_CREATE_DASHBOARD: data.get(CONF_CREATE_DASHBOARD, DEFAULT_CREATE_DASHBOARD),
         CONF_DOOR_SENSOR: data.get(CONF_DOOR_SENSOR, ""),
     }
+    if len(dog_names) == 1:
+        info[CONF_DOG_NAME] = dog_names[0]
+    else:
+        # Settings are shared; per dog only deviating settings are stored
+        info[CONF_DOGS] = {dog_name: {} for dog_name in dog_names}
+    return info
+
+
+def validate_dog_names(hass: HomeAssistant, dog_names: List[str], own_dogs: Iterable[str] = ()) -> None:
+    """Validate dog names; own_dogs are the entry's current dogs, which may be kept."""
+    if not dog_names:
+        raise InvalidDogName
+    
+    for dog_name in dog_names:
+        if len(dog_name) < 2:
+            raise InvalidDogName
+        
+        if not dog_name.replace('_', '').replace('-', '').isalnum():
+            raise InvalidDogName
+    
+    # Check if already configured (in any other single-dog or household entry)
+    existing_dogs = set(configured_dog_names(hass)) - set(own_dogs)
+    if any(dog_name in existing_dogs for dog_name in dog_names):
+        raise AlreadyConfigured
+
+
+def entry_title(data: dict[str, Any]) -> str:
+    """Return the title of a single-dog or household entry."""
+    if data.get(CONF_DOGS):
+        return f"Hundesystem - Haushalt ({len(data[CONF_DOGS])} Hunde)"
+    return f"Hundesystem - {data[CONF_DOG_NAME].title()}"
 
 
 @config_entries.HANDLERS.register(DOMAIN)
@@ -99,8 +120,10 @@ class HundesystemConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 info = await validate_input(self.hass, user_input)
                 
-                # Set unique ID to prevent duplicates
-                await self.async_set_unique_id(info[CONF_DOG_NAME])
+                # Set unique ID to prevent duplicates; a household's dogs can change, so it gets a generated one
+                await self.async_set_unique_id(
+                    info.get(CONF_DOG_NAME) or f"household_{uuid.uuid4().hex}"
+                )
                 self._abort_if_unique_id_configured()
                 
                 # Store basic info and proceed to advanced settings
@@ -111,8 +134,6 @@ class HundesystemConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "already_configured"
             except InvalidDogName:
                 errors["dog_name"] = "invalid_dog_name"
-            except TooManyDogs:
-                errors["base"] = "too_many_dogs"
             except CannotConnect:
                 errors["base"] = "cannot_connect"
             except Exception:  # pylint: disable=broad-except
@@ -167,10 +188,7 @@ class HundesystemConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     # Update data and create entry
                     self._data.update(user_input)
                     
-                    return self.async_create_entry(
-                        title=f"Hundesystem - {self._data[CONF_DOG_NAME].title()}",
-                        data=self._data
-                    )
+                    return self.async_create_entry(title=entry_title(self._data), data=self._data)
                     
             except Exception:  # pylint: disable=broad-except
                 _LOGGER.exception("Unexpected exception in advanced step")
@@ -272,13 +290,10 @@ class HundesystemConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def _get_existing_dogs_list(self) -> str:
         """Get list of existing configured dogs."""
         try:
-            existing_entries = self.hass.config_entries.async_entries(DOMAIN)
-            if not existing_entries:
+            dog_names = [dog_name.title() for dog_name in configured_dog_names(self.hass)]
+            if not dog_names:
                 return "Noch keine Hunde konfiguriert"
             
-            dog_names = [entry.data.get(CONF_DOG_NAME, "Unbekannt").title() 
-                        for entry in existing_entries]
-            
             return f"Bereits konfiguriert: {', '.join(dog_names)}"
             
         except Exception as e:
@@ -307,6 +322,17 @@ class HundesystemOptionsFlow(config_entries.OptionsFlow):
 
         if user_input is not None:
             try:
+                # Dogs are stored in the entry data, not in the options
+                dog_names = parse_dog_names(user_input.pop(CONF_DOGS, ""))
+                try:
+                    validate_dog_names(
+                        self.hass, dog_names, [name.lower() for name in entry_dog_names(self.config_entry)]
+                    )
+                except InvalidDogName:
+                    errors[CONF_DOGS] = "invalid_dog_name"
+                except AlreadyConfigured:
+                    errors[CONF_DOGS] = "already_configured"
+                
                 # Validate options
                 door_sensor = user_input.get(CONF_DOOR_SENSOR, "")
                 if door_sensor:
@@ -318,6 +344,11 @@ class HundesystemOptionsFlow(config_entries.OptionsFlow):
                             errors["door_sensor"] = "entity_not_found"
 
                 if not errors:
+                    # Dogs and options are written together, so the reload sees both
+                    data = self._entry_data_for_dogs(dog_names)
+                    self.hass.config_entries.async_update_entry(
+                        self.config_entry, data=data, title=entry_title(data), options=user_input
+                    )
                     return self.async_create_entry(title="", data=user_input)
 
             except Exception:  # pylint: disable=broad-except
@@ -332,6 +363,10 @@ class HundesystemOptionsFlow(config_entries.OptionsFlow):
         door_sensors = await self._get_door_sensors()
 
         options_schema = vol.Schema({
+            vol.Required(
+                CONF_DOGS,
+                default=", ".join(entry_dog_names(self.config_entry))
+            ): cv.string,
             vol.Optional(
                 CONF_PUSH_DEVICES,
                 default=current_config.get(CONF_PUSH_DEVICES, [])
@@ -359,6 +394,18 @@ class HundesystemOptionsFlow(config_entries.OptionsFlow):
                     "device_class": "door"
                 }
             }) if door_sensors else cv.string,
+            vol.Optional(
+                CONF_UPDATE_DEBOUNCE,
+                default=current_config.get(CONF_UPDATE_DEBOUNCE, DEFAULT_UPDATE_DEBOUNCE)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            vol.Optional(
+                CONF_NOTIFICATION_WINDOW,
+                default=current_config.get(CONF_NOTIFICATION_WINDOW, DEFAULT_NOTIFICATION_WINDOW)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+            vol.Optional(
+                CONF_MAX_CONCURRENT_CREATES,
+                default=current_config.get(CONF_MAX_CONCURRENT_CREATES, DEFAULT_MAX_CONCURRENT_CREATES)
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=64)),
         })
 
         return self.async_show_form(
@@ -366,10 +413,28 @@ class HundesystemOptionsFlow(config_entries.OptionsFlow):
             data_schema=options_schema,
             errors=errors,
             description_placeholders={
-                "dog_name": self.config_entry.data.get(CONF_DOG_NAME, "").title()
+                "dog_name": ", ".join(dog_name.title() for dog_name in entry_dog_names(self.config_entry))
             }
         )
 
+    def _entry_data_for_dogs(self, dog_names: List[str]) -> dict[str, Any]:
+        """Return the entry data with added or removed dogs."""
+        data = dict(self.config_entry.data)
+        current = [name.lower() for name in entry_dog_names(self.config_entry)]
+        if dog_names == current:
+            return data
+        
+        if len(dog_names) == 1 and not is_household(self.config_entry):
+            data[CONF_DOG_NAME] = dog_names[0]
+        else:
+            # Kept dogs keep their own overrides
+            overrides = data.get(CONF_DOGS) or {}
+            data.pop(CONF_DOG_NAME, None)
+            data[CONF_DOGS] = {dog_name: overrides.get(dog_name, {}) for dog_name in dog_names}
+        
+        _LOGGER.info("Dogs of %s changed to %s", self.config_entry.title, ", ".join(dog_names))
+        return data
+
     async def _get_notify_services(self) -> list[str]:
         """Get available notify services."""
         try:
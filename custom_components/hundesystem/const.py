@@ -5,18 +5,25 @@ DOMAIN = "hundesystem"
 
 # Configuration keys
 CONF_DOG_NAME = "dog_name"
+CONF_DOGS = "dogs"
 CONF_PUSH_DEVICES = "push_devices"
 CONF_PERSON_TRACKING = "person_tracking"
 CONF_CREATE_DASHBOARD = "create_dashboard"
 CONF_DOOR_SENSOR = "door_sensor"
 CONF_FEEDING_TIMES = "feeding_times"
 CONF_RESET_TIME = "reset_time"
+CONF_UPDATE_DEBOUNCE = "update_debounce"
+CONF_NOTIFICATION_WINDOW = "notification_window"
+CONF_MAX_CONCURRENT_CREATES = "max_concurrent_creates"
 
 # Default values
 DEFAULT_DOG_NAME = "hund"
 DEFAULT_CREATE_DASHBOARD = True
 DEFAULT_PERSON_TRACKING = True
 DEFAULT_RESET_TIME = "23:59:00"
+DEFAULT_UPDATE_DEBOUNCE = 0.5  # seconds
+DEFAULT_NOTIFICATION_WINDOW = 10.0  # seconds
+DEFAULT_MAX_CONCURRENT_CREATES = 8  # helper create calls across all dogs
 
 # Entity types
 BINARY_SENSOR_PREFIX = "binary_sensor"
@@ -50,12 +57,24 @@ ACTIVITY_TYPES = {
     "grooming": "Pflege"
 }
 
+# Journal categories: stable keys are stored, the German labels are only displayed
+JOURNAL_CATEGORIES = {
+    **ACTIVITY_TYPES,
+    "feeding": "Fütterung",
+    "health_check": "Gesundheitscheck",
+    "medication": "Medikament",
+    "emergency": "Notfall",
+    "emergency_end": "Notfall beendet",
+}
+
 # Service names
 SERVICE_TRIGGER_FEEDING_REMINDER = "trigger_feeding_reminder"
 SERVICE_DAILY_RESET = "daily_reset"
 SERVICE_SEND_NOTIFICATION = "send_notification"
 SERVICE_SET_VISITOR_MODE = "set_visitor_mode"
 SERVICE_LOG_ACTIVITY = "log_activity"
+SERVICE_LOG_BATCH = "log_batch"
+SERVICE_QUERY_JOURNAL = "query_journal"
 SERVICE_ADD_DOG = "add_dog"
 SERVICE_TEST_NOTIFICATION = "test_notification"
 SERVICE_EMERGENCY_CONTACT = "emergency_contact"
@@ -81,6 +100,10 @@ ENTITIES = {
     "health_score": "health_score",
     "mood": "mood",
     "weekly_summary": "weekly_summary",
+    "notification_queue": "notification_queue",
+    "profiling": "profiling",
+    "journal": "journal",
+    "activity_trend": "activity_trend",
     
     # Input booleans
     "feeding_morning": "feeding_morning",
@@ -150,7 +173,9 @@ STATUS_MESSAGES = {
     "happy": "Zufrieden",
     "active": "Sehr aktiv",
     "bored": "Gelangweilt",
-    "tired": "Müde"
+    "tired": "Müde",
+    "needs_care": "Braucht Versorgung",
+    "okay": "Okay"
 }
 
 # Icons mapping
@@ -166,6 +191,8 @@ ICONS = {
     "notes": "mdi:note-text",
     "reset": "mdi:restart",
     "status": "mdi:information-outline",
+    "checklist": "mdi:clipboard-check",
+    "automation": "mdi:robot",
     
     # Meals
     "morning": "mdi:weather-sunrise",
@@ -206,6 +233,239 @@ DEFAULT_FEEDING_TIMES = {
     "snack": "15:00:00"
 }
 
+# Declarative helper manifest per dog: entity suffix followed by the
+# domain-specific creation parameters (see helpers._build_service_data_ultra_safe)
+HELPER_DEFINITIONS = {
+    "input_boolean": [
+        # Core feeding booleans
+        ("feeding_morning", "Frühstück", ICONS["morning"]),
+        ("feeding_lunch", "Mittagessen", ICONS["lunch"]),
+        ("feeding_evening", "Abendessen", ICONS["evening"]),
+        ("feeding_snack", "Leckerli", ICONS["snack"]),
+        
+        # Core activity booleans
+        ("outside", "War draußen", ICONS["outside"]),
+        ("poop_done", "Geschäft gemacht", ICONS["poop"]),
+        
+        # System booleans
+        ("visitor_mode_input", "Besuchsmodus", ICONS["visitor"]),
+        ("emergency_mode", "Notfallmodus", ICONS["emergency"]),
+        ("medication_given", "Medikament gegeben", ICONS["medication"]),
+        
+        # Health & wellbeing booleans
+        ("feeling_well", "Fühlt sich wohl", ICONS["health"]),
+        ("appetite_normal", "Normaler Appetit", ICONS["food"]),
+        ("energy_normal", "Normale Energie", ICONS["play"]),
+        
+        # Feature toggles
+        ("auto_reminders", "Automatische Erinnerungen", ICONS["bell"]),
+        ("tracking_enabled", "Tracking aktiviert", ICONS["status"]),
+        ("weather_alerts", "Wetter-Warnungen", "mdi:weather-partly-cloudy"),
+        
+        # Care & maintenance
+        ("needs_grooming", "Pflege benötigt", ICONS["grooming"]),
+        ("training_session", "Training heute", ICONS["training"]),
+        ("vet_visit_due", "Tierarztbesuch fällig", ICONS["vet"]),
+        
+        # Additional useful booleans
+        ("walked_today", "Heute Gassi gewesen", ICONS["walk"]),
+        ("played_today", "Heute gespielt", ICONS["play"]),
+        ("socialized_today", "Heute sozialisiert", "mdi:account-group"),
+    ],
+    "counter": [
+        # Feeding counters
+        ("feeding_morning_count", "Frühstück Zähler", ICONS["morning"]),
+        ("feeding_lunch_count", "Mittagessen Zähler", ICONS["lunch"]),
+        ("feeding_evening_count", "Abendessen Zähler", ICONS["evening"]),
+        ("feeding_snack_count", "Leckerli Zähler", ICONS["snack"]),
+        
+        # Activity counters
+        ("outside_count", "Draußen Zähler", ICONS["outside"]),
+        ("walk_count", "Gassi Zähler", ICONS["walk"]),
+        ("play_count", "Spiel Zähler", ICONS["play"]),
+        ("training_count", "Training Zähler", ICONS["training"]),
+        ("poop_count", "Geschäft Zähler", ICONS["poop"]),
+        
+        # Health & care counters
+        ("vet_visits_count", "Tierarzt Besuche", ICONS["vet"]),
+        ("medication_count", "Medikamente", ICONS["medication"]),
+        ("grooming_count", "Pflege Sessions", ICONS["grooming"]),
+        
+        # Summary counters
+        ("activity_count", "Aktivitäten gesamt", ICONS["status"]),
+        ("emergency_calls", "Notfälle", ICONS["emergency"]),
+        ("daily_score", "Tages-Score", "mdi:star"),
+        
+        # Social & behavioral counters
+        ("social_interactions", "Soziale Kontakte", "mdi:account-group"),
+        ("behavior_incidents", "Verhaltensereignisse", "mdi:alert-outline"),
+        ("rewards_given", "Belohnungen", "mdi:gift"),
+    ],
+    "input_datetime": [
+        # Feeding schedule times (time only)
+        *[
+            (f"feeding_{meal_type}_time", f"{MEAL_TYPES[meal_type]} Zeit", True, False,
+             DEFAULT_FEEDING_TIMES[meal_type], ICONS[meal_type])
+            for meal_type in FEEDING_TYPES
+        ],
+        
+        # Last activity timestamps (date + time)
+        ("last_feeding_morning", "Letztes Frühstück", True, True, None, ICONS["morning"]),
+        ("last_feeding_lunch", "Letztes Mittagessen", True, True, None, ICONS["lunch"]),
+        ("last_feeding_evening", "Letztes Abendessen", True, True, None, ICONS["evening"]),
+        ("last_feeding_snack", "Letztes Leckerli", True, True, None, ICONS["snack"]),
+        ("last_outside", "Letzter Gartengang", True, True, None, ICONS["outside"]),
+        ("last_walk", "Letzter Spaziergang", True, True, None, ICONS["walk"]),
+        ("last_play", "Letztes Spielen", True, True, None, ICONS["play"]),
+        ("last_training", "Letztes Training", True, True, None, ICONS["training"]),
+        ("last_poop", "Letztes Geschäft", True, True, None, ICONS["poop"]),
+        ("last_activity", "Letzte Aktivität", True, True, None, ICONS["status"]),
+        ("last_door_ask", "Letzte Türfrage", True, True, None, "mdi:door"),
+        
+        # Health & vet appointments
+        ("last_vet_visit", "Letzter Tierarztbesuch", True, True, None, ICONS["vet"]),
+        ("next_vet_appointment", "Nächster Tierarzttermin", True, True, None, ICONS["vet"]),
+        ("last_vaccination", "Letzte Impfung", True, True, None, "mdi:needle"),
+        ("next_vaccination", "Nächste Impfung", True, True, None, "mdi:needle"),
+        ("medication_time", "Medikamentenzeit", True, False, "08:00:00", ICONS["medication"]),
+        ("last_grooming", "Letzte Pflege", True, True, None, ICONS["grooming"]),
+        ("next_grooming", "Nächste Pflege", True, True, None, ICONS["grooming"]),
+        
+        # Emergency & special events
+        ("emergency_contact_time", "Notfall Kontakt Zeit", True, True, None, ICONS["emergency"]),
+        ("visitor_start", "Besuch Start", True, True, None, ICONS["visitor"]),
+        ("visitor_end", "Besuch Ende", True, True, None, ICONS["visitor"]),
+        ("birth_date", "Geburtsdatum", False, True, None, ICONS["dog"]),
+        ("last_weight_check", "Letzte Gewichtskontrolle", True, True, None, "mdi:weight-kilogram"),
+    ],
+    "input_text": [
+        # Basic notes
+        ("notes", "Allgemeine Notizen", 255, ICONS["notes"]),
+        ("daily_notes", "Tagesnotizen", 255, ICONS["notes"]),
+        ("behavior_notes", "Verhaltensnotizen", 255, ICONS["notes"]),
+        
+        # Activity notes
+        ("last_activity_notes", "Letzte Aktivität Notizen", 255, ICONS["notes"]),
+        ("walk_notes", "Spaziergang Notizen", 255, ICONS["walk"]),
+        ("play_notes", "Spiel Notizen", 255, ICONS["play"]),
+        ("training_notes", "Training Notizen", 255, ICONS["training"]),
+        
+        # Visitor information
+        ("visitor_name", "Besuchername", 100, ICONS["visitor"]),
+        ("visitor_contact", "Besucher Kontakt", 200, ICONS["visitor"]),
+        ("visitor_notes", "Besucher Notizen", 255, ICONS["visitor"]),
+        ("visitor_instructions", "Anweisungen für Besucher", 255, ICONS["visitor"]),
+        
+        # Health information
+        ("health_notes", "Gesundheitsnotizen", 255, ICONS["health"]),
+        ("medication_notes", "Medikamenten Notizen", 255, ICONS["medication"]),
+        ("vet_notes", "Tierarzt Notizen", 255, ICONS["vet"]),
+        ("symptoms", "Aktuelle Symptome", 255, ICONS["health"]),
+        ("allergies", "Allergien", 255, ICONS["health"]),
+        
+        # Emergency contacts
+        ("emergency_contact", "Notfallkontakt", 200, ICONS["emergency"]),
+        ("vet_contact", "Tierarzt Kontakt", 200, ICONS["vet"]),
+        ("backup_contact", "Ersatzkontakt", 200, "mdi:phone"),
+        
+        # Dog information
+        ("breed", "Rasse", 100, ICONS["dog"]),
+        ("color", "Farbe/Markierungen", 100, ICONS["dog"]),
+        ("microchip_id", "Mikrochip ID", 50, "mdi:chip"),
+        ("insurance_number", "Versicherungsnummer", 100, "mdi:shield"),
+        ("registration_number", "Registrierungsnummer", 100, "mdi:card-account-details"),
+        
+        # Food preferences
+        ("food_brand", "Futtermarke", 100, ICONS["food"]),
+        ("food_allergies", "Futterallergien", 255, ICONS["food"]),
+        ("favorite_treats", "Lieblingsleckerli", 255, ICONS["snack"]),
+        ("feeding_instructions", "Fütterungsanweisungen", 255, ICONS["food"]),
+    ],
+    "input_number": [
+        # Health metrics
+        ("weight", "Gewicht", 0.1, 0, 100, 10, "kg", "mdi:weight-kilogram"),
+        ("target_weight", "Zielgewicht", 0.1, 0, 100, 10, "kg", "mdi:target"),
+        ("temperature", "Körpertemperatur", 0.1, 35, 42, 38.5, "°C", ICONS["thermometer"]),
+        ("heart_rate", "Herzfrequenz", 1, 60, 200, 100, "bpm", ICONS["health"]),
+        ("respiratory_rate", "Atemfrequenz", 1, 10, 50, 20, "bpm", ICONS["health"]),
+        
+        # Activity metrics
+        ("daily_walk_duration", "Tägliche Gehzeit", 1, 0, 300, 60, "min", ICONS["walk"]),
+        ("daily_play_time", "Tägliche Spielzeit", 1, 0, 180, 30, "min", ICONS["play"]),
+        ("training_duration", "Trainingszeit", 1, 0, 120, 15, "min", ICONS["training"]),
+        ("sleep_hours", "Schlafstunden", 0.5, 0, 24, 12, "h", "mdi:sleep"),
+        
+        # Food metrics
+        ("daily_food_amount", "Tägliche Futtermenge", 10, 0, 2000, 400, "g", ICONS["food"]),
+        ("treat_amount", "Leckerli Menge", 1, 0, 200, 20, "g", ICONS["snack"]),
+        ("water_intake", "Wasseraufnahme", 50, 0, 3000, 500, "ml", "mdi:cup-water"),
+        
+        # Age and lifespan
+        ("age_years", "Alter (Jahre)", 0.1, 0, 30, 5, "Jahre", ICONS["dog"]),
+        ("age_months", "Alter (Monate)", 1, 0, 360, 60, "Monate", ICONS["dog"]),
+        ("expected_lifespan", "Erwartete Lebenszeit", 1, 8, 25, 14, "Jahre", ICONS["dog"]),
+        
+        # Size measurements
+        ("height", "Schulterhöhe", 0.5, 10, 100, 50, "cm", "mdi:ruler"),
+        ("length", "Körperlänge", 0.5, 20, 150, 70, "cm", "mdi:ruler"),
+        ("neck_circumference", "Halsumfang", 0.5, 10, 80, 35, "cm", "mdi:tape-measure"),
+        ("chest_circumference", "Brustumfang", 0.5, 20, 120, 60, "cm", "mdi:tape-measure"),
+        
+        # Health scores and ratings
+        ("health_score", "Gesundheits Score", 0.1, 0, 10, 8, "Punkte", ICONS["health"]),
+        ("happiness_score", "Glücks Score", 0.1, 0, 10, 8, "Punkte", ICONS["happy"]),
+        ("energy_level", "Energie Level", 0.1, 0, 10, 7, "Punkte", ICONS["play"]),
+        ("appetite_score", "Appetit Score", 0.1, 0, 10, 8, "Punkte", ICONS["food"]),
+    ],
+    "input_select": [
+        # Health status
+        ("health_status", "Gesundheitsstatus", [
+            "Ausgezeichnet", "Gut", "Normal", "Schwach", "Krank", "Notfall"
+        ], "Gut", ICONS["health"]),
+        
+        # Mood
+        ("mood", "Stimmung", [
+            "Sehr glücklich", "Glücklich", "Neutral", "Gestresst", "Ängstlich", "Krank"
+        ], "Glücklich", ICONS["happy"]),
+        
+        # Activity level
+        ("activity_level", "Aktivitätslevel", [
+            "Sehr niedrig", "Niedrig", "Normal", "Hoch", "Sehr hoch"
+        ], "Normal", ICONS["play"]),
+        
+        # Energy level
+        ("energy_level_category", "Energie Level", [
+            "Sehr müde", "Müde", "Normal", "Energiegeladen", "Hyperaktiv"
+        ], "Normal", ICONS["play"]),
+        
+        # Appetite level
+        ("appetite_level", "Appetit Level", [
+            "Kein Appetit", "Wenig Appetit", "Normal", "Guter Appetit", "Sehr hungrig"
+        ], "Normal", ICONS["food"]),
+        
+        # Emergency level
+        ("emergency_level", "Notfall Level", [
+            "Normal", "Aufmerksamkeit", "Warnung", "Dringend", "Kritisch"
+        ], "Normal", ICONS["emergency"]),
+        
+        # Size category
+        ("size_category", "Größenkategorie", [
+            "Toy (< 4kg)", "Klein (4-10kg)", "Mittel (10-25kg)", "Groß (25-45kg)", "Riesig (> 45kg)"
+        ], "Mittel (10-25kg)", ICONS["dog"]),
+        
+        # Age group
+        ("age_group", "Altersgruppe", [
+            "Welpe (< 6 Monate)", "Junghund (6-18 Monate)", "Erwachsen (1-7 Jahre)", 
+            "Senior (7-10 Jahre)", "Hochbetagt (> 10 Jahre)"
+        ], "Erwachsen (1-7 Jahre)", ICONS["dog"]),
+        
+        # Training level
+        ("training_level", "Trainingslevel", [
+            "Anfänger", "Grundlagen", "Fortgeschritten", "Experte", "Champion"
+        ], "Grundlagen", ICONS["training"]),
+    ],
+}
+
 # Health monitoring thresholds
 HEALTH_THRESHOLDS = {
     "max_hours_without_food": 12,
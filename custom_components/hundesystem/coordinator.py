@@ -0,0 +1,1010 @@
+"""Per-entry data update coordinator for derived Hundesystem metrics."""
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import (
+    DOMAIN,
+    ICONS,
+    MEAL_TYPES,
+    ACTIVITY_TYPES,
+    FEEDING_TYPES,
+    DEFAULT_FEEDING_TIMES,
+    HELPER_DEFINITIONS,
+)
+from .entity_ids import DogEntityIds
+from .history import DailyHistory
+from .household import entry_dog_names, get_dog_data
+from .snapshot import DogStateSnapshot, async_get_snapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Time based metrics (overdue feedings, inactivity) are re-evaluated on this interval
+UPDATE_INTERVAL = timedelta(minutes=5)
+# Helper changes arriving within this window are merged into one refresh
+REFRESH_COOLDOWN = 1.0
+# Scheduled refreshes may fire slightly early; still treat them as full refreshes
+FULL_REFRESH_SLACK = timedelta(seconds=5)
+
+ESSENTIAL_MEALS = ["morning", "lunch", "evening"]
+TRACKED_ACTIVITIES = ["outside", "walk", "play", "training"]
+
+# Grace periods (minutes after scheduled time) before a meal counts as overdue
+FEEDING_GRACE_PERIODS = {
+    "morning": 60,   # 1 hour grace
+    "lunch": 120,    # 2 hours grace
+    "evening": 90,   # 1.5 hours grace
+    "snack": 180,    # 3 hours grace (less critical)
+}
+
+# Inactivity thresholds (hours)
+INACTIVITY_THRESHOLDS = {
+    "last_outside": 6,    # 6 hours without going outside
+    "last_walk": 24,      # 24 hours without a walk
+    "last_play": 48,      # 48 hours without play
+    "last_activity": 8,   # 8 hours without any activity
+}
+
+HEALTH_STATUS_SCORES = {
+    "Ausgezeichnet": 10,
+    "Gut": 8,
+    "Normal": 6,
+    "Schwach": 4,
+    "Krank": 2,
+    "Notfall": 0,
+}
+
+ENERGY_ADJUSTMENTS = {
+    "Hyperaktiv": -0.5,  # Might indicate stress
+    "Energiegeladen": 0.5,
+    "Normal": 0.0,
+    "Müde": -0.5,
+    "Sehr müde": -1.5,
+}
+
+# Helpers each section of the computed data is derived from, as (domain, suffix)
+SECTION_SOURCES: Dict[str, List[Tuple[str, str]]] = {
+    "feeding": [
+        field
+        for meal in FEEDING_TYPES
+        for field in (
+            ("input_boolean", f"feeding_{meal}"),
+            ("counter", f"feeding_{meal}_count"),
+            ("input_datetime", f"feeding_{meal}_time"),
+        )
+    ],
+    "activity": [
+        field
+        for activity in TRACKED_ACTIVITIES
+        for field in (("counter", f"{activity}_count"), ("input_datetime", f"last_{activity}"))
+    ],
+    "health": [
+        ("input_select", "health_status"),
+        ("input_select", "mood"),
+        ("input_select", "energy_level_category"),
+        ("input_select", "appetite_level"),
+        ("input_number", "health_score"),
+        ("input_boolean", "emergency_mode"),
+        ("input_boolean", "feeling_well"),
+    ],
+    "mood": [
+        ("input_select", "mood"),
+        ("input_select", "energy_level_category"),
+        ("input_boolean", "feeling_well"),
+        ("input_boolean", "played_today"),
+        ("input_boolean", "socialized_today"),
+    ],
+    "overdue_feeding": [],
+    "inactivity": [("input_datetime", activity_type) for activity_type in INACTIVITY_THRESHOLDS],
+}
+
+# Sections computed from other sections; recomputed whenever those are
+SECTION_DEPENDENCIES: Dict[str, List[str]] = {
+    "overdue_feeding": ["feeding"],
+}
+
+# Computation order; a section always follows the sections it depends on
+SECTIONS = list(SECTION_SOURCES)
+
+
+def build_section_index(ids: DogEntityIds) -> Dict[str, FrozenSet[str]]:
+    """Map each source helper of a dog to every section it affects, dependents included."""
+    index: Dict[str, Set[str]] = {}
+    for section, fields in SECTION_SOURCES.items():
+        for domain, suffix in fields:
+            index.setdefault(ids.get(domain, suffix), set()).add(section)
+
+    for sections in index.values():
+        for section, dependencies in SECTION_DEPENDENCIES.items():
+            if sections.intersection(dependencies):
+                sections.add(section)
+
+    return {entity_id: frozenset(sections) for entity_id, sections in index.items()}
+
+
+class DogMetrics:
+    """Compute all derived metrics of one dog in a single pass."""
+
+    def __init__(self, snapshot: DogStateSnapshot, history: Optional[DailyHistory] = None) -> None:
+        """Initialize the metrics of one dog."""
+        self.snapshot = snapshot
+        self.history = history
+        self.dog_name = snapshot.dog_name
+        self._section_index = build_section_index(snapshot.ids)
+
+    def helper_entities(self) -> List[str]:
+        """Return the helpers whose changes affect the metrics or the entities reading them."""
+        return [
+            self.snapshot.entity_id(domain, definition[0])
+            for domain, definitions in HELPER_DEFINITIONS.items()
+            for definition in definitions
+        ]
+
+    def affected_sections(self, entity_id: str) -> FrozenSet[str]:
+        """Return the sections to recompute after entity_id changed."""
+        return self._section_index.get(entity_id, frozenset())
+
+    def compute(
+        self,
+        now: datetime,
+        sections: Optional[Iterable[str]] = None,
+        previous: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Compute the given sections (default: all) on top of the previous data.
+
+        A recomputed section equal to its previous value keeps the previous
+        object, and if no section changed the previous data itself is
+        returned, so listeners can detect changes by identity.
+        """
+        if previous is None or sections is None:
+            sections = SECTIONS
+        sections = set(sections)
+
+        data = dict(previous or {})
+        changed = previous is None
+        for section in SECTIONS:
+            if section not in sections:
+                continue
+            value = self._compute_section(section, now, data)
+            if previous is None or value != previous.get(section):
+                data[section] = value
+                changed = True
+
+        if changed:
+            data["last_updated"] = now.isoformat()
+        else:
+            data = previous
+
+        # Keep today's aggregate in the rolling history up to date
+        if self.history is not None:
+            self.history.record(now.date(), self._daily_aggregate(data))
+
+        return data
+
+    def _compute_section(self, section: str, now: datetime, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute one section; data holds the sections computed before it."""
+        if section == "feeding":
+            return self._compute_feeding(now)
+        if section == "activity":
+            return self._compute_activity(now)
+        if section == "health":
+            return self._compute_health()
+        if section == "mood":
+            return self._compute_mood()
+        if section == "overdue_feeding":
+            return self._compute_overdue_feeding(now, data["feeding"])
+        if section == "inactivity":
+            return self._compute_inactivity(now)
+        raise ValueError(f"Unknown section: {section}")
+
+    # History
+
+    def _daily_aggregate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Reduce the computed data to the per-day values kept in the history."""
+        daily_value = self.snapshot.value("sensor", "daily_summary")
+        try:
+            daily_score = float(daily_value)
+        except (TypeError, ValueError):
+            daily_score = None
+
+        return {
+            "daily_score": daily_score,
+            "meals_completed": data["feeding"]["essential_meals_completed"],
+            "feeding_complete": data["feeding"]["all_essential_complete"],
+            "activities": data["activity"]["total_today"],
+            "walks": data["activity"]["activity_counts"].get("walk", 0),
+            "health_score": data["health"]["score"],
+            "mood_score": data["mood"]["mood_score"],
+        }
+
+    def close_day(self, data: Optional[Dict[str, Any]]) -> None:
+        """Store today's final aggregate before the daily counters are reset."""
+        if self.history is not None and data:
+            self.history.record(date.today(), self._daily_aggregate(data), final=True)
+
+    # Feeding
+
+    def _compute_feeding(self, now: datetime) -> Dict[str, Any]:
+        """Collect feeding status, counts and scheduled times."""
+        feeding_status = {}
+        feeding_counts = {}
+        feeding_times = {}
+
+        for meal in FEEDING_TYPES:
+            feeding = self.snapshot.feeding(meal)
+            feeding_status[meal] = feeding["fed"]
+            feeding_counts[meal] = feeding["count"]
+            if feeding["scheduled_time"]:
+                feeding_times[meal] = feeding["scheduled_time"]
+
+        essential_fed = sum(1 for meal in ESSENTIAL_MEALS if feeding_status.get(meal, False))
+
+        if essential_fed == 0:
+            status = "Noch nicht gefüttert"
+            urgency = "high"
+        elif essential_fed < 3:
+            status = f"Teilweise gefüttert ({essential_fed}/3)"
+            urgency = "medium"
+        else:
+            status = "Vollständig gefüttert"
+            urgency = "low"
+
+        if feeding_status.get("snack", False):
+            status += " (mit Leckerli)"
+
+        total_feedings = sum(feeding_counts.values())
+
+        return {
+            "status_text": status,
+            "urgency": urgency,
+            "feeding_status": feeding_status,
+            "feeding_counts": feeding_counts,
+            "scheduled_times": feeding_times,
+            "meals_completed": sum(1 for fed in feeding_status.values() if fed),
+            "essential_meals_completed": essential_fed,
+            "all_essential_complete": essential_fed == len(ESSENTIAL_MEALS),
+            "total_feedings": total_feedings,
+            "next_meal": self._get_next_meal(now, feeding_status, feeding_times),
+            "overfeeding_warning": total_feedings > 6,  # More than 6 feedings per day
+        }
+
+    def _get_next_meal(self, now: datetime, feeding_status: Dict[str, bool], feeding_times: Dict[str, str]) -> Optional[str]:
+        """Get the next scheduled meal."""
+        try:
+            current_time = now.time()
+
+            # Check each meal in order
+            meal_order = ["morning", "lunch", "evening", "snack"]
+
+            for meal in meal_order:
+                if not feeding_status.get(meal, False):  # Meal not yet given
+                    scheduled_time = feeding_times.get(meal)
+                    if scheduled_time:
+                        try:
+                            meal_time = datetime.strptime(scheduled_time, "%H:%M:%S").time()
+                            if current_time <= meal_time:
+                                return f"{MEAL_TYPES[meal]} um {scheduled_time[:5]}"
+                        except ValueError:
+                            continue
+
+            # If all meals are done or we're past all scheduled times
+            if all(feeding_status.get(meal, False) for meal in ESSENTIAL_MEALS):
+                return "Alle Hauptmahlzeiten erledigt"
+            else:
+                # Find first incomplete meal for tomorrow
+                for meal in meal_order:
+                    if not feeding_status.get(meal, False):
+                        scheduled_time = feeding_times.get(meal)
+                        if scheduled_time:
+                            return f"{MEAL_TYPES[meal]} morgen um {scheduled_time[:5]}"
+
+            return None
+
+        except Exception as e:
+            _LOGGER.error("Error calculating next meal for %s: %s", self.dog_name, e)
+            return "Fehler bei Berechnung"
+
+    # Activity
+
+    def _compute_activity(self, now: datetime) -> Dict[str, Any]:
+        """Collect activity counts and derive the activity level."""
+        activity_counts = {}
+        activity_times = {}
+
+        for activity in TRACKED_ACTIVITIES:
+            activity_state = self.snapshot.activity(activity)
+            activity_counts[activity] = activity_state["count"]
+            if activity_state["last_time"]:
+                activity_times[f"last_{activity}"] = activity_state["last_time"]
+
+        needs_activity = self._check_activity_needs(now, activity_counts, activity_times)
+
+        return {
+            "activity_counts": activity_counts,
+            "activity_times": activity_times,
+            "activity_level": self._calculate_activity_level(activity_counts),
+            "most_recent_activity": self._get_most_recent_activity(activity_times),
+            "needs_more_activity": needs_activity["needs_more"],
+            "activity_recommendations": needs_activity["recommendations"],
+            "total_today": sum(activity_counts.values()),
+        }
+
+    def _calculate_activity_level(self, activity_counts: Dict[str, int]) -> str:
+        """Calculate overall activity level."""
+        total = sum(activity_counts.values())
+
+        if total == 0:
+            return "Sehr niedrig"
+        elif total <= 2:
+            return "Niedrig"
+        elif total <= 5:
+            return "Normal"
+        elif total <= 8:
+            return "Hoch"
+        else:
+            return "Sehr hoch"
+
+    def _get_most_recent_activity(self, activity_times: Dict[str, str]) -> Optional[str]:
+        """Get the most recent activity."""
+        try:
+            most_recent = None
+            most_recent_time = None
+
+            for activity, time_str in activity_times.items():
+                try:
+                    activity_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+                    if most_recent_time is None or activity_time > most_recent_time:
+                        most_recent = activity.replace("last_", "")
+                        most_recent_time = activity_time
+                except ValueError:
+                    continue
+
+            if most_recent and most_recent_time:
+                time_ago = datetime.now(most_recent_time.tzinfo) - most_recent_time
+                hours_ago = time_ago.total_seconds() / 3600
+
+                if hours_ago < 1:
+                    time_desc = "vor weniger als 1 Stunde"
+                elif hours_ago < 24:
+                    time_desc = f"vor {int(hours_ago)} Stunden"
+                else:
+                    days_ago = int(hours_ago / 24)
+                    time_desc = f"vor {days_ago} Tag(en)"
+
+                return f"{ACTIVITY_TYPES.get(most_recent, most_recent)} {time_desc}"
+
+            return "Keine Aktivität heute"
+
+        except Exception as e:
+            _LOGGER.error("Error calculating most recent activity: %s", e)
+            return "Fehler bei Berechnung"
+
+    def _check_activity_needs(self, now: datetime, activity_counts: Dict[str, int], activity_times: Dict[str, str]) -> Dict[str, Any]:
+        """Check if dog needs more activity."""
+        recommendations = []
+        needs_more = False
+
+        # Check minimum requirements
+        if activity_counts.get("outside", 0) < 3:
+            needs_more = True
+            recommendations.append("Mehr Gartenbesuche")
+
+        if activity_counts.get("walk", 0) < 1:
+            needs_more = True
+            recommendations.append("Spaziergang")
+
+        # Check time since last outside visit
+        last_outside = activity_times.get("last_outside")
+        if last_outside:
+            try:
+                last_time = datetime.fromisoformat(last_outside.replace("Z", "+00:00"))
+                hours_since = (now - last_time.replace(tzinfo=None)).total_seconds() / 3600
+                if hours_since > 6:
+                    needs_more = True
+                    recommendations.append("War lange nicht draußen")
+            except ValueError:
+                pass
+
+        return {
+            "needs_more": needs_more,
+            "recommendations": recommendations,
+        }
+
+    # Health
+
+    def _compute_health(self) -> Dict[str, Any]:
+        """Calculate the comprehensive health score and concerns."""
+        health = self.snapshot.health()
+        metrics = {
+            "health_status": health["health_status"],
+            "mood": self.snapshot.option("mood", "Glücklich"),
+            "energy_level": health["energy_level"],
+            "appetite": health["appetite_level"],
+            "manual_score": health["health_score"],
+            "emergency_mode": health["emergency_mode"],
+        }
+        score = self._calculate_comprehensive_health_score(metrics)
+
+        if score >= 9:
+            status = "Ausgezeichnet"
+            concerns = []
+        elif score >= 7:
+            status = "Gut"
+            concerns = self._identify_minor_concerns(metrics)
+        elif score >= 5:
+            status = "Durchschnittlich"
+            concerns = self._identify_moderate_concerns(metrics)
+        else:
+            status = "Bedenklich"
+            concerns = self._identify_major_concerns(metrics)
+
+        return {
+            "score": score,
+            "health_status": status,
+            "health_metrics": metrics,
+            "concerns": concerns,
+            "recommendations": self._get_health_recommendations(concerns),
+        }
+
+    def _calculate_comprehensive_health_score(self, metrics: Dict[str, Any]) -> float:
+        """Calculate comprehensive health score."""
+        if metrics.get("emergency_mode", False):
+            return 0.0
+
+        # Start with manual score if available
+        if metrics.get("manual_score") is not None:
+            base_score = metrics["manual_score"]
+        else:
+            # Calculate based on status indicators
+            base_score = HEALTH_STATUS_SCORES.get(metrics.get("health_status", "Gut"), 6)
+
+        # Adjust based on mood
+        mood_adjustments = {
+            "Sehr glücklich": 1.0,
+            "Glücklich": 0.5,
+            "Neutral": 0.0,
+            "Gestresst": -1.0,
+            "Ängstlich": -1.5,
+            "Krank": -3.0,
+        }
+        base_score += mood_adjustments.get(metrics.get("mood", "Glücklich"), 0)
+
+        # Adjust based on energy level
+        base_score += ENERGY_ADJUSTMENTS.get(metrics.get("energy_level", "Normal"), 0)
+
+        # Adjust based on appetite
+        appetite_adjustments = {
+            "Sehr hungrig": 0.0,  # Normal for healthy dogs
+            "Guter Appetit": 0.5,
+            "Normal": 0.0,
+            "Wenig Appetit": -1.0,
+            "Kein Appetit": -2.0,
+        }
+        base_score += appetite_adjustments.get(metrics.get("appetite", "Normal"), 0)
+
+        return max(0.0, min(10.0, base_score))
+
+    def _identify_minor_concerns(self, metrics: Dict[str, Any]) -> List[str]:
+        """Identify minor health concerns."""
+        concerns = []
+
+        if metrics.get("energy_level") in ["Müde", "Sehr müde"]:
+            concerns.append("Niedrige Energie")
+
+        if metrics.get("mood") == "Gestresst":
+            concerns.append("Leichter Stress")
+
+        if metrics.get("appetite") == "Wenig Appetit":
+            concerns.append("Reduzierter Appetit")
+
+        return concerns
+
+    def _identify_moderate_concerns(self, metrics: Dict[str, Any]) -> List[str]:
+        """Identify moderate health concerns."""
+        concerns = []
+
+        if metrics.get("health_status") in ["Normal", "Schwach"]:
+            concerns.append("Gesundheitsstatus unter optimal")
+
+        if metrics.get("mood") == "Ängstlich":
+            concerns.append("Anzeichen von Angst")
+
+        if metrics.get("appetite") == "Kein Appetit":
+            concerns.append("Appetitlosigkeit")
+
+        if metrics.get("energy_level") == "Sehr müde":
+            concerns.append("Extreme Müdigkeit")
+
+        return concerns
+
+    def _identify_major_concerns(self, metrics: Dict[str, Any]) -> List[str]:
+        """Identify major health concerns."""
+        concerns = []
+
+        if metrics.get("health_status") in ["Krank", "Notfall"]:
+            concerns.append("Ernste Gesundheitsprobleme")
+
+        if metrics.get("mood") == "Krank":
+            concerns.append("Krankheitsanzeichen")
+
+        if metrics.get("emergency_mode", False):
+            concerns.append("Notfallsituation")
+
+        return concerns
+
+    def _get_health_recommendations(self, concerns: List[str]) -> List[str]:
+        """Get health recommendations based on concerns."""
+        recommendations = []
+
+        if "Niedrige Energie" in concerns:
+            recommendations.append("Mehr Ruhe und sanfte Aktivitäten")
+
+        if "Leichter Stress" in concerns or "Anzeichen von Angst" in concerns:
+            recommendations.append("Stressreduktion und beruhigende Umgebung")
+
+        if "Reduzierter Appetit" in concerns or "Appetitlosigkeit" in concerns:
+            recommendations.append("Tierarzt konsultieren für Appetitprobleme")
+
+        if "Ernste Gesundheitsprobleme" in concerns:
+            recommendations.append("Sofortige tierärztliche Behandlung erforderlich")
+
+        if "Notfallsituation" in concerns:
+            recommendations.append("Notfall-Tierarzt kontaktieren")
+
+        if not concerns:
+            recommendations.append("Weiterhin gute Pflege beibehalten")
+
+        return recommendations
+
+    # Mood
+
+    def _compute_mood(self) -> Dict[str, Any]:
+        """Calculate the mood score and the factors behind it."""
+        snapshot = self.snapshot
+        primary_mood = snapshot.option("mood", "Glücklich")
+        energy_level = snapshot.option("energy_level_category", "Normal")
+        feeling_well = snapshot.value("input_boolean", "feeling_well") != "off"
+        played_today = snapshot.is_on("played_today")
+        socialized_today = snapshot.is_on("socialized_today")
+
+        mood_score = self._calculate_mood_score(primary_mood, energy_level, feeling_well, played_today, socialized_today)
+        mood_description, mood_icon = self._get_mood_description_and_icon(mood_score)
+
+        return {
+            "mood": primary_mood,
+            "mood_score": mood_score,
+            "mood_description": mood_description,
+            "icon": mood_icon,
+            "energy_level": energy_level,
+            "feeling_well": feeling_well,
+            "played_today": played_today,
+            "socialized_today": socialized_today,
+            "mood_factors": self._analyze_mood_factors(primary_mood, energy_level, feeling_well, played_today, socialized_today),
+        }
+
+    def _calculate_mood_score(self, mood: str, energy: str, feeling_well: bool, played: bool, socialized: bool) -> float:
+        """Calculate numeric mood score."""
+        mood_scores = {
+            "Sehr glücklich": 10,
+            "Glücklich": 8,
+            "Neutral": 6,
+            "Gestresst": 4,
+            "Ängstlich": 2,
+            "Krank": 1,
+        }
+
+        base_score = mood_scores.get(mood, 6)
+
+        # Adjust based on other factors
+        if not feeling_well:
+            base_score -= 2
+
+        if played:
+            base_score += 0.5
+
+        if socialized:
+            base_score += 0.5
+
+        # Energy level adjustments
+        energy_adjustments = {
+            "Hyperaktiv": -0.5,
+            "Energiegeladen": 0.5,
+            "Normal": 0,
+            "Müde": -0.5,
+            "Sehr müde": -1,
+        }
+        base_score += energy_adjustments.get(energy, 0)
+
+        return max(0, min(10, base_score))
+
+    def _get_mood_description_and_icon(self, score: float) -> tuple:
+        """Get mood description and appropriate icon."""
+        if score >= 9:
+            return "Fantastische Stimmung", ICONS["happy"]
+        elif score >= 7:
+            return "Gute Stimmung", ICONS["dog"]
+        elif score >= 5:
+            return "Durchschnittliche Stimmung", ICONS["status"]
+        elif score >= 3:
+            return "Schlechte Stimmung", ICONS["attention"]
+        else:
+            return "Sehr schlechte Stimmung", ICONS["emergency"]
+
+    def _analyze_mood_factors(self, mood: str, energy: str, feeling_well: bool, played: bool, socialized: bool) -> Dict[str, Any]:
+        """Analyze factors affecting mood."""
+        positive_factors = []
+        negative_factors = []
+
+        if mood in ["Sehr glücklich", "Glücklich"]:
+            positive_factors.append("Positive Grundstimmung")
+        elif mood in ["Gestresst", "Ängstlich", "Krank"]:
+            negative_factors.append(f"Beeinträchtigte Stimmung: {mood}")
+
+        if feeling_well:
+            positive_factors.append("Fühlt sich wohl")
+        else:
+            negative_factors.append("Fühlt sich nicht wohl")
+
+        if played:
+            positive_factors.append("Hat heute gespielt")
+        else:
+            negative_factors.append("Hat heute noch nicht gespielt")
+
+        if socialized:
+            positive_factors.append("Sozialer Kontakt heute")
+        else:
+            negative_factors.append("Kein sozialer Kontakt heute")
+
+        if energy in ["Energiegeladen", "Normal"]:
+            positive_factors.append(f"Gutes Energielevel: {energy}")
+        else:
+            negative_factors.append(f"Niedriges Energielevel: {energy}")
+
+        return {
+            "positive_factors": positive_factors,
+            "negative_factors": negative_factors,
+            "overall_assessment": "Positiv" if len(positive_factors) > len(negative_factors) else "Verbesserungswürdig"
+        }
+
+    # Overdue feedings
+
+    def _compute_overdue_feeding(self, now: datetime, feeding: Dict[str, Any]) -> Dict[str, Any]:
+        """Find meals that are past their scheduled time plus grace period."""
+        overdue_meals = []
+        overdue_details = {}
+
+        for meal in FEEDING_TYPES:
+            if feeding["feeding_status"].get(meal, False):  # Only check overdue if not fed
+                continue
+
+            scheduled_time_str = feeding["scheduled_times"].get(meal) or DEFAULT_FEEDING_TIMES[meal]
+
+            try:
+                # Calculate deadline with grace period
+                scheduled_time = datetime.strptime(scheduled_time_str, "%H:%M:%S").time()
+                scheduled_datetime = datetime.combine(now.date(), scheduled_time)
+                deadline = scheduled_datetime + timedelta(minutes=FEEDING_GRACE_PERIODS[meal])
+
+                if now > deadline:
+                    minutes_overdue = int((now - deadline).total_seconds() / 60)
+                    overdue_meals.append(meal)
+                    overdue_details[meal] = {
+                        "scheduled_time": scheduled_time_str,
+                        "deadline": deadline.time().strftime("%H:%M"),
+                        "minutes_overdue": minutes_overdue,
+                        "severity": self._calculate_overdue_severity(minutes_overdue)
+                    }
+
+            except ValueError as e:
+                _LOGGER.warning("Error parsing feeding time for %s meal %s: %s",
+                              self.dog_name, meal, e)
+                continue
+
+        return {
+            "overdue_meals": overdue_meals,
+            "overdue_details": overdue_details,
+            "total_overdue": len(overdue_meals),
+            "overall_severity": self._calculate_overall_severity(overdue_details),
+            "recommendations": self._get_overdue_recommendations(overdue_details),
+        }
+
+    def _calculate_overdue_severity(self, minutes_overdue: int) -> str:
+        """Calculate severity based on how overdue the feeding is."""
+        if minutes_overdue < 30:
+            return "low"
+        elif minutes_overdue < 120:  # 2 hours
+            return "medium"
+        elif minutes_overdue < 360:  # 6 hours
+            return "high"
+        else:
+            return "critical"
+
+    def _calculate_overall_severity(self, details: Dict[str, Any]) -> str:
+        """Calculate overall severity from individual severities."""
+        if not details:
+            return "none"
+
+        severities = [detail["severity"] for detail in details.values()]
+
+        if "critical" in severities:
+            return "critical"
+        elif "high" in severities:
+            return "high"
+        elif "medium" in severities:
+            return "medium"
+        else:
+            return "low"
+
+    def _get_overdue_recommendations(self, overdue_details: Dict[str, Any]) -> List[str]:
+        """Get recommendations based on overdue feedings."""
+        if not overdue_details:
+            return ["Alle Mahlzeiten pünktlich"]
+
+        recommendations = []
+
+        # Check for critical overdue situations
+        critical_meals = [meal for meal, details in overdue_details.items()
+                         if details["severity"] == "critical"]
+
+        if critical_meals:
+            recommendations.append("DRINGEND: Sofort füttern - sehr verspätet!")
+            recommendations.append("Tierarzt konsultieren bei Appetitlosigkeit")
+
+        # Check for high severity
+        high_meals = [meal for meal, details in overdue_details.items()
+                     if details["severity"] == "high"]
+
+        if high_meals and not critical_meals:
+            recommendations.append("Baldmöglichst füttern")
+            recommendations.append("Fütterungszeiten überprüfen")
+
+        # General recommendations
+        if len(overdue_details) > 1:
+            recommendations.append("Mehrere Mahlzeiten verspätet - Routine überprüfen")
+
+        recommendations.append("Fütterungserinnerungen aktivieren")
+
+        return recommendations
+
+    # Inactivity
+
+    def _compute_inactivity(self, now: datetime) -> Dict[str, Any]:
+        """Compare the last activity timestamps against the inactivity thresholds."""
+        activity_status = {}
+        warning_triggers = []
+
+        for activity_type, threshold_hours in INACTIVITY_THRESHOLDS.items():
+            time_value = self.snapshot.timestamp(activity_type)
+
+            if time_value:
+                try:
+                    last_time = datetime.fromisoformat(time_value.replace("Z", "+00:00"))
+                    last_time = last_time.replace(tzinfo=None)  # Convert to naive datetime
+
+                    hours_since = (now - last_time).total_seconds() / 3600
+
+                    activity_status[activity_type] = {
+                        "last_time": time_value,
+                        "hours_since": round(hours_since, 1),
+                        "threshold_hours": threshold_hours,
+                        "is_overdue": hours_since > threshold_hours
+                    }
+
+                    if hours_since > threshold_hours:
+                        warning_triggers.append({
+                            "activity": activity_type,
+                            "hours_overdue": round(hours_since - threshold_hours, 1),
+                            "severity": self._calculate_inactivity_severity(hours_since, threshold_hours)
+                        })
+
+                except (ValueError, TypeError) as e:
+                    _LOGGER.debug("Error parsing activity time for %s: %s", activity_type, e)
+                    activity_status[activity_type] = {
+                        "last_time": "unknown",
+                        "hours_since": 999,
+                        "threshold_hours": threshold_hours,
+                        "is_overdue": True
+                    }
+                    warning_triggers.append({
+                        "activity": activity_type,
+                        "hours_overdue": 999,
+                        "severity": "high"
+                    })
+            else:
+                # No timestamp available - assume long inactivity
+                activity_status[activity_type] = {
+                    "last_time": "never",
+                    "hours_since": 999,
+                    "threshold_hours": threshold_hours,
+                    "is_overdue": True
+                }
+                warning_triggers.append({
+                    "activity": activity_type,
+                    "hours_overdue": 999,
+                    "severity": "medium"
+                })
+
+        return {
+            "activity_status": activity_status,
+            "warning_triggers": warning_triggers,
+            "total_warnings": len(warning_triggers),
+            "overall_severity": self._calculate_overall_severity(
+                {trigger["activity"]: trigger for trigger in warning_triggers}
+            ),
+            "recommendations": self._get_inactivity_recommendations(warning_triggers),
+        }
+
+    def _calculate_inactivity_severity(self, hours_since: float, threshold: float) -> str:
+        """Calculate severity based on how long past threshold."""
+        hours_overdue = hours_since - threshold
+
+        if hours_overdue < 2:
+            return "low"
+        elif hours_overdue < 6:
+            return "medium"
+        elif hours_overdue < 24:
+            return "high"
+        else:
+            return "critical"
+
+    def _get_inactivity_recommendations(self, warning_triggers: List[Dict]) -> List[str]:
+        """Get recommendations based on inactivity warnings."""
+        if not warning_triggers:
+            return ["Aktivitätslevel ist gut"]
+
+        recommendations = []
+
+        # Check specific activity types
+        trigger_activities = [trigger["activity"] for trigger in warning_triggers]
+
+        if "last_outside" in trigger_activities:
+            recommendations.append("Dringend: Hund nach draußen lassen")
+
+        if "last_walk" in trigger_activities:
+            recommendations.append("Spaziergang einplanen")
+
+        if "last_play" in trigger_activities:
+            recommendations.append("Spielzeit organisieren")
+
+        if "last_activity" in trigger_activities:
+            recommendations.append("Allgemeine Aktivität fördern")
+
+        # Check for critical situations
+        if any(trigger["severity"] == "critical" for trigger in warning_triggers):
+            recommendations.insert(0, "KRITISCH: Sofortige Aktivität erforderlich!")
+
+        return recommendations
+
+
+class HundesystemDataUpdateCoordinator(DataUpdateCoordinator):
+    """Compute the derived metrics of every dog of a config entry.
+
+    The data is keyed by dog name. A helper change only marks the sections
+    it feeds dirty (see SECTION_SOURCES), so a refresh recomputes just those
+    sections of the dogs that changed; every section of every dog is
+    recomputed once per UPDATE_INTERVAL for the time based metrics. Sections
+    and dogs whose values did not change keep the same objects. The helpers
+    changed since the previous refresh are published in changed_entities()
+    for entities reading helpers directly.
+    """
+
+    def __init__(self, hass: HomeAssistant, name: str) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{name}",
+            update_interval=UPDATE_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=REFRESH_COOLDOWN, immediate=True
+            ),
+        )
+        self._dogs: Dict[str, DogMetrics] = {}
+        self._dirty: Dict[str, Set[str]] = {}
+        self._changed: Dict[str, Set[str]] = {}
+        self._published_changes: Dict[str, FrozenSet[str]] = {}
+        self._last_full_refresh: Optional[datetime] = None
+        self._unsubs: List[Callable[[], None]] = []
+
+    @property
+    def dog_names(self) -> List[str]:
+        """Return the dogs computed by this coordinator."""
+        return list(self._dogs)
+
+    def snapshot(self, dog_name: str) -> DogStateSnapshot:
+        """Return the state snapshot of one dog."""
+        return self._dogs[dog_name].snapshot
+
+    def history(self, dog_name: str) -> Optional[DailyHistory]:
+        """Return the daily history of one dog."""
+        return self._dogs[dog_name].history
+
+    @property
+    def last_full_refresh(self) -> Optional[datetime]:
+        """Return when every section was last recomputed."""
+        return self._last_full_refresh
+
+    def changed_entities(self, dog_name: str) -> FrozenSet[str]:
+        """Return the helpers of a dog that changed before the latest refresh."""
+        return self._published_changes.get(dog_name, frozenset())
+
+    @callback
+    def async_add_dog(self, snapshot: DogStateSnapshot, history: Optional[DailyHistory] = None) -> None:
+        """Compute one more dog and refresh the affected sections whenever one of its helpers changes."""
+        metrics = DogMetrics(snapshot, history)
+        self._dogs[metrics.dog_name] = metrics
+        self._dirty[metrics.dog_name] = set(SECTIONS)
+
+        @callback
+        def _helper_changed(event) -> None:
+            """Mark the sections fed by the helper dirty and schedule a (debounced) refresh."""
+            entity_id = event.data.get("entity_id")
+            self._changed.setdefault(metrics.dog_name, set()).add(entity_id)
+            self._dirty.setdefault(metrics.dog_name, set()).update(metrics.affected_sections(entity_id))
+            self.hass.async_create_task(self.async_request_refresh())
+
+        self._unsubs.append(snapshot.async_subscribe(metrics.helper_entities(), _helper_changed))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening to helper changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    async def _async_update_data(self) -> Dict[str, Dict[str, Any]]:
+        """Recompute the dirty sections, or everything once the update interval has passed."""
+        now = datetime.now()
+        full_refresh = (
+            self._last_full_refresh is None
+            or now - self._last_full_refresh >= UPDATE_INTERVAL - FULL_REFRESH_SLACK
+        )
+        if full_refresh:
+            self._last_full_refresh = now
+
+        dirty, self._dirty = self._dirty, {}
+        self._published_changes = {
+            dog_name: frozenset(entity_ids) for dog_name, entity_ids in self._changed.items()
+        }
+        self._changed = {}
+
+        data = dict(self.data or {})
+        for dog_name, metrics in self._dogs.items():
+            sections = SECTIONS if full_refresh else dirty.get(dog_name)
+            if not sections:
+                continue
+            try:
+                data[dog_name] = metrics.compute(now, sections, data.get(dog_name))
+            except Exception as e:
+                _LOGGER.error("Error computing metrics for %s: %s", dog_name, e)
+        return data
+
+    @callback
+    def async_close_day(self, dog_names: Optional[Iterable[str]] = None) -> None:
+        """Store today's final aggregate of the given dogs (default: all)."""
+        for dog_name in (self._dogs if dog_names is None else dog_names):
+            if dog_name in self._dogs:
+                self._dogs[dog_name].close_day((self.data or {}).get(dog_name))
+
+
+def async_get_coordinator(hass: HomeAssistant, config_entry: ConfigEntry) -> HundesystemDataUpdateCoordinator:
+    """Return the shared coordinator of a config entry, creating it on first use."""
+    entry_data = hass.data.setdefault(DOMAIN, {}).setdefault(config_entry.entry_id, {})
+    coordinator = entry_data.get("coordinator")
+    if coordinator is None:
+        coordinator = HundesystemDataUpdateCoordinator(hass, config_entry.entry_id)
+        for dog_name in entry_dog_names(config_entry):
+            coordinator.async_add_dog(
+                async_get_snapshot(hass, config_entry, dog_name),
+                get_dog_data(hass, config_entry, dog_name).get("history"),
+            )
+        entry_data["coordinator"] = coordinator
+        entry_data.setdefault("listeners", []).append(coordinator.async_stop)
+    return coordinator
@@ -0,0 +1,104 @@
+"""Bulk daily reset of the helper entities of one or more dogs."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, FEEDING_TYPES
+from .entity_ids import dog_entity_ids
+
+_LOGGER = logging.getLogger(__name__)
+
+# (domain, service, service data, entity suffixes) reset every day
+DAILY_RESET_ACTIONS: List[Tuple[str, str, Dict[str, Any], List[str]]] = [
+    ("input_boolean", "turn_off", {}, [
+        *[f"feeding_{meal}" for meal in FEEDING_TYPES],
+        "outside",
+        "poop_done",
+        "visitor_mode_input",
+        "walked_today",
+        "played_today",
+        "socialized_today",
+        "medication_given",
+    ]),
+    ("counter", "reset", {}, [
+        *[f"feeding_{meal}_count" for meal in FEEDING_TYPES],
+        "outside_count",
+        "walk_count",
+        "play_count",
+        "training_count",
+        "poop_count",
+        "activity_count",
+    ]),
+    ("input_text", "set_value", {"value": ""}, [
+        "daily_notes",
+    ]),
+]
+
+
+def build_daily_reset_calls(
+    hass: HomeAssistant, dog_names: Iterable[str]
+) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Group the existing reset entities of all dogs into one call per service."""
+    tables = [dog_entity_ids(dog_name) for dog_name in dog_names]
+    calls = []
+
+    for domain, service, service_data, suffixes in DAILY_RESET_ACTIONS:
+        entity_ids = [
+            entity_id
+            for ids in tables
+            for entity_id in (ids.get(domain, suffix) for suffix in suffixes)
+            if hass.states.get(entity_id) is not None
+        ]
+        if entity_ids:
+            calls.append((domain, service, {**service_data, "entity_id": entity_ids}))
+
+    return calls
+
+
+def _close_days(hass: HomeAssistant, dog_names: List[str]) -> None:
+    """Store each dog's final daily aggregate before the counters are zeroed."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if not isinstance(entry_data, dict):
+            continue
+        coordinator = entry_data.get("coordinator")
+        if coordinator is not None:
+            coordinator.async_close_day(dog_names)
+
+
+async def async_perform_daily_reset(hass: HomeAssistant, dog_names: Iterable[str]) -> int:
+    """Reset the daily helpers of all given dogs with one concurrent batch of calls.
+
+    Returns the number of entities that were reset.
+    """
+    dog_names = list(dog_names)
+    _close_days(hass, dog_names)
+
+    calls = build_daily_reset_calls(hass, dog_names)
+    if not calls:
+        _LOGGER.warning("Daily reset: no helper entities found for %s", dog_names)
+        return 0
+
+    results = await asyncio.gather(
+        *[
+            hass.services.async_call(domain, service, service_data, blocking=True)
+            for domain, service, service_data in calls
+        ],
+        return_exceptions=True,
+    )
+
+    reset_count = 0
+    for (domain, service, service_data), result in zip(calls, results):
+        if isinstance(result, Exception):
+            _LOGGER.error("Daily reset %s.%s failed: %s", domain, service, result)
+            continue
+        reset_count += len(service_data["entity_id"])
+
+    _LOGGER.info(
+        "🔄 Daily reset for %s: %d entities in %d service calls",
+        ", ".join(dog_names), reset_count, len(calls),
+    )
+    return reset_count
@@ -1,37 +1,293 @@
 """Dashboard creation for Hundesystem."""
+import asyncio
+import hashlib
 import logging
 import os
-from typing import Any, Dict
-from functools import partial
-from homeassistant.core import HomeAssistant
+import tempfile
+import textwrap
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 
-from .const import CONF_DOG_NAME, MEAL_TYPES, ACTIVITY_TYPES
+from .const import DOMAIN, CONF_DOG_NAME, ICONS, MEAL_TYPES, ACTIVITY_TYPES, FEEDING_TYPES
 
 _LOGGER = logging.getLogger(__name__)
 
+DATA_DASHBOARD_WRITER = f"{DOMAIN}_dashboard_writer"
+DATA_FRAGMENT_CACHE = f"{DOMAIN}_dashboard_fragments"
+DASHBOARD_STORE_VERSION = 1   # Storage version of the rendered dashboard hashes
+DASHBOARD_SAVE_DELAY = 5      # Seconds hash updates are batched before saving
+
 
 async def async_create_dashboard(hass: HomeAssistant, dog_name: str, config: Dict[str, Any]) -> None:
-    """Create a comprehensive dashboard for the dog system."""
+    """Create a comprehensive dashboard for the dog system; unchanged files are not rewritten."""
     
     try:
-        main_dashboard = await _generate_main_dashboard(dog_name, config)
-        await _save_dashboard(hass, f"hundesystem_{dog_name}", main_dashboard)
+        views = await _render_dashboards(dog_name, config)
+        writer = await async_get_dashboard_writer(hass)
         
-        # Create mobile dashboard (simplified)
-        mobile_dashboard = await _generate_mobile_dashboard(dog_name, config)
-        await _save_dashboard(hass, f"hundesystem_{dog_name}_mobile", mobile_dashboard)
+        written = await asyncio.gather(*[
+            writer.async_write(filename, content) for filename, content in views
+        ])
         
-        # Create admin dashboard
-        admin_dashboard = await _generate_admin_dashboard(dog_name, config)
-        await _save_dashboard(hass, f"hundesystem_{dog_name}_admin", admin_dashboard)
-        
-        _LOGGER.info("All dashboards created successfully for %s", dog_name)
+        _LOGGER.info(
+            "Dashboards for %s: %d written, %d unchanged",
+            dog_name, sum(written), len(written) - sum(written),
+        )
         
     except Exception as e:
         _LOGGER.error("Failed to create dashboards for %s: %s", dog_name, e)
         raise
 
 
+async def _render_dashboards(dog_name: str, config: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """Render the main, mobile and admin dashboard of a dog as (filename, content)."""
+    return [
+        (f"hundesystem_{dog_name}", await _generate_main_dashboard(dog_name, config)),
+        # Create mobile dashboard (simplified)
+        (f"hundesystem_{dog_name}_mobile", await _generate_mobile_dashboard(dog_name, config)),
+        # Create admin dashboard
+        (f"hundesystem_{dog_name}_admin", await _generate_admin_dashboard(dog_name, config)),
+    ]
+
+
+class DashboardWriter:
+    """Write dashboard files only when their rendered content changed.
+
+    The SHA-256 of every written file is persisted with Store. A dashboard
+    whose rendered content hashes to the stored value is only skipped if the
+    file on disk still has that hash, so a deleted or edited file is
+    regenerated; changed ones are written atomically through a temporary
+    file in the same directory and os.replace.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the writer."""
+        self._hass = hass
+        self._store = Store(hass, DASHBOARD_STORE_VERSION, f"{DOMAIN}_dashboards")
+        self._hashes: Dict[str, str] = {}
+
+    async def async_load(self) -> None:
+        """Load the hashes of the files written so far."""
+        stored = await self._store.async_load() or {}
+        self._hashes = dict(stored.get("hashes", {}))
+
+    async def async_write(self, filename: str, content: str) -> bool:
+        """Write dashboards/<filename>.yaml if its content changed; return True if written."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if self._hashes.get(filename) == digest:
+            on_disk = await self._hass.async_add_executor_job(
+                _file_digest, _dashboard_file(self._hass, filename)
+            )
+            if on_disk == digest:
+                _LOGGER.debug("Dashboard %s unchanged, skipping write", filename)
+                return False
+            _LOGGER.info("Dashboard %s missing or edited on disk, rewriting", filename)
+        
+        await _save_dashboard(self._hass, filename, content)
+        self._hashes[filename] = digest
+        self._store.async_delay_save(self._data_to_save, DASHBOARD_SAVE_DELAY)
+        return True
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to persist."""
+        return {"hashes": self._hashes}
+
+
+def _dashboard_file(hass: HomeAssistant, filename: str) -> str:
+    """Return the path of dashboards/<filename>.yaml."""
+    return os.path.join(hass.config.path("dashboards"), f"{filename}.yaml")
+
+
+def _file_digest(path: str) -> Optional[str]:
+    """Return the SHA-256 of a file, or None if it cannot be read (executor)."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+async def async_get_dashboard_writer(hass: HomeAssistant) -> DashboardWriter:
+    """Return the shared dashboard writer, loading it on first use."""
+    writer = hass.data.get(DATA_DASHBOARD_WRITER)
+    if writer is None:
+        writer = DashboardWriter(hass)
+        await writer.async_load()
+        # Another setup may have loaded it while we were waiting
+        writer = hass.data.setdefault(DATA_DASHBOARD_WRITER, writer)
+    return writer
+
+
+# Card types of the overview dashboard, rendered per dog in this order
+OVERVIEW_CARD_TYPES = ["header", "actions", "feeding", "today"]
+
+
+class DashboardFragmentCache:
+    """Rendered overview card fragments per dog and card type.
+
+    Fragments depend only on the dog and the card type, so each one is
+    rendered once; adding a dog to the overview renders just its fragments.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._fragments: Dict[Tuple[str, str], str] = {}
+        self.renders = 0
+        self.hits = 0
+
+    def get(self, dog_name: str, card_type: str) -> str:
+        """Return the fragment of one card, rendering it on first use."""
+        key = (dog_name, card_type)
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            fragment = textwrap.indent(OVERVIEW_CARD_RENDERERS[card_type](dog_name).strip("\n"), " " * 10)
+            self._fragments[key] = fragment
+            self.renders += 1
+        else:
+            self.hits += 1
+        return fragment
+
+    def retain(self, dog_names: List[str]) -> None:
+        """Forget the fragments of dogs that are no longer shown."""
+        for key in [key for key in self._fragments if key[0] not in dog_names]:
+            del self._fragments[key]
+
+
+async def async_create_overview_dashboard(hass: HomeAssistant, dog_names: List[str]) -> bool:
+    """Create one compact dashboard covering all dogs; return True if the file was written."""
+    if not dog_names:
+        return False
+    
+    cache = hass.data.setdefault(DATA_FRAGMENT_CACHE, DashboardFragmentCache())
+    dog_names = sorted(dog_names)
+    cache.retain(dog_names)
+    
+    sections = []
+    for dog_name in dog_names:
+        cards = "\n".join(cache.get(dog_name, card_type) for card_type in OVERVIEW_CARD_TYPES)
+        sections.append(f"""
+      # {dog_name.title()}
+      - type: vertical-stack
+        cards:
+{cards}
+""")
+    
+    overview = f"""
+# 🐶 Hundesystem Übersicht
+# Automatisch generiert von der Hundesystem Integration
+
+title: "🐶 Hundesystem"
+theme: Backend-selected
+
+views:
+  - title: Übersicht
+    path: household
+    icon: mdi:dog-side
+    panel: false
+    cards:
+{"".join(sections)}"""
+    
+    writer = await async_get_dashboard_writer(hass)
+    written = await writer.async_write("hundesystem_overview", overview)
+    _LOGGER.debug(
+        "Overview dashboard for %d dogs (%s): %d fragments rendered, %d cached",
+        len(dog_names), "written" if written else "unchanged", cache.renders, cache.hits,
+    )
+    return written
+
+
+def _overview_header_card(dog_name: str) -> str:
+    """Render the status header of one dog."""
+    return f"""
+- type: custom:mushroom-template-card
+  primary: "{dog_name.title()}"
+  secondary: "{{{{ states('sensor.{dog_name}_status') }}}}"
+  icon: mdi:dog
+  icon_color: >-
+    {{% if is_state('binary_sensor.{dog_name}_needs_attention', 'on') %}} orange
+    {{% elif is_state('binary_sensor.{dog_name}_feeding_complete', 'on') %}} green
+    {{% else %}} blue {{% endif %}}
+  tap_action:
+    action: navigate
+    navigation_path: /lovelace-hundesystem-{dog_name}/overview
+"""
+
+
+def _overview_actions_card(dog_name: str) -> str:
+    """Render the quick actions of one dog as chips."""
+    return f"""
+- type: custom:mushroom-chips-card
+  chips:
+    - type: template
+      icon: mdi:door-open
+      content: "{{{{ states('counter.{dog_name}_outside_count') }}}}"
+      icon_color: "{{{{ 'green' if is_state('input_boolean.{dog_name}_outside', 'on') else 'blue' }}}}"
+      tap_action:
+        action: call-service
+        service: input_boolean.toggle
+        target:
+          entity_id: input_boolean.{dog_name}_outside
+    - type: template
+      icon: mdi:emoticon-poop
+      content: "{{{{ states('counter.{dog_name}_poop_count') }}}}"
+      icon_color: "{{{{ 'green' if is_state('input_boolean.{dog_name}_poop_done', 'on') else 'brown' }}}}"
+      tap_action:
+        action: call-service
+        service: input_boolean.toggle
+        target:
+          entity_id: input_boolean.{dog_name}_poop_done
+    - type: template
+      icon: mdi:walk
+      content: "{{{{ states('counter.{dog_name}_walk_count') }}}}"
+      tap_action:
+        action: call-service
+        service: hundesystem.log_activity
+        data:
+          activity_type: walk
+          dog_name: {dog_name}
+"""
+
+
+def _overview_feeding_card(dog_name: str) -> str:
+    """Render one chip per meal of one dog."""
+    chips = "".join(f"""
+    - type: template
+      content: "{MEAL_TYPES[meal]}"
+      icon: {ICONS[meal]}
+      icon_color: "{{{{ 'green' if is_state('input_boolean.{dog_name}_feeding_{meal}', 'on') else 'orange' }}}}"
+      tap_action:
+        action: call-service
+        service: input_boolean.toggle
+        target:
+          entity_id: input_boolean.{dog_name}_feeding_{meal}""" for meal in FEEDING_TYPES)
+    return f"""
+- type: custom:mushroom-chips-card
+  chips:{chips}
+"""
+
+
+def _overview_today_card(dog_name: str) -> str:
+    """Render the daily summary of one dog."""
+    return f"""
+- type: custom:mushroom-template-card
+  primary: "Heute"
+  secondary: "{{{{ states('sensor.{dog_name}_daily_summary') }}}}"
+  icon: mdi:calendar-today
+  icon_color: blue
+  layout: horizontal
+"""
+
+
+OVERVIEW_CARD_RENDERERS: Dict[str, Callable[[str], str]] = {
+    "header": _overview_header_card,
+    "actions": _overview_actions_card,
+    "feeding": _overview_feeding_card,
+    "today": _overview_today_card,
+}
+
+
 async def _generate_main_dashboard(dog_name: str, config: Dict[str, Any]) -> str:
     """Generate the main comprehensive dashboard."""
     
@@ -506,8 +762,8 @@ views:
         entities:
           - entity: input_text.{dog_name}_notes
             name: "Allgemeine Notizen"
-          - entity: input_text.{dog_name}_daily_notes
-            name: "Tagesnotizen"
+          - entity: sensor.{dog_name}_journal
+            name: "Tagebuch"
           - entity: input_text.{dog_name}_behavior_notes
             name: "Verhaltensnotizen"
 
@@ -835,17 +1091,25 @@ views:
 
 
 async def _save_dashboard(hass: HomeAssistant, filename: str, content: str) -> None:
-    """Save dashboard to file."""
+    """Save dashboard to file atomically."""
     
     def _write_dashboard_file(path: str, content: str) -> None:
-        """Write dashboard file synchronously."""
-        import os
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
+        """Write dashboard file synchronously through a temporary file and rename."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".hundesystem_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
     
-    dashboard_path = hass.config.path("dashboards")
-    dashboard_file = os.path.join(dashboard_path, f"{filename}.yaml")
+    dashboard_file = _dashboard_file(hass, filename)
     
     try:
         await hass.async_add_executor_job(_write_dashboard_file, dashboard_file, content)
@@ -0,0 +1,42 @@
+"""Diagnostics support for Hundesystem."""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .idempotency import async_get_activity_deduplicator
+from .notification_queue import async_get_notification_queue
+from .profiling import async_get_profiler
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not entry_data:
+        return {"loaded": False}
+
+    timings = entry_data.get("setup_timings")
+    notification_queue = async_get_notification_queue(hass)
+    return {
+        "loaded": True,
+        "dogs": list(entry_data.get("dogs", {})),
+        "setup_timings": timings.as_dict() if timings is not None else None,
+        "update_stats": {
+            dog_name: {
+                sensor_type: dict(counters)
+                for sensor_type, counters in dog_data.get("update_stats", {}).items()
+            }
+            for dog_name, dog_data in entry_data.get("dogs", {}).items()
+        },
+        "profile": async_get_profiler(hass).summary(),
+        "deduplication": async_get_activity_deduplicator(hass).summary(),
+        "notification_queue": {
+            "depth": notification_queue.depth,
+            "stats": notification_queue.stats,
+        },
+    }
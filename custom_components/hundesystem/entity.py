@@ -0,0 +1,173 @@
+"""Shared entity behaviour for Hundesystem platforms."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import CONF_UPDATE_DEBOUNCE, DEFAULT_UPDATE_DEBOUNCE
+from .coordinator import SECTIONS
+from .entity_ids import dog_entity_ids
+from .household import get_dog_data
+from .profiling import CATEGORY_ENTITY_UPDATE, async_get_profiler
+
+_LOGGER = logging.getLogger(__name__)
+
+# Attributes that change on every recompute without describing a change
+VOLATILE_ATTRIBUTES = ["last_updated", "last_calculation", "next_check"]
+
+# Unchanged states are still written this often (seconds) so they never look stale
+WRITE_HEARTBEAT = 3600
+
+
+class HundesystemCoalescedUpdateMixin:
+    """Merge bursts of update requests into one recompute and one state write.
+
+    Every trigger (coordinator update, tracked entity change) calls
+    _async_schedule_update(). The first request starts a timer of
+    _update_debounce seconds; requests arriving while it is pending are only
+    counted. When the timer fires, _async_update_state() runs once and the
+    state is written afterwards, unless state, icon and attributes are the
+    same as in the last write.
+
+    Coordinator refreshes only trigger an update if they touched something
+    the entity reads: one of its _data_sections, one of its _source_fields
+    (helpers read directly from the snapshot), or - for _time_dependent
+    entities - any full refresh. None means every section or helper.
+    """
+
+    hass: HomeAssistant
+    coordinator: Any
+    _dog_name: str
+    _sensor_type: str
+
+    _data_sections: Optional[Tuple[str, ...]] = None
+    _source_fields: Optional[Tuple[Tuple[str, str], ...]] = None
+    _time_dependent: bool = True
+
+    def _init_coalesced_updates(self, config_entry: ConfigEntry) -> None:
+        """Set up the debounce window and the update counters."""
+        self._update_debounce: float = float(
+            config_entry.options.get(CONF_UPDATE_DEBOUNCE, DEFAULT_UPDATE_DEBOUNCE)
+        )
+        self._cancel_pending_update: Optional[Callable[[], None]] = None
+        self._update_stats: Dict[str, int] = {
+            "requested": 0,
+            "coalesced": 0,
+            "executed": 0,
+            "skipped": 0,
+        }
+
+        # Dependencies and the last seen coordinator data
+        ids = dog_entity_ids(self._dog_name)
+        self._source_entity_ids: Optional[FrozenSet[str]] = (
+            None if self._source_fields is None
+            else frozenset(ids.get(domain, suffix) for domain, suffix in self._source_fields)
+        )
+        self._last_data: Optional[Dict[str, Any]] = None
+        self._last_full_refresh: Optional[datetime] = None
+
+        # Output of the last state write
+        self._written: Optional[Tuple[Any, ...]] = None
+        self._written_at: Optional[float] = None
+
+        self._profiler = async_get_profiler(self.hass)
+
+        # Expose the counters per dog for diagnostics
+        dog_data = get_dog_data(self.hass, config_entry, self._dog_name)
+        dog_data.setdefault("update_stats", {})[self._sensor_type] = self._update_stats
+
+    @property
+    def update_stats(self) -> Dict[str, int]:
+        """Return the requested/coalesced/executed/skipped update counters."""
+        return dict(self._update_stats)
+
+    @callback
+    def _coordinator_update_relevant(self) -> bool:
+        """Return True if the latest coordinator refresh touched anything this entity reads."""
+        coordinator = self.coordinator
+        data = (coordinator.data or {}).get(self._dog_name, {})
+        last_data, self._last_data = self._last_data, data
+        full_refresh = coordinator.last_full_refresh
+        last_full_refresh, self._last_full_refresh = self._last_full_refresh, full_refresh
+
+        if last_data is None:
+            return True
+
+        if full_refresh != last_full_refresh and (self._time_dependent or self._heartbeat_due()):
+            return True
+
+        if data is not last_data:
+            sections = SECTIONS if self._data_sections is None else self._data_sections
+            if any(data.get(section) is not last_data.get(section) for section in sections):
+                return True
+
+        changed = coordinator.changed_entities(self._dog_name)
+        if not changed:
+            return False
+        return self._source_entity_ids is None or not self._source_entity_ids.isdisjoint(changed)
+
+    def _heartbeat_due(self) -> bool:
+        """Return True if the state has not been written for WRITE_HEARTBEAT seconds."""
+        return self._written_at is None or time.monotonic() - self._written_at >= WRITE_HEARTBEAT
+
+    def _state_fingerprint(self) -> Tuple[Any, ...]:
+        """Return state, icon and attributes without the volatile attributes."""
+        attributes = self.extra_state_attributes or {}
+        return (
+            self.state,
+            self.icon,
+            {key: value for key, value in attributes.items() if key not in VOLATILE_ATTRIBUTES},
+        )
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Request a recompute; bursts within the debounce window are merged."""
+        self._update_stats["requested"] += 1
+
+        if self._cancel_pending_update is not None:
+            self._update_stats["coalesced"] += 1
+            return
+
+        self._cancel_pending_update = async_call_later(
+            self.hass, self._update_debounce, self._async_debounce_elapsed
+        )
+
+    @callback
+    def _async_debounce_elapsed(self, now: datetime) -> None:
+        """Run the merged update once the window has elapsed."""
+        self._cancel_pending_update = None
+        self.hass.async_create_task(self._async_run_coalesced_update())
+
+    async def _async_run_coalesced_update(self) -> None:
+        """Recompute the state and write it once."""
+        try:
+            with self._profiler.span(CATEGORY_ENTITY_UPDATE, self._sensor_type):
+                await self._async_update_state()
+        except Exception as e:
+            _LOGGER.error("Error updating %s for %s: %s", self._sensor_type, self._dog_name, e)
+            return
+
+        self._update_stats["executed"] += 1
+
+        # Only write if the output changed (or the heartbeat is due)
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._written and not self._heartbeat_due():
+            self._update_stats["skipped"] += 1
+            return
+
+        self._written = fingerprint
+        self._written_at = time.monotonic()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_pending_update(self) -> None:
+        """Cancel a scheduled update (entity removal)."""
+        if self._cancel_pending_update is not None:
+            self._cancel_pending_update()
+            self._cancel_pending_update = None
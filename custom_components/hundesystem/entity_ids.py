@@ -0,0 +1,150 @@
+"""Precomputed entity ID tables, built once per dog."""
+from __future__ import annotations
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from .const import ACTIVITY_TYPES, ENTITIES, FEEDING_TYPES, HELPER_DEFINITIONS
+
+# Entities created by the platforms, by domain
+PLATFORM_ENTITIES = {
+    "binary_sensor": [
+        ENTITIES["feeding_complete"],
+        ENTITIES["daily_tasks_complete"],
+        ENTITIES["visitor_mode"],
+        ENTITIES["outside_status"],
+        ENTITIES["needs_attention"],
+        ENTITIES["health_status"],
+        ENTITIES["emergency_status"],
+        "overdue_feeding",
+        "inactivity_warning",
+        "system_health",
+        "medication_due",
+        "vet_appointment_reminder",
+        "weather_alert",
+        "maintenance_required",
+    ],
+    "sensor": [
+        ENTITIES["status"],
+        ENTITIES["feeding_status"],
+        ENTITIES["activity"],
+        ENTITIES["daily_summary"],
+        ENTITIES["last_activity"],
+        ENTITIES["health_score"],
+        ENTITIES["mood"],
+        ENTITIES["weekly_summary"],
+        ENTITIES["notification_queue"],
+        ENTITIES["journal"],
+        ENTITIES["activity_trend"],
+    ],
+}
+
+# Tables kept; evicted tables are rebuilt identically on the next lookup
+MAX_CACHED_TABLES = 256
+
+
+class DogEntityIds:
+    """Immutable table of one dog's entity IDs.
+
+    Every helper and platform entity ID is formatted once. Fields are looked
+    up by (domain, suffix); the reverse index maps an entity ID back to its
+    field. meals and activities group the IDs read together per meal type
+    and activity type.
+    """
+
+    __slots__ = ("dog_name", "_by_field", "_by_entity_id", "meals", "activities")
+
+    dog_name: str
+    _by_field: Mapping[Tuple[str, str], str]
+    _by_entity_id: Mapping[str, Tuple[str, str]]
+    meals: Mapping[str, Mapping[str, str]]
+    activities: Mapping[str, Mapping[str, str]]
+
+    def __init__(self, dog_name: str) -> None:
+        """Build the table of one dog."""
+        by_field: Dict[Tuple[str, str], str] = {}
+        for domain, definitions in HELPER_DEFINITIONS.items():
+            for definition in definitions:
+                by_field[(domain, definition[0])] = f"{domain}.{dog_name}_{definition[0]}"
+        for domain, suffixes in PLATFORM_ENTITIES.items():
+            for suffix in suffixes:
+                by_field[(domain, suffix)] = f"{domain}.{dog_name}_{suffix}"
+
+        def _get(domain: str, suffix: str) -> str:
+            return by_field.setdefault((domain, suffix), f"{domain}.{dog_name}_{suffix}")
+
+        meals = {
+            meal_type: MappingProxyType({
+                "fed": _get("input_boolean", f"feeding_{meal_type}"),
+                "count": _get("counter", f"feeding_{meal_type}_count"),
+                "scheduled_time": _get("input_datetime", f"feeding_{meal_type}_time"),
+                "last_time": _get("input_datetime", f"last_feeding_{meal_type}"),
+            })
+            for meal_type in FEEDING_TYPES
+        }
+        activities = {
+            activity_type: MappingProxyType({
+                "count": _get("counter", f"{activity_type}_count"),
+                "last_time": _get("input_datetime", f"last_{activity_type}"),
+            })
+            for activity_type in ACTIVITY_TYPES
+        }
+
+        object.__setattr__(self, "dog_name", dog_name)
+        object.__setattr__(self, "_by_field", MappingProxyType(by_field))
+        object.__setattr__(self, "_by_entity_id", MappingProxyType(
+            {entity_id: field for field, entity_id in by_field.items()}
+        ))
+        object.__setattr__(self, "meals", MappingProxyType(meals))
+        object.__setattr__(self, "activities", MappingProxyType(activities))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject changes; the table is shared by all modules."""
+        raise AttributeError("DogEntityIds is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject changes; the table is shared by all modules."""
+        raise AttributeError("DogEntityIds is immutable")
+
+    def __repr__(self) -> str:
+        """Return a short representation."""
+        return f"DogEntityIds({self.dog_name!r}, {len(self._by_field)} entities)"
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return True if entity_id belongs to this dog's table."""
+        return entity_id in self._by_entity_id
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all entity IDs of the table."""
+        return iter(self._by_entity_id)
+
+    def __len__(self) -> int:
+        """Return the number of entity IDs in the table."""
+        return len(self._by_entity_id)
+
+    def get(self, domain: str, suffix: str) -> str:
+        """Return the entity ID of <domain>.<dog>_<suffix>."""
+        entity_id = self._by_field.get((domain, suffix))
+        if entity_id is None:
+            # Not a known field; format it without growing the shared table
+            return f"{domain}.{self.dog_name}_{suffix}"
+        return entity_id
+
+    def field(self, entity_id: str) -> Optional[Tuple[str, str]]:
+        """Return the (domain, suffix) of one of this dog's entity IDs."""
+        return self._by_entity_id.get(entity_id)
+
+    def domain(self, domain: str) -> Mapping[str, str]:
+        """Return suffix -> entity ID of all known entities of one domain."""
+        return {
+            suffix: entity_id
+            for (field_domain, suffix), entity_id in self._by_field.items()
+            if field_domain == domain
+        }
+
+
+@lru_cache(maxsize=MAX_CACHED_TABLES)
+def dog_entity_ids(dog_name: str) -> DogEntityIds:
+    """Return the entity ID table of a dog, building it on first use."""
+    return DogEntityIds(dog_name)
@@ -0,0 +1,178 @@
+"""Persistent append-only activity event log per dog."""
+from __future__ import annotations
+
+import bisect
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .household import find_dog_data, get_dog_data
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_STORE_VERSION = 1      # Storage version of the event log
+EVENT_FLUSH_DELAY = 30       # Seconds appends are batched before writing to disk
+EVENT_RETENTION_DAYS = 365   # Events older than this are dropped on load and flush
+EVENT_MAX_EVENTS = 20000     # In-memory bound; the oldest events are dropped beyond it
+
+
+class DogEventStore:
+    """Append-only log of one dog's activities, persisted with Store.
+
+    Events are kept in timestamp order in memory, so range queries and
+    dropping expired events are a binary search. Appends only schedule a
+    delayed save; all appends within EVENT_FLUSH_DELAY seconds are written to
+    disk together, after expired events were pruned.
+    """
+
+    def __init__(self, hass: HomeAssistant, dog_name: str) -> None:
+        """Initialize the event store."""
+        self._hass = hass
+        self._dog_name = dog_name
+        self._store = Store(hass, EVENT_STORE_VERSION, f"{DOMAIN}_{dog_name}_events")
+        self._events: List[Dict[str, Any]] = []
+        self._timestamps: List[float] = []
+
+    @property
+    def dog_name(self) -> str:
+        """Return the dog name."""
+        return self._dog_name
+
+    def __len__(self) -> int:
+        """Return the number of stored events."""
+        return len(self._events)
+
+    async def async_load(self) -> None:
+        """Load the event log from disk, dropping expired events."""
+        stored = await self._store.async_load() or {}
+
+        events = []
+        for event in stored.get("events", []):
+            try:
+                timestamp = datetime.fromisoformat(event["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                continue
+            events.append((timestamp, event))
+
+        events.sort(key=lambda item: item[0])
+        self._timestamps = [timestamp for timestamp, _ in events]
+        self._events = [event for _, event in events]
+        self._prune()
+
+        if len(self._events) != len(stored.get("events", [])):
+            self._schedule_flush()
+
+        _LOGGER.debug("Loaded %d events for %s", len(self._events), self._dog_name)
+
+    @callback
+    def async_append(
+        self,
+        activity_type: str,
+        duration: int = 0,
+        notes: str = "",
+        timestamp: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Append an event and schedule a batched write."""
+        timestamp = timestamp or datetime.now()
+        event = {
+            "type": activity_type,
+            "timestamp": timestamp.isoformat(),
+            "duration": int(duration or 0),
+            "notes": notes or "",
+        }
+
+        # Events normally arrive in order; insort keeps late ones sorted
+        ts = timestamp.timestamp()
+        if not self._timestamps or ts >= self._timestamps[-1]:
+            self._timestamps.append(ts)
+            self._events.append(event)
+        else:
+            index = bisect.bisect_right(self._timestamps, ts)
+            self._timestamps.insert(index, ts)
+            self._events.insert(index, event)
+
+        if len(self._events) > EVENT_MAX_EVENTS:
+            self._prune()
+        self._schedule_flush()
+        return event
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        activity_type: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the events in [start, end), optionally of one type only."""
+        low = bisect.bisect_left(self._timestamps, start.timestamp()) if start else 0
+        high = bisect.bisect_left(self._timestamps, end.timestamp()) if end else len(self._events)
+
+        events = self._events[low:high]
+        if activity_type is not None:
+            events = [event for event in events if event["type"] == activity_type]
+        return [dict(event) for event in events]
+
+    def summarize(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Return count and total duration per activity type in [start, end)."""
+        summary: Dict[str, Dict[str, int]] = {}
+        for event in self.query(start, end):
+            totals = summary.setdefault(event["type"], {"count": 0, "duration": 0})
+            totals["count"] += 1
+            totals["duration"] += event["duration"]
+        return summary
+
+    def last_event(self, activity_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Return the most recent event, optionally of one type."""
+        for event in reversed(self._events):
+            if activity_type is None or event["type"] == activity_type:
+                return dict(event)
+        return None
+
+    def _prune(self) -> None:
+        """Drop events past the retention period and beyond EVENT_MAX_EVENTS."""
+        cutoff = (datetime.now() - timedelta(days=EVENT_RETENTION_DAYS)).timestamp()
+        expired = max(
+            bisect.bisect_left(self._timestamps, cutoff),
+            len(self._events) - EVENT_MAX_EVENTS,
+        )
+        if expired > 0:
+            del self._timestamps[:expired]
+            del self._events[:expired]
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """Batch pending appends into one delayed write."""
+        self._store.async_delay_save(self._data_to_save, EVENT_FLUSH_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to persist, without expired events."""
+        self._prune()
+        return {"events": self._events}
+
+    async def async_flush(self) -> None:
+        """Write all pending events to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+
+async def async_get_event_store(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> DogEventStore:
+    """Return the event store of one dog of a config entry, loading it on first use."""
+    dog_data = get_dog_data(hass, config_entry, dog_name)
+    event_store = dog_data.get("event_store")
+    if event_store is None:
+        event_store = DogEventStore(hass, dog_name)
+        await event_store.async_load()
+        dog_data["event_store"] = event_store
+    return event_store
+
+
+def get_dog_event_store(hass: HomeAssistant, dog_name: str) -> Optional[DogEventStore]:
+    """Return the loaded event store of a dog, if any."""
+    dog_data = find_dog_data(hass, dog_name)
+    return dog_data.get("event_store") if dog_data else None
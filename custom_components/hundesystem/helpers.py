@@ -1,155 +1,347 @@
 """Ultra-robust helper functions - 100% SUCCESS RATE GUARANTEED."""
 import logging
 import asyncio
+import hashlib
+import json
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Set, Tuple, Any, Optional
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
+from homeassistant.helpers.storage import Store
 
 from .const import (
-    FEEDING_TYPES,
-    MEAL_TYPES,
-    ACTIVITY_TYPES,
-    ICONS,
+    DOMAIN,
+    CONF_DOOR_SENSOR,
+    CONF_FEEDING_TIMES,
+    CONF_MAX_CONCURRENT_CREATES,
     DEFAULT_FEEDING_TIMES,
-    ENTITIES,
+    DEFAULT_MAX_CONCURRENT_CREATES,
+    HELPER_DEFINITIONS,
 )
+from .entity_ids import dog_entity_ids
+from .profiling import CATEGORY_HELPER_DOMAIN, async_get_profiler
+from .readiness import async_wait_for_entities, state_valid
 
 _LOGGER = logging.getLogger(__name__)
 
-# ULTRA-ENHANCED CONFIGURATION FOR 100% SUCCESS
-ENTITY_CREATION_TIMEOUT = 60.0      # Massive timeout for slow systems
-DOMAIN_CREATION_DELAY = 1.5         # Extended delay between domains
-MAX_RETRIES_PER_ENTITY = 10         # Maximum retries for guaranteed success
-BATCH_SIZE = 3                      # Smaller batches for ultra-reliability
-VERIFICATION_DELAY = 3.0            # Extended verification delay
-SYSTEM_STABILITY_WAIT = 5.0         # Extended system stability wait
-INTER_BATCH_DELAY = 5.0             # Long delay between batches
-MAX_DOMAIN_RETRIES = 3              # Retry entire domain if needed
-ULTRA_VERBOSE_LOGGING = True        # Maximum logging for debugging
+# PARALLEL PROVISIONING CONFIGURATION
+ENTITY_CREATION_TIMEOUT = 60.0      # Timeout for a single create service call
+ENTITY_READY_TIMEOUT = 15.0         # Max wait for created entities to report a state
+STATE_SETTLE_TIMEOUT = 2.0          # Max wait for an unknown state to settle
+MAX_DOMAIN_RETRIES = 3              # Re-issue creates for entities still missing
+HELPER_STORE_VERSION = 1            # Storage version of the applied manifest
 
+# Creation limit and pre-flight result shared by all dogs of all entries
+DATA_HELPER_PROVISIONING = f"{DOMAIN}_helper_provisioning"
 
-async def async_create_helpers(hass: HomeAssistant, dog_name: str, config: dict) -> None:
-    """Create all helper entities with GUARANTEED 100% success rate."""
+# Helpers that must exist for the integration to work
+CRITICAL_HELPERS = [
+    ("input_boolean", "feeding_morning"),
+    ("input_boolean", "outside"),
+    ("counter", "outside_count"),
+    ("input_text", "notes"),
+    ("input_datetime", "last_outside"),
+    ("input_select", "health_status"),
+    ("input_number", "weight"),
+]
+
+
+async def async_create_helpers(
+    hass: HomeAssistant, dog_name: str, config: dict, report: bool = True
+) -> Optional[Dict[str, Any]]:
+    """Reconcile the dog's helper entities against the declarative manifest.
+    
+    With report=False the post-creation verification and notification are
+    skipped and the results are returned for async_report_helper_creation.
+    """
     
     try:
-        _LOGGER.info("🚀 Starting ULTRA-ROBUST helper entity creation for %s", dog_name)
-        
-        # PHASE 1: ULTRA PRE-FLIGHT CHECKS
-        if not await _ultra_preflight_checks(hass):
+        _LOGGER.info("🚀 Starting helper reconciliation for %s", dog_name)
+        setup_start = time.monotonic()
+        
+        # PHASE 1: MANIFEST, STORED STATE AND A SINGLE REGISTRY SCAN
+        manifest = build_helper_manifest(dog_name, config)
+        store = Store(hass, HELPER_STORE_VERSION, f"{DOMAIN}_{dog_name}_helpers")
+        stored = await store.async_load() or {}
+        applied: Dict[str, str] = stored.get("helpers", {})
+        
+        existing = _scan_existing_helpers(hass, dog_name)
+        plan = _plan_helper_reconciliation(manifest, existing, applied)
+        
+        if not (plan["create"] or plan["update"] or plan["remove"]):
+            if plan["adopt"]:
+                await store.async_save({"helpers": {**applied, **plan["adopt"]}})
+            _LOGGER.info("✅ Helper entities for %s are up to date (%d entities, %.3fs)", 
+                        dog_name, plan["unchanged"] + len(plan["adopt"]),
+                        time.monotonic() - setup_start)
+            return None
+        
+        _LOGGER.info("📋 Reconciliation plan for %s: %d to create, %d to update, %d to remove", 
+                    dog_name, sum(len(entities) for entities in plan["create"].values()),
+                    len(plan["update"]), len(plan["remove"]))
+        
+        # PHASE 2: PRE-FLIGHT CHECKS (ONLY NEEDED WHEN CREATING)
+        if plan["create"] and not await _async_preflight_once(hass):
             _LOGGER.error("❌ Ultra pre-flight checks failed, aborting helper creation")
-            return
-        
-        # PHASE 2: SYSTEM STABILIZATION
-        _LOGGER.info("⏳ Waiting for system stabilization...")
-        await asyncio.sleep(SYSTEM_STABILITY_WAIT)
-        
-        # PHASE 3: ULTRA-ROBUST ENTITY CREATION
-        creation_steps = [
-            ("input_boolean", _create_input_booleans),
-            ("counter", _create_counters),
-            ("input_datetime", _create_input_datetimes),
-            ("input_text", _create_input_texts),
-            ("input_number", _create_input_numbers),
-            ("input_select", _create_input_selects),
-        ]
-        
-        total_steps = len(creation_steps)
+            return None
+        
         overall_results = {
             "total_created": 0,
             "total_skipped": 0,
             "total_failed": 0,
+            "total_updated": 0,
+            "total_removed": 0,
             "domain_results": {},
-            "retry_attempts": 0
+            "domain_timings": {},
+            "retry_attempts": 0,
+            "total_duration": 0.0,
         }
         
-        # DOMAIN-BY-DOMAIN CREATION WITH RETRY
-        for step_num, (domain, creation_func) in enumerate(creation_steps, 1):
-            _LOGGER.info("📊 Step %d/%d: Creating %s entities for %s", 
-                        step_num, total_steps, domain, dog_name)
-            
-            # RETRY ENTIRE DOMAIN IF NEEDED
-            domain_success = False
-            domain_retry_count = 0
+        # PHASE 3: CONCURRENT CREATE/UPDATE/REMOVE (ALL SHARE ONE LIMIT)
+        semaphore = _async_get_create_semaphore(
+            hass, config.get(CONF_MAX_CONCURRENT_CREATES, DEFAULT_MAX_CONCURRENT_CREATES)
+        )
+        create_domains = list(plan["create"])
+        update_ids = list(plan["update"])
+        
+        create_results, update_errors, remove_errors = await asyncio.gather(
+            asyncio.gather(
+                *(_create_helpers_for_domain_parallel(
+                    hass, domain, list(plan["create"][domain].values()), dog_name, semaphore
+                ) for domain in create_domains),
+                return_exceptions=True,
+            ),
+            asyncio.gather(*(
+                _async_update_entity(hass, entity_id, plan["update"][entity_id], dog_name, semaphore)
+                for entity_id in update_ids
+            )),
+            asyncio.gather(*(
+                _async_remove_entity(hass, entity_id, semaphore) for entity_id in plan["remove"]
+            )),
+        )
+        
+        profiler = async_get_profiler(hass)
+        failed_entities = set()
+        for domain, domain_results in zip(create_domains, create_results):
+            if isinstance(domain_results, Exception):
+                _LOGGER.error("❌ Critical error creating %s entities: %s", domain, domain_results)
+                domain_results = {
+                    "created": 0, "skipped": 0, "failed": len(plan["create"][domain]),
+                    "failed_entities": list(plan["create"][domain]), "attempts": 0,
+                    "duration": 0.0, "error": str(domain_results)
+                }
             
-            while not domain_success and domain_retry_count < MAX_DOMAIN_RETRIES:
-                try:
-                    domain_results = await creation_func(hass, dog_name)
-                    
-                    # CHECK DOMAIN SUCCESS RATE
-                    total_attempted = domain_results["created"] + domain_results["failed"]
-                    if total_attempted > 0:
-                        success_rate = (domain_results["created"] / total_attempted) * 100
-                        
-                        if success_rate >= 100.0 or domain_results["failed"] == 0:
-                            domain_success = True
-                        else:
-                            _LOGGER.warning("⚠️ Domain %s success rate %.1f%%, retrying...", 
-                                          domain, success_rate)
-                            domain_retry_count += 1
-                            
-                            if domain_retry_count < MAX_DOMAIN_RETRIES:
-                                _LOGGER.info("🔄 Retrying domain %s (attempt %d/%d)", 
-                                            domain, domain_retry_count + 1, MAX_DOMAIN_RETRIES)
-                                await asyncio.sleep(10.0)  # Long wait before domain retry
-                                continue
-                    else:
-                        domain_success = True  # No entities to create
-                    
-                    # UPDATE OVERALL RESULTS
-                    overall_results["domain_results"][domain] = domain_results
-                    overall_results["total_created"] += domain_results["created"]
-                    overall_results["total_skipped"] += domain_results["skipped"]
-                    overall_results["total_failed"] += domain_results["failed"]
-                    overall_results["retry_attempts"] += domain_retry_count
-                    
-                    _LOGGER.info("✅ %s: %d created, %d skipped, %d failed (%.1f%% success)", 
-                               domain, domain_results["created"], 
-                               domain_results["skipped"], domain_results["failed"],
-                               success_rate if total_attempted > 0 else 100.0)
-                    
-                except Exception as e:
-                    _LOGGER.error("❌ Critical error creating %s entities (attempt %d): %s", 
-                                domain, domain_retry_count + 1, e)
-                    domain_retry_count += 1
-                    
-                    if domain_retry_count < MAX_DOMAIN_RETRIES:
-                        await asyncio.sleep(15.0)  # Extended wait on error
-                        continue
-                    else:
-                        # Final fallback - mark as failed but continue
-                        overall_results["domain_results"][domain] = {
-                            "created": 0, "skipped": 0, "failed": 999, "error": str(e)
-                        }
-                        domain_success = True  # Continue to next domain
+            domain_results["skipped"] = len(manifest[domain]) - len(plan["create"][domain])
+            failed_entities.update(domain_results["failed_entities"])
             
-            # INTER-DOMAIN STABILIZATION
-            if step_num < total_steps:
-                _LOGGER.debug("⏳ Inter-domain stabilization wait...")
-                await asyncio.sleep(INTER_BATCH_DELAY)
+            overall_results["domain_results"][domain] = domain_results
+            overall_results["domain_timings"][domain] = domain_results["duration"]
+            if "error" not in domain_results:
+                profiler.record(CATEGORY_HELPER_DOMAIN, domain, domain_results["duration"])
+            overall_results["total_created"] += domain_results["created"]
+            overall_results["total_failed"] += domain_results["failed"]
+            overall_results["retry_attempts"] += max(0, domain_results["attempts"] - 1)
+        
+        overall_results["total_skipped"] = (
+            sum(len(entities) for entities in manifest.values())
+            - overall_results["total_created"] - overall_results["total_failed"]
+        )
         
-        # PHASE 4: COMPREHENSIVE VERIFICATION
-        _LOGGER.info("🔍 Performing comprehensive post-creation verification...")
-        await asyncio.sleep(10.0)  # Extended wait for entity stabilization
+        # PHASE 4: PERSIST THE APPLIED MANIFEST
+        failed_updates = {
+            entity_id for entity_id, error in zip(update_ids, update_errors) if error is not None
+        }
+        failed_removals = {
+            entity_id for entity_id, error in zip(plan["remove"], remove_errors) if error is not None
+        }
+        overall_results["total_updated"] = len(update_ids) - len(failed_updates)
+        overall_results["total_removed"] = len(plan["remove"]) - len(failed_removals)
+        
+        new_applied = {**plan["adopt"]}
+        for entities in manifest.values():
+            for entity_id, entity_data in entities.items():
+                if entity_id in failed_entities or entity_id in plan["adopt"]:
+                    continue
+                if entity_id in failed_updates:
+                    new_applied[entity_id] = applied[entity_id]
+                else:
+                    new_applied[entity_id] = _helper_fingerprint(entity_data)
+        for entity_id in failed_removals:
+            new_applied[entity_id] = applied[entity_id]
+        
+        await store.async_save({"helpers": new_applied})
+        overall_results["total_duration"] = round(time.monotonic() - setup_start, 3)
+        
+        _LOGGER.info("🎯 Helper reconciliation completed for %s in %.2fs", 
+                    dog_name, overall_results["total_duration"])
+        _LOGGER.info("📊 Final Statistics: %d created, %d updated, %d removed, %d skipped, %d failed", 
+                    overall_results["total_created"],
+                    overall_results["total_updated"],
+                    overall_results["total_removed"],
+                    overall_results["total_skipped"], 
+                    overall_results["total_failed"])
         
-        verification_results = await _ultra_post_creation_verification(hass, dog_name, overall_results)
+        if not create_domains:
+            return None
         
-        # PHASE 5: SUCCESS ANALYSIS
+        if report:
+            await async_report_helper_creation(hass, dog_name, overall_results)
+        return overall_results
+        
+    except Exception as e:
+        _LOGGER.error("❌ CRITICAL ERROR in helper reconciliation for %s: %s", dog_name, e)
+        await _send_error_notification(hass, dog_name, str(e))
+        raise
+
+
+async def async_report_helper_creation(
+    hass: HomeAssistant, dog_name: str, overall_results: Dict[str, Any]
+) -> None:
+    """Verify freshly created helpers and send the detailed completion report."""
+    
+    try:
+        # PHASE 5: COMPREHENSIVE VERIFICATION
+        _LOGGER.info("🔍 Performing comprehensive post-creation verification...")
+        await _ultra_post_creation_verification(hass, dog_name, overall_results)
+        
+        # PHASE 6: SUCCESS ANALYSIS
         total_success_rate = _calculate_final_success_rate(overall_results)
         
-        _LOGGER.info("🎯 ULTRA-ROBUST Helper creation completed for %s", dog_name)
-        _LOGGER.info("📊 Final Statistics: %d created, %d skipped, %d failed", 
-                    overall_results["total_created"],
-                    overall_results["total_skipped"], 
-                    overall_results["total_failed"])
+        _LOGGER.info("⏱️ Domain timings: %s", overall_results["domain_timings"])
         _LOGGER.info("🏆 FINAL SUCCESS RATE: %.2f%%", total_success_rate)
         
         # SEND ULTRA-DETAILED NOTIFICATION
         await _send_ultra_completion_notification(hass, dog_name, overall_results, total_success_rate)
         
     except Exception as e:
-        _LOGGER.error("❌ CRITICAL ERROR in ultra-robust helper creation for %s: %s", dog_name, e)
-        await _send_error_notification(hass, dog_name, str(e))
-        raise
+        _LOGGER.error("❌ Error reporting helper creation for %s: %s", dog_name, e)
+
+
+def build_helper_manifest(dog_name: str, config: dict) -> Dict[str, Dict[str, Tuple]]:
+    """Build the dog's helper manifest: domain -> entity_id -> entity data.
+    
+    Helpers are created by display name, so two helpers of a domain with the
+    same name would collide on one entity and never converge; such a
+    definition raises ValueError.
+    """
+    ids = dog_entity_ids(dog_name)
+    feeding_times = {**DEFAULT_FEEDING_TIMES, **(config.get(CONF_FEEDING_TIMES) or {})}
+    has_door_sensor = bool(config.get(CONF_DOOR_SENSOR))
+    
+    manifest: Dict[str, Dict[str, Tuple]] = {}
+    for domain, definitions in HELPER_DEFINITIONS.items():
+        entities = {}
+        names: Dict[str, str] = {}
+        for suffix, *params in definitions:
+            if suffix == "last_door_ask" and not has_door_sensor:
+                continue
+            if params[0] in names:
+                raise ValueError(
+                    f"Duplicate {domain} helper name '{params[0]}' for {names[params[0]]} and {suffix}"
+                )
+            names[params[0]] = suffix
+            if domain == "input_datetime" and suffix.startswith("feeding_") and suffix.endswith("_time"):
+                meal_type = suffix[len("feeding_"):-len("_time")]
+                params[3] = feeding_times.get(meal_type, params[3])
+            entities[ids.get(domain, suffix)] = (f"{dog_name}_{suffix}", *params)
+        manifest[domain] = entities
+    
+    return manifest
+
+
+def _helper_fingerprint(entity_data: Tuple) -> str:
+    """Stable hash of an entity's manifest parameters."""
+    payload = json.dumps(list(entity_data), default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _scan_existing_helpers(hass: HomeAssistant, dog_name: str) -> Set[str]:
+    """Collect the dog's helper entity IDs with one registry and one state scan."""
+    prefixes = tuple(f"{domain}.{dog_name}_" for domain in HELPER_DEFINITIONS)
+    
+    entity_registry = async_get_entity_registry(hass)
+    existing = {
+        entity_id for entity_id in entity_registry.entities
+        if entity_id.startswith(prefixes)
+    }
+    existing.update(
+        entity_id for entity_id in hass.states.async_entity_ids(list(HELPER_DEFINITIONS))
+        if entity_id.startswith(prefixes)
+    )
+    return existing
+
+
+def _plan_helper_reconciliation(
+    manifest: Dict[str, Dict[str, Tuple]],
+    existing: Set[str],
+    applied: Dict[str, str]
+) -> Dict[str, Any]:
+    """Diff manifest, existing entities and last applied fingerprints."""
+    plan = {
+        "create": {},       # domain -> entity_id -> entity data
+        "update": {},       # entity_id -> entity data
+        "remove": [],       # entity_ids we created that left the manifest
+        "adopt": {},        # pre-existing entities taken over as-is
+        "unchanged": 0,
+    }
+    
+    for domain, entities in manifest.items():
+        for entity_id, entity_data in entities.items():
+            if entity_id not in existing:
+                plan["create"].setdefault(domain, {})[entity_id] = entity_data
+            elif entity_id not in applied:
+                plan["adopt"][entity_id] = _helper_fingerprint(entity_data)
+            elif applied[entity_id] != _helper_fingerprint(entity_data):
+                plan["update"][entity_id] = entity_data
+            else:
+                plan["unchanged"] += 1
+    
+    plan["remove"] = [
+        entity_id for entity_id in applied
+        if entity_id in existing
+        and entity_id not in manifest.get(entity_id.split(".", 1)[0], {})
+    ]
+    
+    return plan
+
+
+def _async_get_create_semaphore(hass: HomeAssistant, limit: int) -> asyncio.Semaphore:
+    """Return the semaphore all helper create/update/remove calls share.
+    
+    Dogs are reconciled concurrently, so a per-call semaphore would allow
+    limit × dogs calls at once. Changing the limit replaces the semaphore;
+    calls already holding the old one finish on it.
+    """
+    shared = hass.data.setdefault(DATA_HELPER_PROVISIONING, {})
+    limit = max(1, int(limit))
+    if shared.get("limit") != limit:
+        shared["semaphore"] = asyncio.Semaphore(limit)
+        shared["limit"] = limit
+    return shared["semaphore"]
+
+
+async def _async_preflight_once(hass: HomeAssistant) -> bool:
+    """Run the pre-flight checks once for all dogs; a failed check is retried next time."""
+    shared = hass.data.setdefault(DATA_HELPER_PROVISIONING, {})
+    if shared.get("preflight_passed"):
+        return True
+    
+    task = shared.get("preflight")
+    if task is None:
+        task = hass.async_create_task(_ultra_preflight_checks(hass))
+        shared["preflight"] = task
+    
+    try:
+        passed = await asyncio.shield(task)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("❌ Pre-flight checks raised")
+        passed = False
+    
+    if shared.get("preflight") is task:
+        shared.pop("preflight")
+        shared["preflight_passed"] = passed
+    return passed
 
 
 async def _ultra_preflight_checks(hass: HomeAssistant) -> bool:
@@ -209,9 +401,8 @@ async def _ultra_preflight_checks(hass: HomeAssistant) -> bool:
         )
         
         # Clean up test entity
-        await asyncio.sleep(1.0)
         test_entity_id = "input_boolean.hundesystem_test_entity"
-        if hass.states.get(test_entity_id):
+        if not await async_wait_for_entities(hass, [test_entity_id], 5.0):
             await hass.services.async_call("input_boolean", "remove", 
                                          {"entity_id": test_entity_id}, blocking=False)
         
@@ -236,136 +427,77 @@ async def _ultra_preflight_checks(hass: HomeAssistant) -> bool:
     return True
 
 
-async def _create_helpers_for_domain_ultra_robust(
+async def _create_helpers_for_domain_parallel(
     hass: HomeAssistant, 
     domain: str, 
     entities: List[Tuple], 
-    dog_name: str
+    dog_name: str,
+    semaphore: asyncio.Semaphore
 ) -> Dict[str, Any]:
-    """Ultra-robust entity creation with GUARANTEED success."""
+    """Create all entities of a domain concurrently and verify them in one wait."""
     
+    domain_start = time.monotonic()
     results = {
         "created": 0,
         "skipped": 0,
         "failed": 0,
         "failed_entities": [],
         "domain": domain,
+        "attempts": 0,
+        "duration": 0.0,
         "retry_details": {},
-        "verification_details": {}
     }
     
-    _LOGGER.info("🔧 Creating %d %s entities for %s (ULTRA-ROBUST MODE)", 
-                len(entities), domain, dog_name)
+    pending: Dict[str, Tuple] = {
+        f"{domain}.{entity_data[0]}": entity_data for entity_data in entities
+    }
+    
+    _LOGGER.info("🔧 Creating %d %s entities for %s", len(pending), domain, dog_name)
     
-    # PROCESS IN ULTRA-SMALL BATCHES
-    for batch_start in range(0, len(entities), BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, len(entities))
-        batch = entities[batch_start:batch_end]
+    for attempt in range(MAX_DOMAIN_RETRIES):
+        if not pending:
+            break
         
-        _LOGGER.debug("📦 Processing batch %d-%d for %s", batch_start + 1, batch_end, domain)
+        results["attempts"] += 1
+        entity_ids = list(pending)
         
-        for entity_data in batch:
-            entity_name = entity_data[0]
-            friendly_name = entity_data[1]
-            entity_id = f"{domain}.{entity_name}"
-            
-            # SKIP CHECK WITH ULTRA-VERIFICATION
-            if await _ultra_entity_exists_check(hass, entity_id):
-                _LOGGER.debug("⏭️ Entity %s already exists, skipping", entity_id)
-                results["skipped"] += 1
-                continue
-            
-            # ULTRA-ENHANCED RETRY MECHANISM
-            success = False
-            retry_details = []
-            
-            for attempt in range(MAX_RETRIES_PER_ENTITY):
-                attempt_start = datetime.now()
-                
-                try:
-                    # BUILD SERVICE DATA WITH VALIDATION
-                    service_data = await _build_service_data_ultra_safe(domain, entity_data, dog_name)
-                    
-                    # PRE-CREATION VALIDATION
-                    if not await _validate_service_data(hass, domain, service_data):
-                        retry_details.append(f"Attempt {attempt + 1}: Invalid service data")
-                        continue
-                    
-                    # ULTRA-SAFE SERVICE CALL
-                    await asyncio.wait_for(
-                        hass.services.async_call(domain, "create", service_data, blocking=True),
-                        timeout=ENTITY_CREATION_TIMEOUT
-                    )
-                    
-                    # EXTENDED VERIFICATION WAIT
-                    await asyncio.sleep(VERIFICATION_DELAY)
-                    
-                    # COMPREHENSIVE ENTITY VERIFICATION
-                    verification_result = await _ultra_verify_entity_creation(hass, entity_id, service_data)
-                    
-                    if verification_result["exists"] and verification_result["correct_state"]:
-                        attempt_duration = (datetime.now() - attempt_start).total_seconds()
-                        _LOGGER.debug("✅ Created %s: %s (%.2fs)", domain, entity_id, attempt_duration)
-                        
-                        results["created"] += 1
-                        results["verification_details"][entity_id] = verification_result
-                        success = True
-                        break
-                    else:
-                        retry_details.append(f"Attempt {attempt + 1}: Verification failed - {verification_result}")
-                        _LOGGER.warning("⚠️ Entity %s verification failed (attempt %d/%d): %s", 
-                                      entity_id, attempt + 1, MAX_RETRIES_PER_ENTITY, verification_result)
-                        
-                except asyncio.TimeoutError:
-                    retry_details.append(f"Attempt {attempt + 1}: Timeout after {ENTITY_CREATION_TIMEOUT}s")
-                    _LOGGER.warning("⏱️ Timeout creating %s (attempt %d/%d): %s", 
-                                   domain, attempt + 1, MAX_RETRIES_PER_ENTITY, entity_id)
-                    
-                except Exception as e:
-                    retry_details.append(f"Attempt {attempt + 1}: Exception - {str(e)}")
-                    _LOGGER.warning("❌ Error creating %s (attempt %d/%d): %s - %s", 
-                                   domain, attempt + 1, MAX_RETRIES_PER_ENTITY, entity_id, e)
-                
-                # EXPONENTIAL BACKOFF WITH JITTER
-                if attempt < MAX_RETRIES_PER_ENTITY - 1:
-                    base_delay = 2.0 ** attempt  # 2s, 4s, 8s, 16s, 32s...
-                    jitter = 0.5 * (attempt + 1)  # Add jitter to prevent thundering herd
-                    total_delay = min(base_delay + jitter, 60.0)  # Cap at 60s
-                    
-                    _LOGGER.debug("⏳ Waiting %.1fs before retry %d", total_delay, attempt + 2)
-                    await asyncio.sleep(total_delay)
-            
-            # RECORD RESULTS
-            if success:
-                results["retry_details"][entity_id] = {
-                    "attempts": len(retry_details) + 1,
-                    "details": retry_details,
-                    "final_status": "success"
-                }
+        # FIRE ALL CREATE CALLS UNDER THE SHARED CONCURRENCY LIMIT
+        errors = await asyncio.gather(*(
+            _async_create_entity(hass, domain, pending[entity_id], dog_name, semaphore)
+            for entity_id in entity_ids
+        ))
+        
+        requested = []
+        for entity_id, error in zip(entity_ids, errors):
+            if error is None:
+                requested.append(entity_id)
             else:
-                _LOGGER.error("❌ FAILED to create %s after %d attempts: %s", 
-                             domain, MAX_RETRIES_PER_ENTITY, entity_id)
-                results["failed"] += 1
-                results["failed_entities"].append(entity_id)
-                results["retry_details"][entity_id] = {
-                    "attempts": MAX_RETRIES_PER_ENTITY,
-                    "details": retry_details,
-                    "final_status": "failed"
-                }
-            
-            # INTER-ENTITY STABILIZATION
-            await asyncio.sleep(DOMAIN_CREATION_DELAY)
+                results["retry_details"].setdefault(entity_id, []).append(
+                    f"Attempt {attempt + 1}: {error}"
+                )
+        
+        # SINGLE EVENT-DRIVEN WAIT FOR THE WHOLE DOMAIN
+        missing = await async_wait_for_entities(hass, requested, ENTITY_READY_TIMEOUT)
         
-        # INTER-BATCH STABILIZATION
-        if batch_end < len(entities):
-            _LOGGER.debug("⏳ Inter-batch stabilization...")
-            await asyncio.sleep(INTER_BATCH_DELAY)
+        for entity_id in requested:
+            if entity_id in missing:
+                results["retry_details"].setdefault(entity_id, []).append(
+                    f"Attempt {attempt + 1}: Not ready after {ENTITY_READY_TIMEOUT}s"
+                )
+            else:
+                results["created"] += 1
+                del pending[entity_id]
+        
+        if pending and attempt < MAX_DOMAIN_RETRIES - 1:
+            _LOGGER.warning("⚠️ %d %s entities still missing, retrying (attempt %d/%d)", 
+                          len(pending), domain, attempt + 2, MAX_DOMAIN_RETRIES)
     
-    success_rate = ((results["created"] + results["skipped"]) / len(entities)) * 100 if entities else 100
+    results["failed"] = len(pending)
+    results["failed_entities"] = list(pending)
+    results["duration"] = round(time.monotonic() - domain_start, 3)
     
-    _LOGGER.info("📊 Domain %s results for %s: %d created, %d skipped, %d failed (%.1f%% success)", 
-                 domain, dog_name, results["created"], results["skipped"], 
-                 results["failed"], success_rate)
+    _LOGGER.info("📊 Domain %s results for %s: %d created, %d failed (%.2fs)", 
+                 domain, dog_name, results["created"], results["failed"], results["duration"])
     
     if results["failed_entities"]:
         _LOGGER.error("❌ Failed entities in %s: %s", domain, results["failed_entities"])
@@ -373,35 +505,82 @@ async def _create_helpers_for_domain_ultra_robust(
     return results
 
 
-async def _ultra_entity_exists_check(hass: HomeAssistant, entity_id: str) -> bool:
-    """Ultra-thorough entity existence check."""
+async def _async_create_entity(
+    hass: HomeAssistant,
+    domain: str,
+    entity_data: Tuple,
+    dog_name: str,
+    semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Issue one create call; return an error description or None on success."""
     try:
-        # Check 1: State registry
-        state = hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
-            return True
-        
-        # Check 2: Wait and re-check (for eventual consistency)
-        await asyncio.sleep(1.0)
-        state = hass.states.get(entity_id)
-        if state and state.state not in ["unknown", "unavailable"]:
-            return True
-        
-        # Check 3: Entity registry (for disabled entities)
-        try:
-            from homeassistant.helpers.entity_registry import async_get as async_get_entity_registry
-            entity_registry = async_get_entity_registry(hass)
-            registry_entry = entity_registry.async_get(entity_id)
-            if registry_entry:
-                return True
-        except Exception:
-            pass  # Entity registry check is optional
-        
-        return False
-        
+        service_data = await _build_service_data_ultra_safe(domain, entity_data, dog_name)
+    except ValueError as e:
+        return f"Invalid entity data - {e}"
+    
+    if not await _validate_service_data(hass, domain, service_data):
+        return "Invalid service data"
+    
+    return await _async_call_helper_service(hass, domain, "create", service_data, semaphore)
+
+
+async def _async_update_entity(
+    hass: HomeAssistant,
+    entity_id: str,
+    entity_data: Tuple,
+    dog_name: str,
+    semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Push changed manifest parameters to an existing helper, keeping its value."""
+    domain = entity_id.split(".", 1)[0]
+    if not hass.services.has_service(domain, "update"):
+        _LOGGER.debug("No update service for %s, keeping %s as is", domain, entity_id)
+        return "Update service not available"
+    
+    try:
+        service_data = await _build_service_data_ultra_safe(domain, entity_data, dog_name)
+    except ValueError as e:
+        return f"Invalid entity data - {e}"
+    
+    service_data.pop("initial", None)
+    service_data["entity_id"] = entity_id
+    return await _async_call_helper_service(hass, domain, "update", service_data, semaphore)
+
+
+async def _async_remove_entity(
+    hass: HomeAssistant, entity_id: str, semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Remove a helper that is no longer part of the manifest."""
+    domain = entity_id.split(".", 1)[0]
+    return await _async_call_helper_service(
+        hass, domain, "remove", {"entity_id": entity_id}, semaphore
+    )
+
+
+async def _async_call_helper_service(
+    hass: HomeAssistant,
+    domain: str,
+    service: str,
+    service_data: Dict[str, Any],
+    semaphore: asyncio.Semaphore
+) -> Optional[str]:
+    """Call a helper service under the shared concurrency limit."""
+    try:
+        async with semaphore:
+            await asyncio.wait_for(
+                hass.services.async_call(domain, service, service_data, blocking=True),
+                timeout=ENTITY_CREATION_TIMEOUT
+            )
+        return None
+        
+    except asyncio.TimeoutError:
+        _LOGGER.warning("⏱️ Timeout calling %s.%s for %s", domain, service, 
+                       service_data.get("entity_id", service_data.get("name")))
+        return f"Timeout after {ENTITY_CREATION_TIMEOUT}s"
     except Exception as e:
-        _LOGGER.debug("Error in entity existence check for %s: %s", entity_id, e)
-        return False
+        _LOGGER.warning("❌ Error calling %s.%s for %s: %s", domain, service, 
+                       service_data.get("entity_id", service_data.get("name")), e)
+        return f"Exception - {e}"
 
 
 async def _build_service_data_ultra_safe(domain: str, entity_data: Tuple, dog_name: str) -> Dict[str, Any]:
@@ -570,7 +749,12 @@ async def _validate_service_data(hass: HomeAssistant, domain: str, service_data:
         return False
 
 
-async def _ultra_verify_entity_creation(hass: HomeAssistant, entity_id: str, expected_data: Dict[str, Any]) -> Dict[str, Any]:
+async def _ultra_verify_entity_creation(
+    hass: HomeAssistant,
+    entity_id: str,
+    expected_data: Dict[str, Any],
+    settle_timeout: float = STATE_SETTLE_TIMEOUT
+) -> Dict[str, Any]:
     """Ultra-comprehensive entity verification."""
     
     verification_result = {
@@ -592,18 +776,15 @@ async def _ultra_verify_entity_creation(hass: HomeAssistant, entity_id: str, exp
         verification_result["details"]["state"] = state.state
         verification_result["details"]["attributes"] = dict(state.attributes)
         
-        # Check 2: State validity
-        if state.state in ["unknown", "unavailable"]:
-            # Wait and re-check
-            await asyncio.sleep(2.0)
+        # Check 2: State validity (wait for the next state event if not settled yet)
+        if state_valid(state) or not await async_wait_for_entities(
+            hass, [entity_id], settle_timeout, ready=state_valid
+        ):
             state = hass.states.get(entity_id)
-            
-            if state and state.state not in ["unknown", "unavailable"]:
-                verification_result["correct_state"] = True
-            else:
-                verification_result["errors"].append(f"Invalid state: {state.state if state else 'None'}")
-        else:
             verification_result["correct_state"] = True
+        else:
+            state = hass.states.get(entity_id)
+            verification_result["errors"].append(f"Invalid state: {state.state if state else 'None'}")
         
         # Check 3: Attributes validation
         if state and state.attributes:
@@ -640,22 +821,18 @@ async def _ultra_post_creation_verification(hass: HomeAssistant, dog_name: str,
         _LOGGER.info("🔍 Starting ultra-comprehensive verification for %s", dog_name)
         
         # Critical entities that MUST exist
-        critical_entities = [
-            f"input_boolean.{dog_name}_feeding_morning",
-            f"input_boolean.{dog_name}_outside",
-            f"counter.{dog_name}_outside_count",
-            f"input_text.{dog_name}_notes",
-            f"input_datetime.{dog_name}_last_outside",
-            f"input_select.{dog_name}_health_status",
-            f"input_number.{dog_name}_weight",
-        ]
+        ids = dog_entity_ids(dog_name)
+        critical_entities = [ids.get(domain, suffix) for domain, suffix in CRITICAL_HELPERS]
         
         verified_entities = []
         missing_entities = []
         problematic_entities = []
         
+        # One shared wait lets all critical entities settle concurrently
+        await async_wait_for_entities(hass, critical_entities, STATE_SETTLE_TIMEOUT, ready=state_valid)
+        
         for entity_id in critical_entities:
-            verification = await _ultra_verify_entity_creation(hass, entity_id, {})
+            verification = await _ultra_verify_entity_creation(hass, entity_id, {}, settle_timeout=0)
             
             if verification["exists"] and verification["correct_state"]:
                 verified_entities.append(entity_id)
@@ -757,6 +934,10 @@ async def _send_ultra_completion_notification(hass: HomeAssistant, dog_name: str
         if retry_attempts > 0:
             message += f"\n🔄 {retry_attempts} Wiederholungen erforderlich"
         
+        total_duration = results.get("total_duration", 0.0)
+        if total_duration:
+            message += f"\n⏱️ Dauer: {total_duration:.1f}s"
+        
         # Add domain breakdown
         domain_info = []
         for domain, domain_results in results.get("domain_results", {}).items():
@@ -817,303 +998,13 @@ async def _send_error_notification(hass: HomeAssistant, dog_name: str, error: st
         _LOGGER.error("Error sending error notification: %s", e)
 
 
-# ULTRA-ROBUST ENTITY CREATION FUNCTIONS
-
-async def _create_input_booleans(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create input_boolean entities with ultra-reliability."""
-    
-    boolean_entities = [
-        # Core feeding booleans
-        (f"{dog_name}_feeding_morning", "Frühstück", ICONS["morning"]),
-        (f"{dog_name}_feeding_lunch", "Mittagessen", ICONS["lunch"]),
-        (f"{dog_name}_feeding_evening", "Abendessen", ICONS["evening"]),
-        (f"{dog_name}_feeding_snack", "Leckerli", ICONS["snack"]),
-        
-        # Core activity booleans
-        (f"{dog_name}_outside", "War draußen", ICONS["outside"]),
-        (f"{dog_name}_poop_done", "Geschäft gemacht", ICONS["poop"]),
-        
-        # System booleans
-        (f"{dog_name}_visitor_mode_input", "Besuchsmodus", ICONS["visitor"]),
-        (f"{dog_name}_emergency_mode", "Notfallmodus", ICONS["emergency"]),
-        (f"{dog_name}_medication_given", "Medikament gegeben", ICONS["medication"]),
-        
-        # Health & wellbeing booleans
-        (f"{dog_name}_feeling_well", "Fühlt sich wohl", ICONS["health"]),
-        (f"{dog_name}_appetite_normal", "Normaler Appetit", ICONS["food"]),
-        (f"{dog_name}_energy_normal", "Normale Energie", ICONS["play"]),
-        
-        # Feature toggles
-        (f"{dog_name}_auto_reminders", "Automatische Erinnerungen", ICONS["bell"]),
-        (f"{dog_name}_tracking_enabled", "Tracking aktiviert", ICONS["status"]),
-        (f"{dog_name}_weather_alerts", "Wetter-Warnungen", "mdi:weather-partly-cloudy"),
-        
-        # Care & maintenance
-        (f"{dog_name}_needs_grooming", "Pflege benötigt", ICONS["grooming"]),
-        (f"{dog_name}_training_session", "Training heute", ICONS["training"]),
-        (f"{dog_name}_vet_visit_due", "Tierarztbesuch fällig", ICONS["vet"]),
-        
-        # Additional useful booleans
-        (f"{dog_name}_walked_today", "Heute Gassi gewesen", ICONS["walk"]),
-        (f"{dog_name}_played_today", "Heute gespielt", ICONS["play"]),
-        (f"{dog_name}_socialized_today", "Heute sozialisiert", "mdi:account-group"),
-    ]
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "input_boolean", boolean_entities, dog_name)
-
-
-async def _create_counters(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create counter entities with ultra-reliability."""
-    
-    counter_entities = [
-        # Feeding counters
-        (f"{dog_name}_feeding_morning_count", "Frühstück Zähler", ICONS["morning"]),
-        (f"{dog_name}_feeding_lunch_count", "Mittagessen Zähler", ICONS["lunch"]),
-        (f"{dog_name}_feeding_evening_count", "Abendessen Zähler", ICONS["evening"]),
-        (f"{dog_name}_feeding_snack_count", "Leckerli Zähler", ICONS["snack"]),
-        
-        # Activity counters
-        (f"{dog_name}_outside_count", "Draußen Zähler", ICONS["outside"]),
-        (f"{dog_name}_walk_count", "Gassi Zähler", ICONS["walk"]),
-        (f"{dog_name}_play_count", "Spiel Zähler", ICONS["play"]),
-        (f"{dog_name}_training_count", "Training Zähler", ICONS["training"]),
-        (f"{dog_name}_poop_count", "Geschäft Zähler", ICONS["poop"]),
-        
-        # Health & care counters
-        (f"{dog_name}_vet_visits_count", "Tierarzt Besuche", ICONS["vet"]),
-        (f"{dog_name}_medication_count", "Medikamente", ICONS["medication"]),
-        (f"{dog_name}_grooming_count", "Pflege Sessions", ICONS["grooming"]),
-        
-        # Summary counters
-        (f"{dog_name}_activity_count", "Aktivitäten gesamt", ICONS["status"]),
-        (f"{dog_name}_emergency_calls", "Notfälle", ICONS["emergency"]),
-        (f"{dog_name}_daily_score", "Tages-Score", "mdi:star"),
-        
-        # Social & behavioral counters
-        (f"{dog_name}_social_interactions", "Soziale Kontakte", "mdi:account-group"),
-        (f"{dog_name}_behavior_incidents", "Verhaltensereignisse", "mdi:alert-outline"),
-        (f"{dog_name}_rewards_given", "Belohnungen", "mdi:gift"),
-    ]
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "counter", counter_entities, dog_name)
-
-
-async def _create_input_datetimes(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create input_datetime entities with ultra-reliability."""
-    
-    # Feeding schedule times (time only)
-    feeding_time_entities = []
-    for meal_type in FEEDING_TYPES:
-        feeding_time_entities.append((
-            f"{dog_name}_feeding_{meal_type}_time",
-            f"{MEAL_TYPES[meal_type]} Zeit",
-            True,  # has_time
-            False, # has_date
-            DEFAULT_FEEDING_TIMES[meal_type],
-            ICONS[meal_type]
-        ))
-    
-    # Last activity timestamps (date + time)
-    last_activity_entities = [
-        (f"{dog_name}_last_feeding_morning", "Letztes Frühstück", True, True, None, ICONS["morning"]),
-        (f"{dog_name}_last_feeding_lunch", "Letztes Mittagessen", True, True, None, ICONS["lunch"]),
-        (f"{dog_name}_last_feeding_evening", "Letztes Abendessen", True, True, None, ICONS["evening"]),
-        (f"{dog_name}_last_feeding_snack", "Letztes Leckerli", True, True, None, ICONS["snack"]),
-        (f"{dog_name}_last_outside", "Letzter Gartengang", True, True, None, ICONS["outside"]),
-        (f"{dog_name}_last_walk", "Letzter Spaziergang", True, True, None, ICONS["walk"]),
-        (f"{dog_name}_last_play", "Letztes Spielen", True, True, None, ICONS["play"]),
-        (f"{dog_name}_last_training", "Letztes Training", True, True, None, ICONS["training"]),
-        (f"{dog_name}_last_poop", "Letztes Geschäft", True, True, None, ICONS["poop"]),
-        (f"{dog_name}_last_activity", "Letzte Aktivität", True, True, None, ICONS["status"]),
-        (f"{dog_name}_last_door_ask", "Letzte Türfrage", True, True, None, "mdi:door"),
-    ]
-    
-    # Health & vet appointments
-    health_entities = [
-        (f"{dog_name}_last_vet_visit", "Letzter Tierarztbesuch", True, True, None, ICONS["vet"]),
-        (f"{dog_name}_next_vet_appointment", "Nächster Tierarzttermin", True, True, None, ICONS["vet"]),
-        (f"{dog_name}_last_vaccination", "Letzte Impfung", True, True, None, "mdi:needle"),
-        (f"{dog_name}_next_vaccination", "Nächste Impfung", True, True, None, "mdi:needle"),
-        (f"{dog_name}_medication_time", "Medikamentenzeit", True, False, "08:00:00", ICONS["medication"]),
-        (f"{dog_name}_last_grooming", "Letzte Pflege", True, True, None, ICONS["grooming"]),
-        (f"{dog_name}_next_grooming", "Nächste Pflege", True, True, None, ICONS["grooming"]),
-    ]
-    
-    # Emergency & special events
-    special_entities = [
-        (f"{dog_name}_emergency_contact_time", "Notfall Kontakt Zeit", True, True, None, ICONS["emergency"]),
-        (f"{dog_name}_visitor_start", "Besuch Start", True, True, None, ICONS["visitor"]),
-        (f"{dog_name}_visitor_end", "Besuch Ende", True, True, None, ICONS["visitor"]),
-        (f"{dog_name}_birth_date", "Geburtsdatum", False, True, None, ICONS["dog"]),
-        (f"{dog_name}_last_weight_check", "Letzte Gewichtskontrolle", True, True, None, "mdi:weight-kilogram"),
-    ]
-    
-    all_datetime_entities = feeding_time_entities + last_activity_entities + health_entities + special_entities
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "input_datetime", all_datetime_entities, dog_name)
-
-
-async def _create_input_texts(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create input_text entities with ultra-reliability."""
-    
-    text_entities = [
-        # Basic notes
-        (f"{dog_name}_notes", "Allgemeine Notizen", 255, ICONS["notes"]),
-        (f"{dog_name}_daily_notes", "Tagesnotizen", 255, ICONS["notes"]),
-        (f"{dog_name}_behavior_notes", "Verhaltensnotizen", 255, ICONS["notes"]),
-        
-        # Activity notes
-        (f"{dog_name}_last_activity_notes", "Letzte Aktivität Notizen", 255, ICONS["notes"]),
-        (f"{dog_name}_walk_notes", "Spaziergang Notizen", 255, ICONS["walk"]),
-        (f"{dog_name}_play_notes", "Spiel Notizen", 255, ICONS["play"]),
-        (f"{dog_name}_training_notes", "Training Notizen", 255, ICONS["training"]),
-        
-        # Visitor information
-        (f"{dog_name}_visitor_name", "Besuchername", 100, ICONS["visitor"]),
-        (f"{dog_name}_visitor_contact", "Besucher Kontakt", 200, ICONS["visitor"]),
-        (f"{dog_name}_visitor_notes", "Besucher Notizen", 255, ICONS["visitor"]),
-        (f"{dog_name}_visitor_instructions", "Anweisungen für Besucher", 255, ICONS["visitor"]),
-        
-        # Health information
-        (f"{dog_name}_health_notes", "Gesundheitsnotizen", 255, ICONS["health"]),
-        (f"{dog_name}_medication_notes", "Medikamenten Notizen", 255, ICONS["medication"]),
-        (f"{dog_name}_vet_notes", "Tierarzt Notizen", 255, ICONS["vet"]),
-        (f"{dog_name}_symptoms", "Aktuelle Symptome", 255, ICONS["health"]),
-        (f"{dog_name}_allergies", "Allergien", 255, ICONS["health"]),
-        
-        # Emergency contacts
-        (f"{dog_name}_emergency_contact", "Notfallkontakt", 200, ICONS["emergency"]),
-        (f"{dog_name}_vet_contact", "Tierarzt Kontakt", 200, ICONS["vet"]),
-        (f"{dog_name}_backup_contact", "Ersatzkontakt", 200, "mdi:phone"),
-        
-        # Dog information
-        (f"{dog_name}_breed", "Rasse", 100, ICONS["dog"]),
-        (f"{dog_name}_color", "Farbe/Markierungen", 100, ICONS["dog"]),
-        (f"{dog_name}_microchip_id", "Mikrochip ID", 50, "mdi:chip"),
-        (f"{dog_name}_insurance_number", "Versicherungsnummer", 100, "mdi:shield"),
-        (f"{dog_name}_registration_number", "Registrierungsnummer", 100, "mdi:card-account-details"),
-        
-        # Food preferences
-        (f"{dog_name}_food_brand", "Futtermarke", 100, ICONS["food"]),
-        (f"{dog_name}_food_allergies", "Futterallergien", 255, ICONS["food"]),
-        (f"{dog_name}_favorite_treats", "Lieblingsleckerli", 255, ICONS["snack"]),
-        (f"{dog_name}_feeding_instructions", "Fütterungsanweisungen", 255, ICONS["food"]),
-    ]
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "input_text", text_entities, dog_name)
-
-
-async def _create_input_numbers(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create input_number entities with ultra-reliability."""
-    
-    number_entities = [
-        # Health metrics
-        (f"{dog_name}_weight", "Gewicht", 0.1, 0, 100, 10, "kg", "mdi:weight-kilogram"),
-        (f"{dog_name}_target_weight", "Zielgewicht", 0.1, 0, 100, 10, "kg", "mdi:target"),
-        (f"{dog_name}_temperature", "Körpertemperatur", 0.1, 35, 42, 38.5, "°C", ICONS["thermometer"]),
-        (f"{dog_name}_heart_rate", "Herzfrequenz", 1, 60, 200, 100, "bpm", ICONS["health"]),
-        (f"{dog_name}_respiratory_rate", "Atemfrequenz", 1, 10, 50, 20, "bpm", ICONS["health"]),
-        
-        # Activity metrics
-        (f"{dog_name}_daily_walk_duration", "Tägliche Gehzeit", 1, 0, 300, 60, "min", ICONS["walk"]),
-        (f"{dog_name}_daily_play_time", "Tägliche Spielzeit", 1, 0, 180, 30, "min", ICONS["play"]),
-        (f"{dog_name}_training_duration", "Trainingszeit", 1, 0, 120, 15, "min", ICONS["training"]),
-        (f"{dog_name}_sleep_hours", "Schlafstunden", 0.5, 0, 24, 12, "h", "mdi:sleep"),
-        
-        # Food metrics
-        (f"{dog_name}_daily_food_amount", "Tägliche Futtermenge", 10, 0, 2000, 400, "g", ICONS["food"]),
-        (f"{dog_name}_treat_amount", "Leckerli Menge", 1, 0, 200, 20, "g", ICONS["snack"]),
-        (f"{dog_name}_water_intake", "Wasseraufnahme", 50, 0, 3000, 500, "ml", "mdi:cup-water"),
-        
-        # Age and lifespan
-        (f"{dog_name}_age_years", "Alter", 0.1, 0, 30, 5, "Jahre", ICONS["dog"]),
-        (f"{dog_name}_age_months", "Alter", 1, 0, 360, 60, "Monate", ICONS["dog"]),
-        (f"{dog_name}_expected_lifespan", "Erwartete Lebenszeit", 1, 8, 25, 14, "Jahre", ICONS["dog"]),
-        
-        # Size measurements
-        (f"{dog_name}_height", "Schulterhöhe", 0.5, 10, 100, 50, "cm", "mdi:ruler"),
-        (f"{dog_name}_length", "Körperlänge", 0.5, 20, 150, 70, "cm", "mdi:ruler"),
-        (f"{dog_name}_neck_circumference", "Halsumfang", 0.5, 10, 80, 35, "cm", "mdi:tape-measure"),
-        (f"{dog_name}_chest_circumference", "Brustumfang", 0.5, 20, 120, 60, "cm", "mdi:tape-measure"),
-        
-        # Health scores and ratings
-        (f"{dog_name}_health_score", "Gesundheits Score", 0.1, 0, 10, 8, "Punkte", ICONS["health"]),
-        (f"{dog_name}_happiness_score", "Glücks Score", 0.1, 0, 10, 8, "Punkte", ICONS["happy"]),
-        (f"{dog_name}_energy_level", "Energie Level", 0.1, 0, 10, 7, "Punkte", ICONS["play"]),
-        (f"{dog_name}_appetite_score", "Appetit Score", 0.1, 0, 10, 8, "Punkte", ICONS["food"]),
-    ]
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "input_number", number_entities, dog_name)
-
-
-async def _create_input_selects(hass: HomeAssistant, dog_name: str) -> Dict[str, Any]:
-    """Create input_select entities with ultra-reliability."""
-    
-    select_entities = [
-        # Health status
-        (f"{dog_name}_health_status", "Gesundheitsstatus", [
-            "Ausgezeichnet", "Gut", "Normal", "Schwach", "Krank", "Notfall"
-        ], "Gut", ICONS["health"]),
-        
-        # Mood
-        (f"{dog_name}_mood", "Stimmung", [
-            "Sehr glücklich", "Glücklich", "Neutral", "Gestresst", "Ängstlich", "Krank"
-        ], "Glücklich", ICONS["happy"]),
-        
-        # Activity level
-        (f"{dog_name}_activity_level", "Aktivitätslevel", [
-            "Sehr niedrig", "Niedrig", "Normal", "Hoch", "Sehr hoch"
-        ], "Normal", ICONS["play"]),
-        
-        # Energy level
-        (f"{dog_name}_energy_level_category", "Energie Level", [
-            "Sehr müde", "Müde", "Normal", "Energiegeladen", "Hyperaktiv"
-        ], "Normal", ICONS["play"]),
-        
-        # Appetite level
-        (f"{dog_name}_appetite_level", "Appetit Level", [
-            "Kein Appetit", "Wenig Appetit", "Normal", "Guter Appetit", "Sehr hungrig"
-        ], "Normal", ICONS["food"]),
-        
-        # Emergency level
-        (f"{dog_name}_emergency_level", "Notfall Level", [
-            "Normal", "Aufmerksamkeit", "Warnung", "Dringend", "Kritisch"
-        ], "Normal", ICONS["emergency"]),
-        
-        # Size category
-        (f"{dog_name}_size_category", "Größenkategorie", [
-            "Toy (< 4kg)", "Klein (4-10kg)", "Mittel (10-25kg)", "Groß (25-45kg)", "Riesig (> 45kg)"
-        ], "Mittel (10-25kg)", ICONS["dog"]),
-        
-        # Age group
-        (f"{dog_name}_age_group", "Altersgruppe", [
-            "Welpe (< 6 Monate)", "Junghund (6-18 Monate)", "Erwachsen (1-7 Jahre)", 
-            "Senior (7-10 Jahre)", "Hochbetagt (> 10 Jahre)"
-        ], "Erwachsen (1-7 Jahre)", ICONS["dog"]),
-        
-        # Training level
-        (f"{dog_name}_training_level", "Trainingslevel", [
-            "Anfänger", "Grundlagen", "Fortgeschritten", "Experte", "Champion"
-        ], "Grundlagen", ICONS["training"]),
-    ]
-    
-    return await _create_helpers_for_domain_ultra_robust(hass, "input_select", select_entities, dog_name)
-
-
 # VERIFICATION FUNCTIONS
 
 async def verify_helper_creation_ultra(hass: HomeAssistant, dog_name: str) -> dict:
     """Ultra-comprehensive verification of helper entity creation."""
     
-    critical_entities = [
-        f"input_boolean.{dog_name}_feeding_morning",
-        f"input_boolean.{dog_name}_outside", 
-        f"counter.{dog_name}_outside_count",
-        f"input_text.{dog_name}_notes",
-        f"input_datetime.{dog_name}_last_outside",
-        f"input_select.{dog_name}_health_status",
-        f"input_number.{dog_name}_weight",
-    ]
+    ids = dog_entity_ids(dog_name)
+    critical_entities = [ids.get(domain, suffix) for domain, suffix in CRITICAL_HELPERS]
     
     verification_results = {
         "total_checked": len(critical_entities),
@@ -1124,8 +1015,10 @@ async def verify_helper_creation_ultra(hass: HomeAssistant, dog_name: str) -> di
         "detailed_results": {}
     }
     
+    await async_wait_for_entities(hass, critical_entities, STATE_SETTLE_TIMEOUT, ready=state_valid)
+    
     for entity_id in critical_entities:
-        entity_result = await _ultra_verify_entity_creation(hass, entity_id, {})
+        entity_result = await _ultra_verify_entity_creation(hass, entity_id, {}, settle_timeout=0)
         
         verification_results["detailed_results"][entity_id] = entity_result
         
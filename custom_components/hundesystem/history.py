@@ -0,0 +1,133 @@
+"""Rolling window of daily aggregates per dog."""
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .household import get_dog_data
+
+_LOGGER = logging.getLogger(__name__)
+
+HISTORY_STORE_VERSION = 1    # Storage version of the daily history
+HISTORY_DAYS = 31            # Ring buffer size, enough for monthly summaries
+HISTORY_SAVE_DELAY = 60      # Seconds provisional updates are batched before saving
+
+
+class DailyHistory:
+    """Fixed-size ring buffer of daily aggregates, persisted with Store.
+
+    Day d lives in slot d.toordinal() % HISTORY_DAYS, so recording a day is
+    O(1) and overwrites the entry from HISTORY_DAYS days ago. Each slot keeps
+    its date, which tells stale slots (days without data) apart.
+    """
+
+    def __init__(self, hass: HomeAssistant, dog_name: str) -> None:
+        """Initialize the history."""
+        self._dog_name = dog_name
+        self._store = Store(hass, HISTORY_STORE_VERSION, f"{DOMAIN}_{dog_name}_history")
+        self._slots: List[Optional[Dict[str, Any]]] = [None] * HISTORY_DAYS
+
+    async def async_load(self) -> None:
+        """Load the stored daily aggregates."""
+        stored = await self._store.async_load() or {}
+        for aggregate in stored.get("days", []):
+            try:
+                day = date.fromisoformat(aggregate["date"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._slots[day.toordinal() % HISTORY_DAYS] = aggregate
+
+        _LOGGER.debug("Loaded %d days of history for %s", len(self.days(HISTORY_DAYS)), self._dog_name)
+
+    @callback
+    def record(self, day: date, aggregate: Dict[str, Any], final: bool = False) -> bool:
+        """Store the aggregate of a day; closed and newer days are not overwritten."""
+        index = day.toordinal() % HISTORY_DAYS
+        current = self._slots[index]
+        if current is not None:
+            if current["date"] > day.isoformat():
+                return False
+            if current["date"] == day.isoformat() and current.get("closed"):
+                return False
+
+        self._slots[index] = {**aggregate, "date": day.isoformat(), "closed": final}
+        self._store.async_delay_save(self._data_to_save, 0 if final else HISTORY_SAVE_DELAY)
+        return True
+
+    def get(self, day: date) -> Optional[Dict[str, Any]]:
+        """Return the aggregate of a day if it is still in the window."""
+        aggregate = self._slots[day.toordinal() % HISTORY_DAYS]
+        if aggregate is None or aggregate["date"] != day.isoformat():
+            return None
+        return aggregate
+
+    def days(self, count: int, end: Optional[date] = None) -> List[Dict[str, Any]]:
+        """Return the recorded aggregates of the last count days up to end, oldest first."""
+        end = end or date.today()
+        count = min(count, HISTORY_DAYS)
+        aggregates = []
+        for offset in range(count - 1, -1, -1):
+            aggregate = self.get(end - timedelta(days=offset))
+            if aggregate is not None:
+                aggregates.append(aggregate)
+        return aggregates
+
+    def mean(self, field: str, count: int) -> Optional[float]:
+        """Return the mean of a numeric field over the last count days."""
+        values = self._values(field, count)
+        return sum(values) / len(values) if values else None
+
+    def slope(self, field: str, count: int) -> Optional[float]:
+        """Return the least squares slope of a field per day over the last count days."""
+        end = date.today()
+        points = [
+            ((date.fromisoformat(aggregate["date"]) - end).days, float(aggregate[field]))
+            for aggregate in self.days(count, end)
+            if isinstance(aggregate.get(field), (int, float))
+        ]
+        if len(points) < 2:
+            return None
+
+        mean_x = sum(x for x, _ in points) / len(points)
+        mean_y = sum(y for _, y in points) / len(points)
+        variance = sum((x - mean_x) ** 2 for x, _ in points)
+        if variance == 0:
+            return None
+        return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+    def rate(self, field: str, count: int) -> Optional[float]:
+        """Return the share (0-1) of recorded days on which a field was true."""
+        aggregates = self.days(count)
+        if not aggregates:
+            return None
+        return sum(1 for aggregate in aggregates if aggregate.get(field)) / len(aggregates)
+
+    def _values(self, field: str, count: int) -> List[float]:
+        """Return the numeric values of a field over the last count days."""
+        return [
+            float(aggregate[field])
+            for aggregate in self.days(count)
+            if isinstance(aggregate.get(field), (int, float))
+        ]
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to persist."""
+        return {"days": [aggregate for aggregate in self._slots if aggregate is not None]}
+
+
+async def async_get_history(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> DailyHistory:
+    """Return the daily history of one dog of a config entry, loading it on first use."""
+    dog_data = get_dog_data(hass, config_entry, dog_name)
+    history = dog_data.get("history")
+    if history is None:
+        history = DailyHistory(hass, dog_name)
+        await history.async_load()
+        dog_data["history"] = history
+    return history
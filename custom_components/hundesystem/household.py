@@ -0,0 +1,92 @@
+"""Household config entries managing several dogs with shared plumbing."""
+from __future__ import annotations
+
+from collections import ChainMap
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_DOG_NAME, CONF_DOGS
+
+
+def parse_dog_names(value: str) -> List[str]:
+    """Split a comma separated input into normalized, unique dog names."""
+    names = [name.strip().lower() for name in value.split(",")]
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def entry_dog_names(config_entry: ConfigEntry) -> List[str]:
+    """Return the dogs of a config entry; single-dog entries have exactly one."""
+    dogs = config_entry.data.get(CONF_DOGS)
+    if dogs:
+        return list(dogs)
+    return [config_entry.data[CONF_DOG_NAME]]
+
+
+def is_household(config_entry: ConfigEntry) -> bool:
+    """Return True if the entry manages a household of dogs."""
+    return bool(config_entry.data.get(CONF_DOGS))
+
+
+def entry_config(config_entry: ConfigEntry) -> Dict[str, Any]:
+    """Return the settings shared by all dogs of an entry."""
+    config = {**config_entry.data, **config_entry.options}
+    config.pop(CONF_DOGS, None)
+    return config
+
+
+def dog_config(shared: Mapping[str, Any], config_entry: ConfigEntry, dog_name: str) -> Mapping[str, Any]:
+    """Return the effective config of one dog.
+
+    Only the dog's own overrides are stored per dog; lookups fall through to
+    the shared settings, so N dogs do not hold N copies of the config.
+    """
+    overrides = (config_entry.data.get(CONF_DOGS) or {}).get(dog_name) or {}
+    return ChainMap({**overrides, CONF_DOG_NAME: dog_name}, shared)
+
+
+def get_dog_data(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> Dict[str, Any]:
+    """Return the per-dog state of a config entry, creating it on first use."""
+    entry_data = hass.data.setdefault(DOMAIN, {}).setdefault(config_entry.entry_id, {})
+    dogs = entry_data.setdefault("dogs", {})
+    dog_data = dogs.get(dog_name)
+    if dog_data is None:
+        dog_data = {
+            "dog_name": dog_name,
+            "config": dog_config(entry_data.get("config") or entry_config(config_entry), config_entry, dog_name),
+        }
+        dogs[dog_name] = dog_data
+    return dog_data
+
+
+def iter_dog_data(hass: HomeAssistant) -> Iterator[Dict[str, Any]]:
+    """Yield the per-dog state of every dog of every loaded entry."""
+    for entry_data in list(hass.data.get(DOMAIN, {}).values()):
+        if isinstance(entry_data, dict):
+            yield from list(entry_data.get("dogs", {}).values())
+
+
+def find_dog_data(hass: HomeAssistant, dog_name: str) -> Optional[Dict[str, Any]]:
+    """Return the per-dog state of a dog in any loaded entry."""
+    for entry_data in hass.data.get(DOMAIN, {}).values():
+        if isinstance(entry_data, dict) and dog_name in entry_data.get("dogs", {}):
+            return entry_data["dogs"][dog_name]
+    return None
+
+
+def configured_dog_names(hass: HomeAssistant) -> List[str]:
+    """Return the dogs of all config entries, loaded or not."""
+    names = []
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        names.extend(_stored_dog_names(config_entry.data))
+    return names
+
+
+def _stored_dog_names(data: Mapping[str, Any]) -> Iterable[str]:
+    """Return the dog names stored in config entry data."""
+    if data.get(CONF_DOGS):
+        return list(data[CONF_DOGS])
+    if data.get(CONF_DOG_NAME):
+        return [data[CONF_DOG_NAME].lower()]
+    return []
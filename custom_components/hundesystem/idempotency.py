@@ -0,0 +1,90 @@
+"""Drop duplicate activity events before any helper is touched."""
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ACTIVITY_DEDUPLICATOR = f"{DOMAIN}_activity_deduplicator"
+
+# Events of the same dog, activity and source within this many seconds are duplicates
+DEDUP_WINDOW = 30
+DEDUP_MAX_KEYS = 512
+
+SOURCE_BUTTON = "button"
+SOURCE_NOTIFICATION = "notification"
+
+# (dog, activity, time bucket, source)
+DedupKey = Tuple[str, str, int, str]
+
+
+class ActivityDeduplicator:
+    """Bounded LRU of recently handled activity events.
+
+    An event is keyed by (dog, activity, time bucket, source). A double tap
+    or a retried push action produces the same key, or the key of the
+    previous bucket when it straddles a bucket boundary; both are checked
+    against the time they were claimed, so only events within the window are
+    dropped. The oldest keys are evicted once max_keys is reached.
+    """
+
+    def __init__(self, window: float = DEDUP_WINDOW, max_keys: int = DEDUP_MAX_KEYS) -> None:
+        """Initialize the deduplicator."""
+        self._window = window
+        self._max_keys = max_keys
+        self._keys: "OrderedDict[DedupKey, float]" = OrderedDict()
+        self._claimed = 0
+        self._dropped = 0
+
+    def claim(
+        self, dog_name: str, activity: str, source: str, now: Optional[float] = None
+    ) -> Optional[DedupKey]:
+        """Claim an event; returns its key, or None if it duplicates a recent one."""
+        if now is None:
+            now = time.monotonic()
+        bucket = int(now // self._window)
+
+        for candidate in ((dog_name, activity, bucket, source), (dog_name, activity, bucket - 1, source)):
+            claimed_at = self._keys.get(candidate)
+            if claimed_at is not None and now - claimed_at < self._window:
+                self._keys.move_to_end(candidate)
+                self._dropped += 1
+                return None
+
+        key = (dog_name, activity, bucket, source)
+        self._keys[key] = now
+        self._keys.move_to_end(key)
+        while len(self._keys) > self._max_keys:
+            self._keys.popitem(last=False)
+        self._claimed += 1
+        return key
+
+    def release(self, key: Optional[DedupKey]) -> None:
+        """Forget a claimed event whose handling failed, so a retry is accepted."""
+        if key is not None:
+            self._keys.pop(key, None)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the key count and claimed/dropped totals."""
+        return {
+            "keys": len(self._keys),
+            "claimed": self._claimed,
+            "dropped": self._dropped,
+        }
+
+
+@callback
+def async_get_activity_deduplicator(hass: HomeAssistant) -> ActivityDeduplicator:
+    """Return the shared deduplicator, creating it on first use."""
+    deduplicator = hass.data.get(DATA_ACTIVITY_DEDUPLICATOR)
+    if deduplicator is None:
+        deduplicator = ActivityDeduplicator()
+        hass.data[DATA_ACTIVITY_DEDUPLICATOR] = deduplicator
+    return deduplicator
@@ -0,0 +1,161 @@
+"""Bounded per-dog journal of notes, replacing the 255 character daily notes text."""
+from __future__ import annotations
+
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, JOURNAL_CATEGORIES
+from .household import find_dog_data, get_dog_data
+
+_LOGGER = logging.getLogger(__name__)
+
+JOURNAL_STORE_VERSION = 1    # Storage version of the journal
+JOURNAL_MAX_ENTRIES = 1000   # Ring buffer size; the oldest entry is dropped beyond it
+JOURNAL_FLUSH_DELAY = 30     # Seconds appends are batched before writing to disk
+JOURNAL_RECENT_ENTRIES = 10  # Entries shown in the journal sensor attributes
+
+
+def _local_isoformat(value: datetime) -> str:
+    """Return value as a naive local ISO timestamp, comparable with the stored ones."""
+    if value.tzinfo is not None:
+        value = dt_util.as_local(value).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _with_label(entry: Dict[str, str]) -> Dict[str, str]:
+    """Return a copy of entry with the display label of its category."""
+    return {**entry, "label": JOURNAL_CATEGORIES.get(entry["category"], entry["category"])}
+
+
+class DogJournal:
+    """Ring buffer of one dog's journal entries, persisted with Store.
+
+    Appending is O(1) and needs no service call: the entry goes into a
+    bounded deque and only schedules a delayed save, so all appends within
+    JOURNAL_FLUSH_DELAY seconds are written to disk together. Entries are
+    {"timestamp", "category", "text"} in append order, where category is a
+    JOURNAL_CATEGORIES key; returned entries add its display label.
+    """
+
+    def __init__(self, hass: HomeAssistant, dog_name: str) -> None:
+        """Initialize the journal."""
+        self._dog_name = dog_name
+        self._store = Store(hass, JOURNAL_STORE_VERSION, f"{DOMAIN}_{dog_name}_journal")
+        self._entries: Deque[Dict[str, str]] = deque(maxlen=JOURNAL_MAX_ENTRIES)
+        self._listeners: List[Callable[[], None]] = []
+
+    @property
+    def dog_name(self) -> str:
+        """Return the dog name."""
+        return self._dog_name
+
+    def __len__(self) -> int:
+        """Return the number of journal entries."""
+        return len(self._entries)
+
+    async def async_load(self) -> None:
+        """Load the stored journal entries."""
+        stored = await self._store.async_load() or {}
+        for entry in stored.get("entries", []):
+            if isinstance(entry, dict) and "timestamp" in entry:
+                self._entries.append({
+                    "timestamp": str(entry["timestamp"]),
+                    "category": str(entry.get("category", "")),
+                    "text": str(entry.get("text", "")),
+                })
+        _LOGGER.debug("Loaded %d journal entries for %s", len(self._entries), self._dog_name)
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Call update_callback after every append."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def async_append(
+        self, category: str, text: str = "", timestamp: Optional[datetime] = None
+    ) -> Dict[str, str]:
+        """Append an entry and schedule a batched write."""
+        entry = {
+            "timestamp": (timestamp or datetime.now()).isoformat(),
+            "category": category,
+            "text": text or "",
+        }
+        self._entries.append(entry)
+        self._store.async_delay_save(self._data_to_save, JOURNAL_FLUSH_DELAY)
+
+        for update_callback in list(self._listeners):
+            update_callback()
+        return entry
+
+    def recent(self, count: int = JOURNAL_RECENT_ENTRIES) -> List[Dict[str, str]]:
+        """Return the newest count entries, newest first."""
+        entries = []
+        for entry in reversed(self._entries):
+            if len(entries) >= count:
+                break
+            entries.append(_with_label(entry))
+        return entries
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        category: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, str]]:
+        """Return the entries in [start, end), newest first, optionally of one category."""
+        start_iso = _local_isoformat(start) if start else None
+        end_iso = _local_isoformat(end) if end else None
+
+        entries = []
+        for entry in reversed(self._entries):
+            if limit is not None and len(entries) >= limit:
+                break
+            if end_iso is not None and entry["timestamp"] >= end_iso:
+                continue
+            if start_iso is not None and entry["timestamp"] < start_iso:
+                continue
+            if category is not None and entry["category"] != category:
+                continue
+            entries.append(_with_label(entry))
+        return entries
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to persist."""
+        return {"entries": list(self._entries)}
+
+    async def async_flush(self) -> None:
+        """Write all pending entries to disk now."""
+        await self._store.async_save(self._data_to_save())
+
+
+async def async_get_journal(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> DogJournal:
+    """Return the journal of one dog of a config entry, loading it on first use."""
+    dog_data = get_dog_data(hass, config_entry, dog_name)
+    journal = dog_data.get("journal")
+    if journal is None:
+        journal = DogJournal(hass, dog_name)
+        await journal.async_load()
+        dog_data["journal"] = journal
+    return journal
+
+
+def get_dog_journal(hass: HomeAssistant, dog_name: str) -> Optional[DogJournal]:
+    """Return the loaded journal of a dog, if any."""
+    dog_data = find_dog_data(hass, dog_name)
+    return dog_data.get("journal") if dog_data else None
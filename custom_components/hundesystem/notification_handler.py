@@ -1,8 +1,26 @@
-from homeassistant.core import HomeAssistant
+import logging
+from typing import Callable, Dict
+
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.util import slugify
 
-from .const import DOMAIN
+from .activity_batch import BATCH_ACTIVITIES
+from .const import DOMAIN, SERVICE_LOG_BATCH
+from .idempotency import SOURCE_NOTIFICATION, async_get_activity_deduplicator
+from .notification_router import async_get_notification_router
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_NOTIFICATION_ACTION = "mobile_app_notification_action"
+
+# Action IDs logging an activity: HUNDESYSTEM_LOG|<dog>|<activity>
+ACTION_LOG_PREFIX = "HUNDESYSTEM_LOG"
+
+
+def activity_action(dog_name: str, activity: str, title: str) -> Dict[str, str]:
+    """Return a notification action that logs activity for dog_name when tapped."""
+    return {"action": f"{ACTION_LOG_PREFIX}|{dog_name}|{activity}", "title": title}
 
 
 async def send_push_notification(hass: HomeAssistant, dog_name: str, message: str, actions: list = None):
@@ -13,24 +31,63 @@ async def send_push_notification(hass: HomeAssistant, dog_name: str, message: st
     # Optional: input_select mit Geräten abrufen
     # Hier vereinfacht: an notify.mobile_app_<person> schicken, wenn anwesend
 
-    recipients = []
-    persons = hass.states.async_entity_ids("person")
-
-    for person_entity in persons:
-        person_state = hass.states.get(person_entity)
-        if person_state.state == "home":
-            person_id = person_entity.split(".")[1]
-            notify_entity = f"notify.mobile_app_{person_id}"
-            if notify_entity in hass.services.async_services().get("notify", {}):
-                recipients.append(notify_entity)
-
-    for target in recipients:
-        await hass.services.async_call(
-            "notify",
-            target.replace("notify.", ""),
-            {
-                "title": f"Hundesystem: {dog_name}",
-                "message": message,
-                "data": {"actions": actions} if actions else {}
-            }
+    # Anwesende Personen kommen aus dem Index des Routers (kein Scan aller Personen)
+    router = async_get_notification_router(hass)
+    await router.async_send(
+        router.home_targets(),
+        {
+            "title": f"Hundesystem: {dog_name}",
+            "message": message,
+            "data": {"actions": actions} if actions else {}
+        }
+    )
+
+
+async def _async_handle_notification_action(hass: HomeAssistant, event: Event) -> None:
+    """Log the activity of a tapped action, dropping retried deliveries of the same tap."""
+    parts = str(event.data.get("action", "")).split("|")
+    if len(parts) != 3 or parts[0] != ACTION_LOG_PREFIX:
+        return
+
+    _prefix, dog_name, activity = parts
+    if activity not in BATCH_ACTIVITIES:
+        _LOGGER.warning("Unbekannte Aktivität in Benachrichtigungsaktion: %s", activity)
+        return
+
+    deduplicator = async_get_activity_deduplicator(hass)
+    key = deduplicator.claim(dog_name, activity, SOURCE_NOTIFICATION)
+    if key is None:
+        _LOGGER.debug("Duplicate %s action for %s dropped", activity, dog_name)
+        return
+
+    try:
+        response = await hass.services.async_call(
+            DOMAIN, SERVICE_LOG_BATCH,
+            {"records": [{"dog_name": dog_name, "activity": activity}]},
+            blocking=True,
+            return_response=True,
+        )
+    except Exception as e:
+        deduplicator.release(key)
+        _LOGGER.error("Failed to log %s action for %s: %s", activity, dog_name, e)
+        return
+
+    # log_batch reports invalid and failed records in its response instead of raising
+    results = (response or {}).get("results") or [{}]
+    if results[0].get("status") != "logged":
+        deduplicator.release(key)
+        _LOGGER.error(
+            "Failed to log %s action for %s: %s",
+            activity, dog_name, results[0].get("error", "no result"),
         )
+
+
+@callback
+def async_setup_notification_actions(hass: HomeAssistant) -> Callable[[], None]:
+    """Follow tapped notification actions; returns the remove callback."""
+
+    @callback
+    def _async_action(event: Event) -> None:
+        hass.async_create_task(_async_handle_notification_action(hass, event))
+
+    return hass.bus.async_listen(EVENT_NOTIFICATION_ACTION, _async_action)
@@ -0,0 +1,272 @@
+"""Per-recipient notification queue with deduplication, digests and rate limits."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, DEFAULT_NOTIFICATION_WINDOW
+from .notification_router import NotificationRouter, async_get_notification_router
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_NOTIFICATION_QUEUE = f"{DOMAIN}_notification_queue"
+
+RATE_LIMIT_CAPACITY = 5        # Messages a recipient may receive in a burst
+RATE_LIMIT_REFILL = 60.0       # Seconds until one more message is allowed
+MAX_QUEUE_DEPTH = 20           # Queued messages per recipient before the oldest is dropped
+
+QUEUE_COUNTERS = ["queued", "sent", "deduplicated", "coalesced", "dropped", "rate_limited"]
+
+
+class TokenBucket:
+    """Classic token bucket: capacity tokens, refilled at one per refill seconds."""
+
+    def __init__(self, capacity: int, refill: float) -> None:
+        """Initialize a full bucket."""
+        self._capacity = capacity
+        self._refill = refill
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+
+    def _update(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last) / self._refill)
+        self._last = now
+
+    def consume(self) -> bool:
+        """Take one token if available."""
+        self._update()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def time_until_token(self) -> float:
+        """Return the seconds until the next token is available."""
+        self._update()
+        return max(0.0, (1 - self._tokens) * self._refill)
+
+
+class NotificationQueue:
+    """Coalesce outgoing notifications per recipient.
+
+    Messages to a recipient are held for a short window. Within the window a
+    message replaces a queued one with the same tag, and several remaining
+    messages are merged into one digest. Each recipient has a token bucket;
+    without a token the flush is postponed and later messages join the
+    digest. Messages with actions are never merged into a digest.
+    """
+
+    def __init__(self, hass: HomeAssistant, router: NotificationRouter) -> None:
+        """Initialize the queue."""
+        self._hass = hass
+        self._router = router
+        self._queues: Dict[str, List[Dict[str, Any]]] = {}
+        self._timers: Dict[str, Callable[[], None]] = {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._stats: Dict[str, int] = {counter: 0 for counter in QUEUE_COUNTERS}
+        self._dog_stats: Dict[str, Dict[str, int]] = {}
+        self._listeners: Dict[Optional[str], List[Callable[[], None]]] = {}
+        self._changed_dogs: Set[str] = set()
+
+    @property
+    def depth(self) -> int:
+        """Return the number of queued messages."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Return the global counters."""
+        return dict(self._stats)
+
+    def dog_depth(self, dog_name: str) -> int:
+        """Return the number of queued messages of one dog."""
+        return sum(
+            1 for queue in self._queues.values() for item in queue if item["dog_name"] == dog_name
+        )
+
+    def dog_stats(self, dog_name: str) -> Dict[str, int]:
+        """Return the counters of one dog."""
+        return dict(self._dog_stats.get(dog_name, {counter: 0 for counter in QUEUE_COUNTERS}))
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], dog_name: Optional[str] = None
+    ) -> Callable[[], None]:
+        """Call update_callback whenever depth or counters change, only for dog_name if given."""
+        listeners = self._listeners.setdefault(dog_name, [])
+        listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+
+        return _remove_listener
+
+    @callback
+    def async_enqueue(
+        self,
+        targets: Iterable[str],
+        title: str,
+        message: str,
+        data: Optional[Dict[str, Any]] = None,
+        dog_name: str = "",
+        window: float = DEFAULT_NOTIFICATION_WINDOW,
+        immediate: bool = False,
+    ) -> None:
+        """Queue a message for every target; immediate messages are sent right away."""
+        data = data or {}
+        tag = data.get("tag") or f"{dog_name}_{title}"
+
+        for target in targets:
+            recipient = target.replace("notify.", "", 1) if target.startswith("notify.") else target
+            queue = self._queues.setdefault(recipient, [])
+            item = {
+                "title": title,
+                "message": message,
+                "data": data,
+                "tag": tag,
+                "dog_name": dog_name,
+                "queued_at": datetime.now().isoformat(),
+            }
+
+            duplicates = [queued for queued in queue if queued["tag"] == tag]
+            for duplicate in duplicates:
+                queue.remove(duplicate)
+                self._count("deduplicated", duplicate["dog_name"])
+
+            if len(queue) >= MAX_QUEUE_DEPTH:
+                dropped = queue.pop(0)
+                self._count("dropped", dropped["dog_name"])
+                _LOGGER.warning("Notification queue for %s full, dropped: %s", recipient, dropped["title"])
+
+            queue.append(item)
+            self._count("queued", dog_name)
+
+            if immediate:
+                self._async_cancel_timer(recipient)
+                self._hass.async_create_task(self._async_flush(recipient, bypass_limit=True))
+            elif recipient not in self._timers:
+                self._async_arm(recipient, window)
+
+        self._async_notify_listeners()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all pending flushes and drop queued messages."""
+        for recipient in list(self._timers):
+            self._async_cancel_timer(recipient)
+        self._queues.clear()
+
+    @callback
+    def _async_arm(self, recipient: str, delay: float) -> None:
+        """Schedule a flush of one recipient's queue."""
+
+        @callback
+        def _flush_due(now: datetime) -> None:
+            """Flush the queue once the window has elapsed."""
+            self._timers.pop(recipient, None)
+            self._hass.async_create_task(self._async_flush(recipient))
+
+        self._timers[recipient] = async_call_later(self._hass, delay, _flush_due)
+
+    @callback
+    def _async_cancel_timer(self, recipient: str) -> None:
+        """Cancel the pending flush of one recipient."""
+        if (cancel := self._timers.pop(recipient, None)) is not None:
+            cancel()
+
+    async def _async_flush(self, recipient: str, bypass_limit: bool = False) -> None:
+        """Send the queued messages of one recipient as few pushes as possible."""
+        queue = self._queues.get(recipient)
+        if not queue:
+            return
+
+        bucket = self._buckets.setdefault(recipient, TokenBucket(RATE_LIMIT_CAPACITY, RATE_LIMIT_REFILL))
+
+        # Actionable messages go out on their own, everything else becomes one digest
+        batches = [[item] for item in queue if item["data"].get("actions")]
+        digest = [item for item in queue if not item["data"].get("actions")]
+        if digest:
+            batches.append(digest)
+
+        for batch in batches:
+            if not bypass_limit and not bucket.consume():
+                for item in batch:
+                    self._count("rate_limited", item["dog_name"])
+                if recipient not in self._timers:
+                    self._async_arm(recipient, bucket.time_until_token())
+                break
+
+            for item in batch:
+                queue.remove(item)
+                self._changed_dogs.add(item["dog_name"])
+            await self._async_send(recipient, batch)
+
+        if not queue:
+            self._queues.pop(recipient, None)
+        self._async_notify_listeners()
+
+    async def _async_send(self, recipient: str, batch: List[Dict[str, Any]]) -> None:
+        """Send one message or a digest of several."""
+        if len(batch) == 1:
+            item = batch[0]
+            payload = {"title": item["title"], "message": item["message"]}
+            if item["data"]:
+                payload["data"] = item["data"]
+        else:
+            payload = {
+                "title": f"🐶 Hundesystem: {len(batch)} Meldungen",
+                "message": "\n".join(f"• {item['title']}: {item['message']}" for item in batch),
+                "data": {"tag": "hundesystem_digest", "group": "hundesystem"},
+            }
+            for item in batch[1:]:
+                self._count("coalesced", item["dog_name"])
+
+        failed = await self._router.async_send([recipient], payload)
+        if not failed:
+            for item in batch:
+                self._count("sent", item["dog_name"])
+
+    def _count(self, counter: str, dog_name: str) -> None:
+        """Increase a global and a per-dog counter."""
+        self._stats[counter] += 1
+        dog_stats = self._dog_stats.setdefault(dog_name, {name: 0 for name in QUEUE_COUNTERS})
+        dog_stats[counter] += 1
+        self._changed_dogs.add(dog_name)
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Tell listeners (diagnostic sensors) that the queue changed.
+
+        Per-dog listeners are only called for the dogs whose messages changed.
+        """
+        changed_dogs, self._changed_dogs = self._changed_dogs, set()
+        for dog_name in (None, *changed_dogs):
+            for update_callback in list(self._listeners.get(dog_name, ())):
+                update_callback()
+
+
+@callback
+def async_get_notification_queue(hass: HomeAssistant) -> NotificationQueue:
+    """Return the shared notification queue, creating it on first use."""
+    queue = hass.data.get(DATA_NOTIFICATION_QUEUE)
+    if queue is None:
+        queue = NotificationQueue(hass, async_get_notification_router(hass))
+        hass.data[DATA_NOTIFICATION_QUEUE] = queue
+    return queue
+
+
+@callback
+def async_stop_notification_queue(hass: HomeAssistant) -> None:
+    """Stop and drop the shared notification queue."""
+    queue = hass.data.pop(DATA_NOTIFICATION_QUEUE, None)
+    if queue is not None:
+        queue.async_stop()
@@ -0,0 +1,157 @@
+"""Presence-indexed notification routing shared by all dogs."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Set
+
+from homeassistant.const import EVENT_SERVICE_REGISTERED, EVENT_SERVICE_REMOVED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_NOTIFICATION_ROUTER = f"{DOMAIN}_notification_router"
+
+MOBILE_APP_PREFIX = "mobile_app_"
+
+
+class NotificationRouter:
+    """Keep an index from present persons to their notify services.
+
+    The index is built once and then maintained from person state changes
+    and notify service (un)registrations, so looking up the recipients of a
+    notification costs O(recipients) instead of scanning every person and
+    service on each call.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self._hass = hass
+        self._persons_home: Set[str] = set()
+        self._notify_services: Set[str] = set()
+        self._home_targets: Set[str] = set()
+        self._unsubs: List[Callable[[], None]] = []
+
+    @callback
+    def async_start(self) -> None:
+        """Build the index and start following presence and services."""
+        self._notify_services = set(self._hass.services.async_services().get("notify", {}))
+        for state in self._hass.states.async_all("person"):
+            if state.state == "home":
+                self._persons_home.add(state.object_id)
+        self._home_targets = {
+            f"{MOBILE_APP_PREFIX}{person_id}" for person_id in self._persons_home
+            if f"{MOBILE_APP_PREFIX}{person_id}" in self._notify_services
+        }
+
+        # Only person state changes are dispatched to the router
+        person_tracker = async_track_state_change_filtered(
+            self._hass, TrackStates(False, set(), {"person"}), self._async_state_changed
+        )
+        self._unsubs = [
+            person_tracker.async_remove,
+            self._hass.bus.async_listen(EVENT_SERVICE_REGISTERED, self._async_service_registered),
+            self._hass.bus.async_listen(EVENT_SERVICE_REMOVED, self._async_service_removed),
+        ]
+        _LOGGER.debug("Notification router indexed %d present targets", len(self._home_targets))
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following presence and services."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the presence of one person."""
+        person_id = event.data["entity_id"].split(".", 1)[1]
+        new_state = event.data.get("new_state")
+        target = f"{MOBILE_APP_PREFIX}{person_id}"
+
+        if new_state is not None and new_state.state == "home":
+            self._persons_home.add(person_id)
+            if target in self._notify_services:
+                self._home_targets.add(target)
+        else:
+            self._persons_home.discard(person_id)
+            self._home_targets.discard(target)
+
+    @callback
+    def _async_service_registered(self, event: Event) -> None:
+        """Index a new notify service."""
+        if event.data.get("domain") != "notify":
+            return
+
+        service = event.data.get("service")
+        self._notify_services.add(service)
+        if service.startswith(MOBILE_APP_PREFIX) and service[len(MOBILE_APP_PREFIX):] in self._persons_home:
+            self._home_targets.add(service)
+
+    @callback
+    def _async_service_removed(self, event: Event) -> None:
+        """Drop a removed notify service."""
+        if event.data.get("domain") != "notify":
+            return
+
+        service = event.data.get("service")
+        self._notify_services.discard(service)
+        self._home_targets.discard(service)
+
+    def is_home(self, person_id: str) -> bool:
+        """Return True if person.<person_id> is home."""
+        return person_id in self._persons_home
+
+    def has_service(self, service: str) -> bool:
+        """Return True if notify.<service> exists."""
+        return service in self._notify_services
+
+    def home_targets(self) -> List[str]:
+        """Return the mobile app notify services of all persons at home."""
+        return sorted(self._home_targets)
+
+    async def async_send(self, targets: Iterable[str], payload: Dict[str, Any]) -> List[str]:
+        """Send payload to all notify targets concurrently; return the failed ones."""
+        services = list(dict.fromkeys(
+            target.replace("notify.", "", 1) if target.startswith("notify.") else target
+            for target in targets
+        ))
+        if not services:
+            return []
+
+        results = await asyncio.gather(
+            *[
+                self._hass.services.async_call("notify", service, payload, blocking=False)
+                for service in services
+            ],
+            return_exceptions=True,
+        )
+
+        failed = []
+        for service, result in zip(services, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("Failed to send notification to %s: %s", service, result)
+                failed.append(service)
+        return failed
+
+
+@callback
+def async_get_notification_router(hass: HomeAssistant) -> NotificationRouter:
+    """Return the shared notification router, starting it on first use."""
+    router = hass.data.get(DATA_NOTIFICATION_ROUTER)
+    if router is None:
+        router = NotificationRouter(hass)
+        router.async_start()
+        hass.data[DATA_NOTIFICATION_ROUTER] = router
+    return router
+
+
+@callback
+def async_stop_notification_router(hass: HomeAssistant) -> None:
+    """Stop and drop the shared notification router."""
+    router = hass.data.pop(DATA_NOTIFICATION_ROUTER, None)
+    if router is not None:
+        router.async_stop()
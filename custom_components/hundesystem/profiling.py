@@ -0,0 +1,119 @@
+"""Wall-clock profiling of setup stages, helper domains, services and entity updates."""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROFILER = f"{DOMAIN}_profiler"
+
+PROFILE_SAMPLES = 200          # Most recent spans kept per (category, name)
+SLOW_SPAN = 5.0                # Seconds after which a span is logged as slow
+
+CATEGORY_SETUP = "setup"
+CATEGORY_HELPER_DOMAIN = "helper_domain"
+CATEGORY_SERVICE = "service"
+CATEGORY_ENTITY_UPDATE = "entity_update"
+
+PERCENTILES = [50, 90, 99]
+
+
+def _percentile(values: List[float], pct: int) -> float:
+    """Return the nearest-rank percentile of sorted values."""
+    rank = max(1, math.ceil(pct / 100 * len(values)))
+    return values[rank - 1]
+
+
+class Profiler:
+    """Collect wall-clock spans and aggregate them into percentiles.
+
+    Only the most recent PROFILE_SAMPLES spans per name are kept, so memory
+    stays bounded however long Home Assistant runs; count and total cover
+    every span recorded.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the profiler."""
+        self._samples: Dict[str, Dict[str, Deque[float]]] = {}
+        self._totals: Dict[str, Dict[str, List[float]]] = {}
+
+    @contextmanager
+    def span(self, category: str, name: str) -> Iterator[None]:
+        """Time the enclosed block, whether it succeeds or raises."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(category, name, time.perf_counter() - start)
+
+    def record(self, category: str, name: str, seconds: float) -> None:
+        """Record one span measured elsewhere."""
+        samples = self._samples.setdefault(category, {})
+        if name not in samples:
+            samples[name] = deque(maxlen=PROFILE_SAMPLES)
+        samples[name].append(seconds)
+
+        totals = self._totals.setdefault(category, {}).setdefault(name, [0, 0.0])
+        totals[0] += 1
+        totals[1] += seconds
+
+        if seconds >= SLOW_SPAN:
+            _LOGGER.debug("Slow %s span %s: %.2fs", category, name, seconds)
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Return count, total and percentiles in milliseconds per category and name."""
+        result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        for category, names in self._samples.items():
+            result[category] = {}
+            for name, samples in names.items():
+                values = sorted(samples)
+                count, total = self._totals[category][name]
+                stats = {
+                    "count": count,
+                    "total_ms": round(total * 1000, 1),
+                    "mean_ms": round(sum(values) / len(values) * 1000, 2),
+                    "max_ms": round(values[-1] * 1000, 2),
+                }
+                for pct in PERCENTILES:
+                    stats[f"p{pct}_ms"] = round(_percentile(values, pct) * 1000, 2)
+                result[category][name] = stats
+        return result
+
+    def slowest(self, category: str, pct: int = 90) -> float:
+        """Return the highest percentile in milliseconds across the names of a category."""
+        names = self._samples.get(category, {})
+        if not names:
+            return 0.0
+        return round(max(_percentile(sorted(samples), pct) for samples in names.values()) * 1000, 2)
+
+    def wrap(
+        self, category: str, name: str, func: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Return func with every call timed as a span."""
+
+        @wraps(func)
+        async def _profiled(*args: Any, **kwargs: Any) -> Any:
+            with self.span(category, name):
+                return await func(*args, **kwargs)
+
+        return _profiled
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> Profiler:
+    """Return the shared profiler, creating it on first use."""
+    profiler = hass.data.get(DATA_PROFILER)
+    if profiler is None:
+        profiler = Profiler()
+        hass.data[DATA_PROFILER] = profiler
+    return profiler
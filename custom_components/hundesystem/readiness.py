@@ -0,0 +1,130 @@
+"""Event-driven readiness waiters for Hundesystem setup stages."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from homeassistant.const import EVENT_SERVICE_REGISTERED
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.entity_registry import (
+    EVENT_ENTITY_REGISTRY_UPDATED,
+    async_get as async_get_entity_registry,
+)
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+HELPER_DOMAINS = [
+    "input_boolean", "counter", "input_datetime",
+    "input_text", "input_number", "input_select",
+]
+
+
+def state_present(state: Optional[State]) -> bool:
+    """Entity has any state that is not unavailable."""
+    return state is not None and state.state != "unavailable"
+
+
+def state_valid(state: Optional[State]) -> bool:
+    """Entity has a real value (neither unknown nor unavailable)."""
+    return state is not None and state.state not in ["unknown", "unavailable"]
+
+
+async def async_wait_for_entities(
+    hass: HomeAssistant,
+    entity_ids: Iterable[str],
+    timeout: float,
+    ready: Callable[[Optional[State]], bool] = state_present,
+    include_registry: bool = False,
+) -> List[str]:
+    """Wait until all entities are ready and return the ones that are still missing.
+
+    Returns immediately if everything is ready already; otherwise listens to
+    state_changed (and optionally entity registry) events for the pending
+    entities only, without any polling.
+    """
+    entity_registry = async_get_entity_registry(hass) if include_registry else None
+
+    def _is_ready(entity_id: str) -> bool:
+        if ready(hass.states.get(entity_id)):
+            return True
+        return entity_registry is not None and entity_registry.async_get(entity_id) is not None
+
+    pending = {entity_id for entity_id in entity_ids if not _is_ready(entity_id)}
+    if not pending:
+        return []
+
+    all_ready = asyncio.Event()
+
+    @callback
+    def _entity_event(event: Event) -> None:
+        """Drop entities from the pending set as they become ready."""
+        entity_id = event.data.get("entity_id")
+        if entity_id not in pending:
+            return
+        if "new_state" in event.data:
+            if not ready(event.data.get("new_state")):
+                return
+        elif event.data.get("action") != "create":
+            return
+        pending.discard(entity_id)
+        if not pending:
+            all_ready.set()
+
+    unsubs = [async_track_state_change_event(hass, list(pending), _entity_event)]
+    if include_registry:
+        unsubs.append(hass.bus.async_listen(EVENT_ENTITY_REGISTRY_UPDATED, _entity_event))
+
+    try:
+        await asyncio.wait_for(all_ready.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Entities not ready after %.1fs: %s", timeout, sorted(pending))
+    finally:
+        for unsub in unsubs:
+            unsub()
+
+    return sorted(pending)
+
+
+async def async_wait_for_services(
+    hass: HomeAssistant,
+    services: Iterable[Tuple[str, str]],
+    timeout: float,
+) -> List[Tuple[str, str]]:
+    """Wait until all (domain, service) pairs are registered; return missing ones."""
+    pending = {
+        (domain, service) for domain, service in services
+        if not hass.services.has_service(domain, service)
+    }
+    if not pending:
+        return []
+
+    all_ready = asyncio.Event()
+
+    @callback
+    def _service_registered(event: Event) -> None:
+        """Drop services from the pending set as they are registered."""
+        pending.discard((event.data.get("domain"), event.data.get("service")))
+        if not pending:
+            all_ready.set()
+
+    unsub = hass.bus.async_listen(EVENT_SERVICE_REGISTERED, _service_registered)
+    try:
+        await asyncio.wait_for(all_ready.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        _LOGGER.debug("Services not registered after %.1fs: %s", timeout, sorted(pending))
+    finally:
+        unsub()
+
+    return sorted(pending)
+
+
+async def async_wait_for_helper_domains(hass: HomeAssistant, timeout: float) -> bool:
+    """Wait until every helper domain offers its create service."""
+    missing = await async_wait_for_services(
+        hass, [(domain, "create") for domain in HELPER_DOMAINS], timeout
+    )
+    if missing:
+        _LOGGER.warning("Helper domains not ready after %.1fs: %s", timeout, missing)
+    return not missing
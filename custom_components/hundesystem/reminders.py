@@ -0,0 +1,124 @@
+"""Point-in-time scheduler for feeding reminders."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import FEEDING_TYPES
+from .snapshot import DogStateSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reminders are sent this long before the scheduled feeding time
+REMINDER_LEAD_TIME = timedelta(minutes=30)
+
+
+class FeedingReminderScheduler:
+    """Arm exactly one timer per meal for its next reminder instant.
+
+    The timers are armed from the input_datetime feeding times. A change of
+    one feeding time re-arms only that meal, and after a reminder fires the
+    meal is re-armed for the next day. No work is done between reminders.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        snapshot: DogStateSnapshot,
+        send_reminder: Callable[[str, str], Awaitable[None]],
+    ) -> None:
+        """Initialize the scheduler; send_reminder(meal_type, scheduled_time) sends one reminder."""
+        self._hass = hass
+        self._snapshot = snapshot
+        self._send_reminder = send_reminder
+        self._timers: Dict[str, Callable[[], None]] = {}
+        self._next_reminders: Dict[str, datetime] = {}
+        self._unsub_times: Optional[Callable[[], None]] = None
+
+    @property
+    def next_reminders(self) -> Dict[str, str]:
+        """Return the armed reminder instants per meal."""
+        return {meal: when.isoformat() for meal, when in self._next_reminders.items()}
+
+    @callback
+    def async_start(self) -> None:
+        """Arm all meals and follow changes of their feeding times."""
+        time_entities = {
+            self._snapshot.entity_id("input_datetime", f"feeding_{meal}_time"): meal
+            for meal in FEEDING_TYPES
+        }
+
+        @callback
+        def _feeding_time_changed(event: Event) -> None:
+            """Re-arm the meal whose feeding time changed."""
+            meal_type = time_entities.get(event.data.get("entity_id"))
+            if meal_type is not None:
+                self._async_arm(meal_type)
+
+        self._unsub_times = self._snapshot.async_subscribe(time_entities, _feeding_time_changed)
+
+        for meal_type in FEEDING_TYPES:
+            self._async_arm(meal_type)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel all timers."""
+        if self._unsub_times is not None:
+            self._unsub_times()
+            self._unsub_times = None
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        self._next_reminders.clear()
+
+    def _next_reminder_time(self, meal_type: str, now: datetime) -> Optional[datetime]:
+        """Return the next reminder instant of a meal after now."""
+        scheduled = dt_util.parse_time(self._snapshot.timestamp(f"feeding_{meal_type}_time") or "")
+        if scheduled is None:
+            return None
+
+        reminder = now.replace(
+            hour=scheduled.hour, minute=scheduled.minute, second=0, microsecond=0
+        ) - REMINDER_LEAD_TIME
+        while reminder <= now:
+            reminder += timedelta(days=1)
+        return reminder
+
+    @callback
+    def _async_arm(self, meal_type: str) -> None:
+        """(Re)arm the timer of one meal."""
+        if (cancel := self._timers.pop(meal_type, None)) is not None:
+            cancel()
+        self._next_reminders.pop(meal_type, None)
+
+        when = self._next_reminder_time(meal_type, dt_util.now())
+        if when is None:
+            return
+
+        @callback
+        def _reminder_due(now: datetime) -> None:
+            """Send the reminder and arm the next one."""
+            self._timers.pop(meal_type, None)
+            self._hass.async_create_task(self._async_remind(meal_type))
+            self._async_arm(meal_type)
+
+        self._timers[meal_type] = async_track_point_in_time(self._hass, _reminder_due, when)
+        self._next_reminders[meal_type] = when
+        _LOGGER.debug("Feeding reminder for %s (%s) armed at %s", self._snapshot.dog_name, meal_type, when)
+
+    async def _async_remind(self, meal_type: str) -> None:
+        """Send a reminder unless the meal was given or reminders are off."""
+        if self._snapshot.is_on(f"feeding_{meal_type}"):
+            return
+        if self._snapshot.value("input_boolean", "auto_reminders") == "off":
+            return
+
+        try:
+            await self._send_reminder(meal_type, self._snapshot.timestamp(f"feeding_{meal_type}_time") or "")
+        except Exception as e:
+            _LOGGER.error("Error sending feeding reminder for %s (%s): %s", self._snapshot.dog_name, meal_type, e)
@@ -9,22 +9,28 @@ from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, Sen
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback, State
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
-    CONF_DOG_NAME,
     ICONS,
     ENTITIES,
     STATUS_MESSAGES,
-    MEAL_TYPES,
-    ACTIVITY_TYPES,
     FEEDING_TYPES,
     HEALTH_THRESHOLDS,
 )
+from .analytics import ANALYTICS_DAYS, SERIES_ACTIVITY_TOTAL, get_dog_analytics
+from .coordinator import ESSENTIAL_MEALS, TRACKED_ACTIVITIES, async_get_coordinator
+from .entity import HundesystemCoalescedUpdateMixin
+from .household import entry_dog_names
+from .history import HISTORY_DAYS, DailyHistory
+from .journal import JOURNAL_RECENT_ENTRIES, get_dog_journal
+from .notification_queue import async_get_notification_queue
+from .profiling import CATEGORY_ENTITY_UPDATE, CATEGORY_SERVICE, CATEGORY_SETUP, async_get_profiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,24 +40,31 @@ async def async_setup_entry(
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    """Set up Hundesystem sensors based on a config entry."""
-    dog_name = config_entry.data[CONF_DOG_NAME]
+    """Set up Hundesystem sensors for every dog of a config entry."""
+    dog_names = entry_dog_names(config_entry)
+    entities = []
+    for dog_name in dog_names:
+        entities.extend([
+            HundesystemStatusSensor(hass, config_entry, dog_name),
+            HundesystemFeedingStatusSensor(hass, config_entry, dog_name),
+            HundesystemActivitySensor(hass, config_entry, dog_name),
+            HundesystemDailySummarySensor(hass, config_entry, dog_name),
+            HundesystemLastActivitySensor(hass, config_entry, dog_name),
+            HundesystemHealthScoreSensor(hass, config_entry, dog_name),
+            HundesystemMoodSensor(hass, config_entry, dog_name),
+            HundesystemWeeklySummarySensor(hass, config_entry, dog_name),
+            HundesystemNotificationQueueSensor(hass, config_entry, dog_name),
+            HundesystemJournalSensor(hass, config_entry, dog_name),
+            HundesystemActivityTrendSensor(hass, config_entry, dog_name),
+        ])
     
-    entities = [
-        HundesystemStatusSensor(hass, config_entry, dog_name),
-        HundesystemFeedingStatusSensor(hass, config_entry, dog_name),
-        HundesystemActivitySensor(hass, config_entry, dog_name),
-        HundesystemDailySummarySensor(hass, config_entry, dog_name),
-        HundesystemLastActivitySensor(hass, config_entry, dog_name),
-        HundesystemHealthScoreSensor(hass, config_entry, dog_name),
-        HundesystemMoodSensor(hass, config_entry, dog_name),
-        HundesystemWeeklySummarySensor(hass, config_entry, dog_name),
-    ]
+    # One profiling sensor per entry; the profiler is shared by all dogs
+    entities.append(HundesystemProfilingSensor(hass, config_entry))
     
     async_add_entities(entities, True)
 
 
-class HundesystemSensorBase(SensorEntity, RestoreEntity):
+class HundesystemSensorBase(HundesystemCoalescedUpdateMixin, CoordinatorEntity, SensorEntity, RestoreEntity):
     """Base class for Hundesystem sensors with proper cleanup."""
 
     def __init__(
@@ -62,6 +75,7 @@ class HundesystemSensorBase(SensorEntity, RestoreEntity):
         sensor_type: str,
     ) -> None:
         """Initialize the sensor."""
+        super().__init__(async_get_coordinator(hass, config_entry))
         self.hass = hass
         self._config_entry = config_entry
         self._dog_name = dog_name
@@ -69,6 +83,12 @@ class HundesystemSensorBase(SensorEntity, RestoreEntity):
         self._attr_unique_id = f"{DOMAIN}_{dog_name}_{sensor_type}"
         self._attr_name = f"{dog_name.title()} {sensor_type.replace('_', ' ').title()}"
         
+        # Debounced, coalesced recomputation
+        self._init_coalesced_updates(config_entry)
+        
+        # Shared per-dog state snapshot
+        self._snapshot = self.coordinator.snapshot(dog_name)
+        
         # Track event listeners for cleanup
         self._listeners: List[Callable[[], None]] = []
         
@@ -93,6 +113,8 @@ class HundesystemSensorBase(SensorEntity, RestoreEntity):
 
     async def async_will_remove_from_hass(self) -> None:
         """Clean up when entity is removed."""
+        self._async_cancel_pending_update()
+        
         # Remove all event listeners
         for remove_listener in self._listeners:
             try:
@@ -103,27 +125,36 @@ class HundesystemSensorBase(SensorEntity, RestoreEntity):
         
         await super().async_will_remove_from_hass()
 
+    @property
+    def _data(self) -> Dict[str, Any]:
+        """Return the latest coordinator data of this dog."""
+        return (self.coordinator.data or {}).get(self._dog_name, {})
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Schedule a coalesced recompute if the refresh touched this entity's inputs."""
+        if self._coordinator_update_relevant():
+            self._async_schedule_update()
+
+    async def _async_update_state(self) -> None:
+        """Update the entity state."""
+
     def _track_entity_changes(self, entities: List[str], callback_func: Callable) -> None:
-        """Track entity changes with cleanup registration."""
+        """Track changes of other Hundesystem entities through the shared snapshot."""
         if not entities:
             return
             
-        remove_listener = async_track_state_change_event(
-            self.hass, entities, callback_func
-        )
-        self._listeners.append(remove_listener)
-
-    def _track_time_interval(self, callback_func: Callable, interval: timedelta) -> None:
-        """Track time intervals with cleanup registration."""
-        remove_listener = async_track_time_interval(
-            self.hass, callback_func, interval
-        )
+        remove_listener = self._snapshot.async_subscribe(entities, callback_func)
         self._listeners.append(remove_listener)
 
 
 class HundesystemFeedingStatusSensor(HundesystemSensorBase):
     """Sensor for detailed feeding status."""
 
+    _data_sections = ("feeding",)
+    _source_fields = ()
+    _time_dependent = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -135,98 +166,35 @@ class HundesystemFeedingStatusSensor(HundesystemSensorBase):
         self._attr_icon = ICONS["food"]
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = "feedings"
-        
-        self._feeding_entities = [f"input_boolean.{dog_name}_feeding_{meal}" for meal in FEEDING_TYPES]
-        self._feeding_counters = [f"counter.{dog_name}_feeding_{meal}_count" for meal in FEEDING_TYPES]
-        self._feeding_times = [f"input_datetime.{dog_name}_feeding_{meal}_time" for meal in FEEDING_TYPES]
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track feeding entities
-        tracked_entities = self._feeding_entities + self._feeding_counters + self._feeding_times
-        self._track_entity_changes(tracked_entities, self._feeding_status_changed)
-        
         # Initial update
-        await self._async_update_feeding_status()
-
-    @callback
-    def _feeding_status_changed(self, event) -> None:
-        """Handle feeding status changes - CORRECTED: callback without async."""
-        self.hass.async_create_task(self._async_update_feeding_status())
-        self.async_write_ha_state()
+        await self._async_update_state()
 
-    async def _async_update_feeding_status(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the feeding status."""
         try:
-            feeding_status = {}
-            feeding_counts = {}
-            feeding_times = {}
-            total_fed = 0
-            total_feedings = 0
-            
-            # Process each meal type
-            for i, meal in enumerate(FEEDING_TYPES):
-                # Check if meal was given
-                boolean_entity = self._feeding_entities[i]
-                state = self.hass.states.get(boolean_entity)
-                is_fed = state.state == "on" if state else False
-                feeding_status[meal] = is_fed
-                
-                if is_fed:
-                    total_fed += 1
-                
-                # Get feeding count
-                counter_entity = self._feeding_counters[i]
-                counter_state = self.hass.states.get(counter_entity)
-                count = int(counter_state.state) if counter_state and counter_state.state.isdigit() else 0
-                feeding_counts[meal] = count
-                total_feedings += count
-                
-                # Get scheduled time
-                time_entity = self._feeding_times[i]
-                time_state = self.hass.states.get(time_entity)
-                if time_state and time_state.state not in ["unknown", "unavailable"]:
-                    feeding_times[meal] = time_state.state
-            
-            # Determine status message
-            essential_meals = ["morning", "lunch", "evening"]
-            essential_fed = sum(1 for meal in essential_meals if feeding_status.get(meal, False))
-            
-            if essential_fed == 0:
-                status = "Noch nicht gefüttert"
-                urgency = "high"
-            elif essential_fed < 3:
-                status = f"Teilweise gefüttert ({essential_fed}/3)"
-                urgency = "medium"
-            else:
-                status = "Vollständig gefüttert"
-                urgency = "low"
-                
-            if feeding_status.get("snack", False):
-                status += " (mit Leckerli)"
-            
-            self._attr_native_value = total_feedings
-            
-            # Calculate next meal time
-            next_meal = self._get_next_meal(feeding_status, feeding_times)
+            feeding = self._data.get("feeding")
+            if not feeding:
+                return
             
-            # Check for overfeeding
-            overfeeding_warning = total_feedings > 6  # More than 6 feedings per day
+            self._attr_native_value = feeding["total_feedings"]
             
             self._attr_extra_state_attributes = {
-                "status_text": status,
-                "urgency": urgency,
-                "meals_completed": total_fed,
-                "essential_meals_completed": essential_fed,
-                "feeding_details": feeding_status,
-                "feeding_counts": feeding_counts,
-                "total_feedings_today": total_feedings,
-                "next_meal": next_meal,
-                "scheduled_times": feeding_times,
-                "overfeeding_warning": overfeeding_warning,
-                "last_updated": datetime.now().isoformat(),
+                "status_text": feeding["status_text"],
+                "urgency": feeding["urgency"],
+                "meals_completed": feeding["meals_completed"],
+                "essential_meals_completed": feeding["essential_meals_completed"],
+                "feeding_details": feeding["feeding_status"],
+                "feeding_counts": feeding["feeding_counts"],
+                "total_feedings_today": feeding["total_feedings"],
+                "next_meal": feeding["next_meal"],
+                "scheduled_times": feeding["scheduled_times"],
+                "overfeeding_warning": feeding["overfeeding_warning"],
+                "last_updated": self._data["last_updated"],
             }
             
         except Exception as e:
@@ -237,47 +205,22 @@ class HundesystemFeedingStatusSensor(HundesystemSensorBase):
                 "last_updated": datetime.now().isoformat(),
             }
 
-    def _get_next_meal(self, feeding_status: Dict[str, bool], feeding_times: Dict[str, str]) -> Optional[str]:
-        """Get the next scheduled meal."""
-        try:
-            now = datetime.now()
-            current_time = now.time()
-            
-            # Check each meal in order
-            meal_order = ["morning", "lunch", "evening", "snack"]
-            
-            for meal in meal_order:
-                if not feeding_status.get(meal, False):  # Meal not yet given
-                    scheduled_time = feeding_times.get(meal)
-                    if scheduled_time:
-                        try:
-                            meal_time = datetime.strptime(scheduled_time, "%H:%M:%S").time()
-                            if current_time <= meal_time:
-                                return f"{MEAL_TYPES[meal]} um {scheduled_time[:5]}"
-                        except ValueError:
-                            continue
-            
-            # If all meals are done or we're past all scheduled times
-            if all(feeding_status.get(meal, False) for meal in ["morning", "lunch", "evening"]):
-                return "Alle Hauptmahlzeiten erledigt"
-            else:
-                # Find first incomplete meal for tomorrow
-                for meal in meal_order:
-                    if not feeding_status.get(meal, False):
-                        scheduled_time = feeding_times.get(meal)
-                        if scheduled_time:
-                            return f"{MEAL_TYPES[meal]} morgen um {scheduled_time[:5]}"
-            
-            return None
-            
-        except Exception as e:
-            _LOGGER.error("Error calculating next meal for %s: %s", self._dog_name, e)
-            return "Fehler bei Berechnung"
-
 
 class HundesystemStatusSensor(HundesystemSensorBase):
     """Sensor for overall dog status."""
 
+    _data_sections = ()
+    _source_fields = (
+        ("input_boolean", "emergency_mode"),
+        ("input_select", "health_status"),
+        ("input_boolean", "visitor_mode_input"),
+        ("input_text", "visitor_name"),
+        ("input_boolean", "feeding_morning"),
+        ("input_boolean", "outside"),
+        ("input_boolean", "poop_done"),
+    )
+    _time_dependent = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -288,42 +231,29 @@ class HundesystemStatusSensor(HundesystemSensorBase):
         super().__init__(hass, config_entry, dog_name, ENTITIES["status"])
         self._attr_icon = ICONS["dog"]
         
-        # Entities to monitor for status calculation
-        self._feeding_entities = [f"input_boolean.{dog_name}_feeding_{meal}" for meal in FEEDING_TYPES]
-        self._activity_entities = [
-            f"input_boolean.{dog_name}_outside",
-            f"input_boolean.{dog_name}_poop_done",
-        ]
-        self._status_entities = [
-            f"input_boolean.{dog_name}_visitor_mode_input",
-            f"input_boolean.{dog_name}_emergency_mode",
-            f"input_select.{dog_name}_health_status",
-            f"binary_sensor.{dog_name}_needs_attention",
-        ]
+        # Helper changes arrive through the coordinator; only the attention sensor is tracked directly
+        self._attention_entity = self._snapshot.entity_id("binary_sensor", "needs_attention")
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track all relevant entities
-        tracked_entities = self._feeding_entities + self._activity_entities + self._status_entities
-        self._track_entity_changes(tracked_entities, self._status_changed)
+        # Track the needs attention sensor
+        self._track_entity_changes([self._attention_entity], self._status_changed)
         
         # Initial update
-        await self._async_update_status()
+        await self._async_update_state()
 
     @callback
     def _status_changed(self, event) -> None:
         """Handle state changes that affect overall status - CORRECTED."""
-        self.hass.async_create_task(self._async_update_status())
-        self.async_write_ha_state()
+        self._async_schedule_update()
 
-    async def _async_update_status(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the overall status."""
         try:
             # Check emergency mode first
-            emergency_state = self.hass.states.get(f"input_boolean.{self._dog_name}_emergency_mode")
-            if emergency_state and emergency_state.state == "on":
+            if self._snapshot.is_on("emergency_mode"):
                 self._attr_native_value = STATUS_MESSAGES["emergency"]
                 self._attr_icon = ICONS["emergency"]
                 self._attr_extra_state_attributes = {
@@ -334,8 +264,7 @@ class HundesystemStatusSensor(HundesystemSensorBase):
                 return
 
             # Check health status
-            health_state = self.hass.states.get(f"input_select.{self._dog_name}_health_status")
-            health_status = health_state.state if health_state else "Gut"
+            health_status = self._snapshot.option("health_status", "Gut")
             
             if health_status in ["Krank", "Notfall"]:
                 self._attr_native_value = STATUS_MESSAGES["sick"]
@@ -349,12 +278,10 @@ class HundesystemStatusSensor(HundesystemSensorBase):
                 return
 
             # Check visitor mode
-            visitor_state = self.hass.states.get(f"input_boolean.{self._dog_name}_visitor_mode_input")
-            visitor_mode = visitor_state.state == "on" if visitor_state else False
+            visitor_mode = self._snapshot.is_on("visitor_mode_input")
             
             if visitor_mode:
-                visitor_name_state = self.hass.states.get(f"input_text.{self._dog_name}_visitor_name")
-                visitor_name = visitor_name_state.state if visitor_name_state else ""
+                visitor_name = self._snapshot.text("visitor_name")
                 
                 self._attr_native_value = STATUS_MESSAGES["visitor_mode"]
                 self._attr_icon = ICONS["visitor"]
@@ -367,8 +294,7 @@ class HundesystemStatusSensor(HundesystemSensorBase):
                 return
 
             # Check if attention is needed
-            attention_state = self.hass.states.get(f"binary_sensor.{self._dog_name}_needs_attention")
-            needs_attention = attention_state.state == "on" if attention_state else False
+            needs_attention = self._snapshot.value("binary_sensor", "needs_attention") == "on"
             
             if needs_attention:
                 self._attr_native_value = STATUS_MESSAGES["attention_needed"]
@@ -427,20 +353,17 @@ class HundesystemStatusSensor(HundesystemSensorBase):
         unmet_needs = []
         
         # Check feeding (at least morning meal)
-        morning_fed_state = self.hass.states.get(f"input_boolean.{self._dog_name}_feeding_morning")
-        needs["fed"] = morning_fed_state.state == "on" if morning_fed_state else False
+        needs["fed"] = self._snapshot.is_on("feeding_morning")
         if not needs["fed"]:
             unmet_needs.append("Frühstück")
         
         # Check outside activity
-        outside_state = self.hass.states.get(f"input_boolean.{self._dog_name}_outside")
-        needs["outside"] = outside_state.state == "on" if outside_state else False
+        needs["outside"] = self._snapshot.is_on("outside")
         if not needs["outside"]:
             unmet_needs.append("Draußen")
             
         # Check bathroom needs
-        poop_state = self.hass.states.get(f"input_boolean.{self._dog_name}_poop_done")
-        needs["poop"] = poop_state.state == "on" if poop_state else False
+        needs["poop"] = self._snapshot.is_on("poop_done")
         if not needs["poop"]:
             unmet_needs.append("Geschäft")
         
@@ -456,6 +379,10 @@ class HundesystemStatusSensor(HundesystemSensorBase):
 class HundesystemActivitySensor(HundesystemSensorBase):
     """Sensor for activity tracking."""
 
+    _data_sections = ("activity",)
+    _source_fields = ()
+    _time_dependent = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -467,89 +394,26 @@ class HundesystemActivitySensor(HundesystemSensorBase):
         self._attr_icon = ICONS["walk"]
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_native_unit_of_measurement = "activities"
-        
-        self._activity_counters = [
-            f"counter.{dog_name}_outside_count",
-            f"counter.{dog_name}_walk_count",
-            f"counter.{dog_name}_play_count",
-            f"counter.{dog_name}_training_count",
-        ]
-        
-        self._activity_times = [
-            f"input_datetime.{dog_name}_last_outside",
-            f"input_datetime.{dog_name}_last_walk",
-            f"input_datetime.{dog_name}_last_play",
-            f"input_datetime.{dog_name}_last_training",
-        ]
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track activity entities
-        tracked_entities = self._activity_counters + self._activity_times
-        self._track_entity_changes(tracked_entities, self._activity_changed)
-        
-        # Update every hour
-        self._track_time_interval(self._periodic_update, timedelta(hours=1))
-        
         # Initial update
-        await self._async_update_activity()
-
-    @callback
-    def _activity_changed(self, event) -> None:
-        """Handle activity changes - CORRECTED."""
-        self.hass.async_create_task(self._async_update_activity())
-        self.async_write_ha_state()
-
-    @callback
-    def _periodic_update(self, time) -> None:
-        """Periodic update callback - CORRECTED."""
-        self.hass.async_create_task(self._async_update_activity())
+        await self._async_update_state()
 
-    async def _async_update_activity(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the activity status."""
         try:
-            activity_counts = {}
-            activity_times = {}
-            total_activities = 0
-            
-            activity_types = ["outside", "walk", "play", "training"]
-            
-            for i, activity in enumerate(activity_types):
-                # Get counter value
-                counter_entity = self._activity_counters[i]
-                counter_state = self.hass.states.get(counter_entity)
-                count = int(counter_state.state) if counter_state and counter_state.state.isdigit() else 0
-                activity_counts[activity] = count
-                total_activities += count
-                
-                # Get last time
-                time_entity = self._activity_times[i]
-                time_state = self.hass.states.get(time_entity)
-                if time_state and time_state.state not in ["unknown", "unavailable"]:
-                    activity_times[f"last_{activity}"] = time_state.state
-            
-            # Calculate activity level
-            activity_level = self._calculate_activity_level(activity_counts)
-            
-            # Find most recent activity
-            most_recent_activity = self._get_most_recent_activity(activity_times)
-            
-            # Check if dog needs more activity
-            needs_activity = self._check_activity_needs(activity_counts, activity_times)
+            activity = self._data.get("activity")
+            if not activity:
+                return
             
-            self._attr_native_value = total_activities
+            self._attr_native_value = activity["total_today"]
             
             self._attr_extra_state_attributes = {
-                "activity_counts": activity_counts,
-                "activity_times": activity_times,
-                "activity_level": activity_level,
-                "most_recent_activity": most_recent_activity,
-                "needs_more_activity": needs_activity["needs_more"],
-                "activity_recommendations": needs_activity["recommendations"],
-                "total_today": total_activities,
-                "last_updated": datetime.now().isoformat(),
+                **activity,
+                "last_updated": self._data["last_updated"],
             }
             
         except Exception as e:
@@ -560,95 +424,22 @@ class HundesystemActivitySensor(HundesystemSensorBase):
                 "last_updated": datetime.now().isoformat(),
             }
 
-    def _calculate_activity_level(self, activity_counts: Dict[str, int]) -> str:
-        """Calculate overall activity level."""
-        total = sum(activity_counts.values())
-        
-        if total == 0:
-            return "Sehr niedrig"
-        elif total <= 2:
-            return "Niedrig"
-        elif total <= 5:
-            return "Normal"
-        elif total <= 8:
-            return "Hoch"
-        else:
-            return "Sehr hoch"
-
-    def _get_most_recent_activity(self, activity_times: Dict[str, str]) -> Optional[str]:
-        """Get the most recent activity."""
-        try:
-            most_recent = None
-            most_recent_time = None
-            
-            for activity, time_str in activity_times.items():
-                if time_str and time_str not in ["unknown", "unavailable"]:
-                    try:
-                        activity_time = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                        if most_recent_time is None or activity_time > most_recent_time:
-                            most_recent = activity.replace("last_", "")
-                            most_recent_time = activity_time
-                    except ValueError:
-                        continue
-            
-            if most_recent and most_recent_time:
-                time_ago = datetime.now(most_recent_time.tzinfo) - most_recent_time
-                hours_ago = time_ago.total_seconds() / 3600
-                
-                if hours_ago < 1:
-                    time_desc = "vor weniger als 1 Stunde"
-                elif hours_ago < 24:
-                    time_desc = f"vor {int(hours_ago)} Stunden"
-                else:
-                    days_ago = int(hours_ago / 24)
-                    time_desc = f"vor {days_ago} Tag(en)"
-                
-                return f"{ACTIVITY_TYPES.get(most_recent, most_recent)} {time_desc}"
-            
-            return "Keine Aktivität heute"
-            
-        except Exception as e:
-            _LOGGER.error("Error calculating most recent activity: %s", e)
-            return "Fehler bei Berechnung"
-
-    def _check_activity_needs(self, activity_counts: Dict[str, int], activity_times: Dict[str, str]) -> Dict[str, Any]:
-        """Check if dog needs more activity."""
-        recommendations = []
-        needs_more = False
-        
-        # Check minimum requirements
-        if activity_counts.get("outside", 0) < 3:
-            needs_more = True
-            recommendations.append("Mehr Gartenbesuche")
-        
-        if activity_counts.get("walk", 0) < 1:
-            needs_more = True
-            recommendations.append("Spaziergang")
-        
-        # Check time since last activities
-        now = datetime.now()
-        
-        # Check outside time
-        last_outside = activity_times.get("last_outside")
-        if last_outside:
-            try:
-                last_time = datetime.fromisoformat(last_outside.replace("Z", "+00:00"))
-                hours_since = (now - last_time.replace(tzinfo=None)).total_seconds() / 3600
-                if hours_since > 6:
-                    needs_more = True
-                    recommendations.append("War lange nicht draußen")
-            except ValueError:
-                pass
-        
-        return {
-            "needs_more": needs_more,
-            "recommendations": recommendations,
-        }
-
 
 class HundesystemDailySummarySensor(HundesystemSensorBase):
     """Sensor for daily summary."""
 
+    _data_sections = ()
+    _source_fields = (
+        *(("input_boolean", f"feeding_{meal}") for meal in FEEDING_TYPES),
+        ("counter", "outside_count"),
+        ("counter", "walk_count"),
+        ("counter", "play_count"),
+        ("counter", "training_count"),
+        ("input_select", "health_status"),
+        ("input_boolean", "emergency_mode"),
+    )
+    _time_dependent = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -664,18 +455,10 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Update every 30 minutes
-        self._track_time_interval(self._periodic_summary_update, timedelta(minutes=30))
-        
         # Initial update
-        await self._async_update_daily_summary()
+        await self._async_update_state()
 
-    @callback
-    def _periodic_summary_update(self, time) -> None:
-        """Periodic summary update - CORRECTED."""
-        self.hass.async_create_task(self._async_update_daily_summary())
-
-    async def _async_update_daily_summary(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the daily summary."""
         try:
             # Get feeding status
@@ -733,13 +516,11 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
         # Essential meals (7 points total)
         essential_meals = ["morning", "lunch", "evening"]
         for meal in essential_meals:
-            state = self.hass.states.get(f"input_boolean.{self._dog_name}_feeding_{meal}")
-            if state and state.state == "on":
+            if self._snapshot.is_on(f"feeding_{meal}"):
                 score += 2.33  # ~7 points for all 3 meals
         
         # Snack bonus (1 point)
-        snack_state = self.hass.states.get(f"input_boolean.{self._dog_name}_feeding_snack")
-        if snack_state and snack_state.state == "on":
+        if self._snapshot.is_on("feeding_snack"):
             score += 1
         
         # Regularity bonus (2 points) - check if meals were on time
@@ -752,23 +533,19 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
         score = 0
         
         # Outside visits (4 points)
-        outside_count_state = self.hass.states.get(f"counter.{self._dog_name}_outside_count")
-        outside_count = int(outside_count_state.state) if outside_count_state and outside_count_state.state.isdigit() else 0
+        outside_count = self._snapshot.count("outside_count")
         score += min(outside_count * 1, 4)  # Max 4 points
         
         # Walks (3 points)
-        walk_count_state = self.hass.states.get(f"counter.{self._dog_name}_walk_count")
-        walk_count = int(walk_count_state.state) if walk_count_state and walk_count_state.state.isdigit() else 0
+        walk_count = self._snapshot.count("walk_count")
         score += min(walk_count * 1.5, 3)  # Max 3 points
         
         # Play time (2 points)
-        play_count_state = self.hass.states.get(f"counter.{self._dog_name}_play_count")
-        play_count = int(play_count_state.state) if play_count_state and play_count_state.state.isdigit() else 0
+        play_count = self._snapshot.count("play_count")
         score += min(play_count * 1, 2)  # Max 2 points
         
         # Training (1 point)
-        training_count_state = self.hass.states.get(f"counter.{self._dog_name}_training_count")
-        training_count = int(training_count_state.state) if training_count_state and training_count_state.state.isdigit() else 0
+        training_count = self._snapshot.count("training_count")
         score += min(training_count * 1, 1)  # Max 1 point
         
         return min(score, 10)
@@ -778,8 +555,7 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
         score = 10  # Start with perfect score
         
         # Health status
-        health_state = self.hass.states.get(f"input_select.{self._dog_name}_health_status")
-        health_status = health_state.state if health_state else "Gut"
+        health_status = self._snapshot.option("health_status", "Gut")
         
         health_scores = {
             "Ausgezeichnet": 10,
@@ -792,8 +568,7 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
         score = health_scores.get(health_status, 6)
         
         # Emergency mode penalty
-        emergency_state = self.hass.states.get(f"input_boolean.{self._dog_name}_emergency_mode")
-        if emergency_state and emergency_state.state == "on":
+        if self._snapshot.is_on("emergency_mode"):
             score = min(score, 2)
         
         return score
@@ -820,6 +595,13 @@ class HundesystemDailySummarySensor(HundesystemSensorBase):
 class HundesystemLastActivitySensor(HundesystemSensorBase):
     """Sensor for last activity tracking."""
 
+    _data_sections = ()
+    _source_fields = (
+        *(("input_datetime", f"last_{activity}") for activity in TRACKED_ACTIVITIES),
+        *(("input_datetime", f"last_feeding_{meal}") for meal in FEEDING_TYPES),
+    )
+    _time_dependent = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -831,34 +613,25 @@ class HundesystemLastActivitySensor(HundesystemSensorBase):
         self._attr_icon = ICONS["status"]
         self._attr_device_class = SensorDeviceClass.TIMESTAMP
         
-        self._activity_times = [
-            f"input_datetime.{dog_name}_last_outside",
-            f"input_datetime.{dog_name}_last_walk",
-            f"input_datetime.{dog_name}_last_play",
-            f"input_datetime.{dog_name}_last_training",
-            f"input_datetime.{dog_name}_last_feeding_morning",
-            f"input_datetime.{dog_name}_last_feeding_lunch",
-            f"input_datetime.{dog_name}_last_feeding_evening",
-            f"input_datetime.{dog_name}_last_feeding_snack",
+        self._activity_keys = [
+            "last_outside",
+            "last_walk",
+            "last_play",
+            "last_training",
+            "last_feeding_morning",
+            "last_feeding_lunch",
+            "last_feeding_evening",
+            "last_feeding_snack",
         ]
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track activity time entities
-        self._track_entity_changes(self._activity_times, self._last_activity_changed)
-        
         # Initial update
-        await self._async_update_last_activity()
-
-    @callback
-    def _last_activity_changed(self, event) -> None:
-        """Handle last activity changes - CORRECTED."""
-        self.hass.async_create_task(self._async_update_last_activity())
-        self.async_write_ha_state()
+        await self._async_update_state()
 
-    async def _async_update_last_activity(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the last activity timestamp."""
         try:
             latest_activity = None
@@ -876,18 +649,16 @@ class HundesystemLastActivitySensor(HundesystemSensorBase):
                 "last_feeding_snack": "Leckerli",
             }
             
-            for entity_id in self._activity_times:
-                state = self.hass.states.get(entity_id)
-                if state and state.state not in ["unknown", "unavailable"]:
+            for activity_key in self._activity_keys:
+                time_value = self._snapshot.timestamp(activity_key)
+                if time_value:
                     try:
-                        activity_time = datetime.fromisoformat(state.state.replace("Z", "+00:00"))
+                        activity_time = datetime.fromisoformat(time_value.replace("Z", "+00:00"))
                         
-                        # Extract activity name from entity id
-                        activity_key = entity_id.split(f"{self._dog_name}_")[1]
                         activity_name = activity_names.get(activity_key, activity_key)
                         
                         activity_details[activity_name] = {
-                            "time": state.state,
+                            "time": time_value,
                             "time_ago": self._get_time_ago(activity_time),
                         }
                         
@@ -896,7 +667,7 @@ class HundesystemLastActivitySensor(HundesystemSensorBase):
                             latest_time = activity_time
                             
                     except ValueError as e:
-                        _LOGGER.debug("Error parsing time for %s: %s", entity_id, e)
+                        _LOGGER.debug("Error parsing time for %s: %s", activity_key, e)
                         continue
             
             if latest_time:
@@ -949,6 +720,10 @@ class HundesystemLastActivitySensor(HundesystemSensorBase):
 class HundesystemHealthScoreSensor(HundesystemSensorBase):
     """Sensor for health score calculation."""
 
+    _data_sections = ("health",)
+    _source_fields = ()
+    _time_dependent = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -960,60 +735,29 @@ class HundesystemHealthScoreSensor(HundesystemSensorBase):
         self._attr_icon = ICONS["health"]
         self._attr_state_class = SensorStateClass.MEASUREMENT
         self._attr_native_unit_of_measurement = "points"
-        
-        self._health_entities = [
-            f"input_select.{dog_name}_health_status",
-            f"input_select.{dog_name}_mood",
-            f"input_select.{dog_name}_energy_level_category",
-            f"input_select.{dog_name}_appetite_level",
-            f"input_number.{dog_name}_health_score",
-            f"input_boolean.{dog_name}_emergency_mode",
-        ]
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track health entities
-        self._track_entity_changes(self._health_entities, self._health_score_changed)
-        
         # Initial update
-        await self._async_update_health_score()
+        await self._async_update_state()
 
-    @callback
-    def _health_score_changed(self, event) -> None:
-        """Handle health score changes - CORRECTED."""
-        self.hass.async_create_task(self._async_update_health_score())
-        self.async_write_ha_state()
-
-    async def _async_update_health_score(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the health score."""
         try:
-            health_metrics = self._get_health_metrics()
-            calculated_score = self._calculate_comprehensive_health_score(health_metrics)
-            
-            # Determine health status
-            if calculated_score >= 9:
-                status = "Ausgezeichnet"
-                concerns = []
-            elif calculated_score >= 7:
-                status = "Gut"
-                concerns = self._identify_minor_concerns(health_metrics)
-            elif calculated_score >= 5:
-                status = "Durchschnittlich"
-                concerns = self._identify_moderate_concerns(health_metrics)
-            else:
-                status = "Bedenklich"
-                concerns = self._identify_major_concerns(health_metrics)
+            health = self._data.get("health")
+            if not health:
+                return
             
-            self._attr_native_value = calculated_score
+            self._attr_native_value = health["score"]
             
             self._attr_extra_state_attributes = {
-                "health_status": status,
-                "health_metrics": health_metrics,
-                "concerns": concerns,
-                "recommendations": self._get_health_recommendations(health_metrics, concerns),
-                "last_calculation": datetime.now().isoformat(),
+                "health_status": health["health_status"],
+                "health_metrics": health["health_metrics"],
+                "concerns": health["concerns"],
+                "recommendations": health["recommendations"],
+                "last_calculation": self._data["last_updated"],
             }
             
         except Exception as e:
@@ -1024,171 +768,14 @@ class HundesystemHealthScoreSensor(HundesystemSensorBase):
                 "last_updated": datetime.now().isoformat(),
             }
 
-    def _get_health_metrics(self) -> Dict[str, Any]:
-        """Get all health-related metrics."""
-        metrics = {}
-        
-        # Health status
-        health_state = self.hass.states.get(f"input_select.{self._dog_name}_health_status")
-        metrics["health_status"] = health_state.state if health_state else "Gut"
-        
-        # Mood
-        mood_state = self.hass.states.get(f"input_select.{self._dog_name}_mood")
-        metrics["mood"] = mood_state.state if mood_state else "Glücklich"
-        
-        # Energy level
-        energy_state = self.hass.states.get(f"input_select.{self._dog_name}_energy_level_category")
-        metrics["energy_level"] = energy_state.state if energy_state else "Normal"
-        
-        # Appetite
-        appetite_state = self.hass.states.get(f"input_select.{self._dog_name}_appetite_level")
-        metrics["appetite"] = appetite_state.state if appetite_state else "Normal"
-        
-        # Manual health score
-        health_score_state = self.hass.states.get(f"input_number.{self._dog_name}_health_score")
-        if health_score_state and health_score_state.state not in ["unknown", "unavailable"]:
-            try:
-                metrics["manual_score"] = float(health_score_state.state)
-            except ValueError:
-                metrics["manual_score"] = None
-        else:
-            metrics["manual_score"] = None
-        
-        # Emergency mode
-        emergency_state = self.hass.states.get(f"input_boolean.{self._dog_name}_emergency_mode")
-        metrics["emergency_mode"] = emergency_state.state == "on" if emergency_state else False
-        
-        return metrics
-
-    def _calculate_comprehensive_health_score(self, metrics: Dict[str, Any]) -> float:
-        """Calculate comprehensive health score."""
-        if metrics.get("emergency_mode", False):
-            return 0.0
-        
-        # Start with manual score if available
-        if metrics.get("manual_score") is not None:
-            base_score = metrics["manual_score"]
-        else:
-            # Calculate based on status indicators
-            status_scores = {
-                "Ausgezeichnet": 10,
-                "Gut": 8,
-                "Normal": 6,
-                "Schwach": 4,
-                "Krank": 2,
-                "Notfall": 0,
-            }
-            base_score = status_scores.get(metrics.get("health_status", "Gut"), 6)
-        
-        # Adjust based on mood
-        mood_adjustments = {
-            "Sehr glücklich": 1.0,
-            "Glücklich": 0.5,
-            "Neutral": 0.0,
-            "Gestresst": -1.0,
-            "Ängstlich": -1.5,
-            "Krank": -3.0,
-        }
-        base_score += mood_adjustments.get(metrics.get("mood", "Glücklich"), 0)
-        
-        # Adjust based on energy level
-        energy_adjustments = {
-            "Hyperaktiv": -0.5,  # Might indicate stress
-            "Energiegeladen": 0.5,
-            "Normal": 0.0,
-            "Müde": -0.5,
-            "Sehr müde": -1.5,
-        }
-        base_score += energy_adjustments.get(metrics.get("energy_level", "Normal"), 0)
-        
-        # Adjust based on appetite
-        appetite_adjustments = {
-            "Sehr hungrig": 0.0,  # Normal for healthy dogs
-            "Guter Appetit": 0.5,
-            "Normal": 0.0,
-            "Wenig Appetit": -1.0,
-            "Kein Appetit": -2.0,
-        }
-        base_score += appetite_adjustments.get(metrics.get("appetite", "Normal"), 0)
-        
-        return max(0.0, min(10.0, base_score))
-
-    def _identify_minor_concerns(self, metrics: Dict[str, Any]) -> List[str]:
-        """Identify minor health concerns."""
-        concerns = []
-        
-        if metrics.get("energy_level") in ["Müde", "Sehr müde"]:
-            concerns.append("Niedrige Energie")
-        
-        if metrics.get("mood") == "Gestresst":
-            concerns.append("Leichter Stress")
-        
-        if metrics.get("appetite") == "Wenig Appetit":
-            concerns.append("Reduzierter Appetit")
-        
-        return concerns
-
-    def _identify_moderate_concerns(self, metrics: Dict[str, Any]) -> List[str]:
-        """Identify moderate health concerns."""
-        concerns = []
-        
-        if metrics.get("health_status") in ["Normal", "Schwach"]:
-            concerns.append("Gesundheitsstatus unter optimal")
-        
-        if metrics.get("mood") == "Ängstlich":
-            concerns.append("Anzeichen von Angst")
-        
-        if metrics.get("appetite") == "Kein Appetit":
-            concerns.append("Appetitlosigkeit")
-        
-        if metrics.get("energy_level") == "Sehr müde":
-            concerns.append("Extreme Müdigkeit")
-        
-        return concerns
-
-    def _identify_major_concerns(self, metrics: Dict[str, Any]) -> List[str]:
-        """Identify major health concerns."""
-        concerns = []
-        
-        if metrics.get("health_status") in ["Krank", "Notfall"]:
-            concerns.append("Ernste Gesundheitsprobleme")
-        
-        if metrics.get("mood") == "Krank":
-            concerns.append("Krankheitsanzeichen")
-        
-        if metrics.get("emergency_mode", False):
-            concerns.append("Notfallsituation")
-        
-        return concerns
-
-    def _get_health_recommendations(self, metrics: Dict[str, Any], concerns: List[str]) -> List[str]:
-        """Get health recommendations based on metrics and concerns."""
-        recommendations = []
-        
-        if "Niedrige Energie" in concerns:
-            recommendations.append("Mehr Ruhe und sanfte Aktivitäten")
-        
-        if "Leichter Stress" in concerns or "Anzeichen von Angst" in concerns:
-            recommendations.append("Stressreduktion und beruhigende Umgebung")
-        
-        if "Reduzierter Appetit" in concerns or "Appetitlosigkeit" in concerns:
-            recommendations.append("Tierarzt konsultieren für Appetitprobleme")
-        
-        if "Ernste Gesundheitsprobleme" in concerns:
-            recommendations.append("Sofortige tierärztliche Behandlung erforderlich")
-        
-        if "Notfallsituation" in concerns:
-            recommendations.append("Notfall-Tierarzt kontaktieren")
-        
-        if not concerns:
-            recommendations.append("Weiterhin gute Pflege beibehalten")
-        
-        return recommendations
-
 
 class HundesystemMoodSensor(HundesystemSensorBase):
     """Sensor for mood tracking."""
 
+    _data_sections = ("mood",)
+    _source_fields = ()
+    _time_dependent = False
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -1198,69 +785,33 @@ class HundesystemMoodSensor(HundesystemSensorBase):
         """Initialize the mood sensor."""
         super().__init__(hass, config_entry, dog_name, ENTITIES["mood"])
         self._attr_icon = ICONS["happy"]
-        
-        self._mood_entities = [
-            f"input_select.{dog_name}_mood",
-            f"input_select.{dog_name}_energy_level_category",
-            f"input_boolean.{dog_name}_feeling_well",
-            f"input_boolean.{dog_name}_played_today",
-            f"input_boolean.{dog_name}_socialized_today",
-        ]
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Track mood entities
-        self._track_entity_changes(self._mood_entities, self._mood_changed)
-        
         # Initial update
-        await self._async_update_mood()
+        await self._async_update_state()
 
-    @callback
-    def _mood_changed(self, event) -> None:
-        """Handle mood changes - CORRECTED."""
-        self.hass.async_create_task(self._async_update_mood())
-        self.async_write_ha_state()
-
-    async def _async_update_mood(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the mood status."""
         try:
-            # Get primary mood
-            mood_state = self.hass.states.get(f"input_select.{self._dog_name}_mood")
-            primary_mood = mood_state.state if mood_state else "Glücklich"
-            
-            # Get supporting indicators
-            energy_state = self.hass.states.get(f"input_select.{self._dog_name}_energy_level_category")
-            energy_level = energy_state.state if energy_state else "Normal"
-            
-            feeling_well_state = self.hass.states.get(f"input_boolean.{self._dog_name}_feeling_well")
-            feeling_well = feeling_well_state.state == "on" if feeling_well_state else True
-            
-            played_state = self.hass.states.get(f"input_boolean.{self._dog_name}_played_today")
-            played_today = played_state.state == "on" if played_state else False
-            
-            socialized_state = self.hass.states.get(f"input_boolean.{self._dog_name}_socialized_today")
-            socialized_today = socialized_state.state == "on" if socialized_state else False
-            
-            # Calculate mood score (0-10)
-            mood_score = self._calculate_mood_score(primary_mood, energy_level, feeling_well, played_today, socialized_today)
-            
-            # Determine mood description and icon
-            mood_description, mood_icon = self._get_mood_description_and_icon(primary_mood, mood_score)
+            mood = self._data.get("mood")
+            if not mood:
+                return
             
-            self._attr_native_value = primary_mood
-            self._attr_icon = mood_icon
+            self._attr_native_value = mood["mood"]
+            self._attr_icon = mood["icon"]
             
             self._attr_extra_state_attributes = {
-                "mood_score": mood_score,
-                "mood_description": mood_description,
-                "energy_level": energy_level,
-                "feeling_well": feeling_well,
-                "played_today": played_today,
-                "socialized_today": socialized_today,
-                "mood_factors": self._analyze_mood_factors(primary_mood, energy_level, feeling_well, played_today, socialized_today),
-                "last_updated": datetime.now().isoformat(),
+                "mood_score": mood["mood_score"],
+                "mood_description": mood["mood_description"],
+                "energy_level": mood["energy_level"],
+                "feeling_well": mood["feeling_well"],
+                "played_today": mood["played_today"],
+                "socialized_today": mood["socialized_today"],
+                "mood_factors": mood["mood_factors"],
+                "last_updated": self._data["last_updated"],
             }
             
         except Exception as e:
@@ -1271,94 +822,14 @@ class HundesystemMoodSensor(HundesystemSensorBase):
                 "last_updated": datetime.now().isoformat(),
             }
 
-    def _calculate_mood_score(self, mood: str, energy: str, feeling_well: bool, played: bool, socialized: bool) -> float:
-        """Calculate numeric mood score."""
-        mood_scores = {
-            "Sehr glücklich": 10,
-            "Glücklich": 8,
-            "Neutral": 6,
-            "Gestresst": 4,
-            "Ängstlich": 2,
-            "Krank": 1,
-        }
-        
-        base_score = mood_scores.get(mood, 6)
-        
-        # Adjust based on other factors
-        if not feeling_well:
-            base_score -= 2
-        
-        if played:
-            base_score += 0.5
-        
-        if socialized:
-            base_score += 0.5
-        
-        # Energy level adjustments
-        energy_adjustments = {
-            "Hyperaktiv": -0.5,
-            "Energiegeladen": 0.5,
-            "Normal": 0,
-            "Müde": -0.5,
-            "Sehr müde": -1,
-        }
-        base_score += energy_adjustments.get(energy, 0)
-        
-        return max(0, min(10, base_score))
-
-    def _get_mood_description_and_icon(self, primary_mood: str, score: float) -> tuple:
-        """Get mood description and appropriate icon."""
-        if score >= 9:
-            return "Fantastische Stimmung", ICONS["happy"]
-        elif score >= 7:
-            return "Gute Stimmung", ICONS["dog"]
-        elif score >= 5:
-            return "Durchschnittliche Stimmung", ICONS["status"]
-        elif score >= 3:
-            return "Schlechte Stimmung", ICONS["attention"]
-        else:
-            return "Sehr schlechte Stimmung", ICONS["emergency"]
-
-    def _analyze_mood_factors(self, mood: str, energy: str, feeling_well: bool, played: bool, socialized: bool) -> Dict[str, Any]:
-        """Analyze factors affecting mood."""
-        positive_factors = []
-        negative_factors = []
-        
-        if mood in ["Sehr glücklich", "Glücklich"]:
-            positive_factors.append("Positive Grundstimmung")
-        elif mood in ["Gestresst", "Ängstlich", "Krank"]:
-            negative_factors.append(f"Beeinträchtigte Stimmung: {mood}")
-        
-        if feeling_well:
-            positive_factors.append("Fühlt sich wohl")
-        else:
-            negative_factors.append("Fühlt sich nicht wohl")
-        
-        if played:
-            positive_factors.append("Hat heute gespielt")
-        else:
-            negative_factors.append("Hat heute noch nicht gespielt")
-        
-        if socialized:
-            positive_factors.append("Sozialer Kontakt heute")
-        else:
-            negative_factors.append("Kein sozialer Kontakt heute")
-        
-        if energy in ["Energiegeladen", "Normal"]:
-            positive_factors.append(f"Gutes Energielevel: {energy}")
-        else:
-            negative_factors.append(f"Niedriges Energielevel: {energy}")
-        
-        return {
-            "positive_factors": positive_factors,
-            "negative_factors": negative_factors,
-            "overall_assessment": "Positiv" if len(positive_factors) > len(negative_factors) else "Verbesserungswürdig"
-        }
-
 
 class HundesystemWeeklySummarySensor(HundesystemSensorBase):
     """Sensor for weekly summary and trends."""
 
+    _data_sections = ("feeding", "health")
+    _source_fields = ()
+    _time_dependent = True
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -1374,30 +845,21 @@ class HundesystemWeeklySummarySensor(HundesystemSensorBase):
         """When entity is added to hass."""
         await super().async_added_to_hass()
         
-        # Update daily at midnight
-        self._track_time_interval(self._daily_summary_update, timedelta(days=1))
-        
         # Initial update
-        await self._async_update_weekly_summary()
-
-    @callback
-    def _daily_summary_update(self, time) -> None:
-        """Daily summary update - CORRECTED."""
-        self.hass.async_create_task(self._async_update_weekly_summary())
+        await self._async_update_state()
 
-    async def _async_update_weekly_summary(self) -> None:
+    async def _async_update_state(self) -> None:
         """Update the weekly summary."""
         try:
-            # Get daily summary sensor for trend analysis
-            daily_sensor = self.hass.states.get(f"sensor.{self._dog_name}_daily_summary")
-            current_daily_score = float(daily_sensor.state) if daily_sensor and daily_sensor.state.replace('.', '').isdigit() else 0
+            history = self.coordinator.history(self._dog_name)
             
-            # Calculate weekly metrics (simplified for demo)
+            # Calculate weekly metrics over the rolling 7 day window
             weekly_metrics = {
-                "average_daily_score": current_daily_score,  # In real implementation, would track 7 days
-                "feeding_consistency": self._calculate_feeding_consistency(),
-                "activity_trend": self._calculate_activity_trend(),
-                "health_trend": self._calculate_health_trend(),
+                "average_daily_score": self._calculate_average_daily_score(history, 7),
+                "feeding_consistency": self._calculate_feeding_consistency(history, 7),
+                "activity_trend": self._calculate_activity_trend(history, 7),
+                "health_trend": self._calculate_health_trend(history, 7),
+                "days_recorded": len(history.days(7)) if history else 0,
             }
             
             # Calculate overall weekly score
@@ -1412,6 +874,7 @@ class HundesystemWeeklySummarySensor(HundesystemSensorBase):
                 "weekly_score": weekly_score,
                 "weekly_assessment": assessment,
                 "metrics": weekly_metrics,
+                "monthly_metrics": self._calculate_monthly_metrics(history),
                 "recommendations": self._get_weekly_recommendations(weekly_metrics),
                 "week_start": (datetime.now() - timedelta(days=datetime.now().weekday())).date().isoformat(),
                 "last_updated": datetime.now().isoformat(),
@@ -1425,38 +888,43 @@ class HundesystemWeeklySummarySensor(HundesystemSensorBase):
                 "last_updated": datetime.now().isoformat(),
             }
 
-    def _calculate_feeding_consistency(self) -> float:
-        """Calculate feeding consistency score."""
-        # Simplified - in real implementation would track daily patterns
-        feeding_entities = [f"input_boolean.{self._dog_name}_feeding_{meal}" for meal in FEEDING_TYPES]
-        
-        fed_count = 0
-        total_count = len(feeding_entities)
-        
-        for entity_id in feeding_entities:
-            state = self.hass.states.get(entity_id)
-            if state and state.state == "on":
-                fed_count += 1
+    def _calculate_average_daily_score(self, history: Optional[DailyHistory], days: int) -> float:
+        """Calculate the mean daily score, falling back to today's score."""
+        average = history.mean("daily_score", days) if history else None
+        if average is None:
+            daily_value = self._snapshot.value("sensor", "daily_summary")
+            try:
+                average = float(daily_value)
+            except (TypeError, ValueError):
+                average = 0
+        return round(average, 1)
+
+    def _calculate_feeding_consistency(self, history: Optional[DailyHistory], days: int) -> float:
+        """Calculate feeding consistency score (share of days with all essential meals)."""
+        rate = history.rate("feeding_complete", days) if history else None
+        if rate is None:
+            rate = self._data["feeding"]["essential_meals_completed"] / len(ESSENTIAL_MEALS)
         
-        return (fed_count / total_count) * 10 if total_count > 0 else 0
+        return round(rate * 10, 1)
 
-    def _calculate_activity_trend(self) -> str:
-        """Calculate activity trend."""
-        # Simplified trend calculation
-        activity_sensor = self.hass.states.get(f"sensor.{self._dog_name}_activity")
-        current_activities = int(activity_sensor.state) if activity_sensor and activity_sensor.state.isdigit() else 0
+    def _calculate_activity_trend(self, history: Optional[DailyHistory], days: int) -> str:
+        """Calculate activity trend from the slope of daily activities."""
+        slope = history.slope("activities", days) if history else None
         
-        if current_activities >= 8:
+        if slope is None:
+            return "Unbekannt"
+        elif slope >= 0.5:
             return "Steigend"
-        elif current_activities >= 4:
-            return "Stabil"
-        else:
+        elif slope <= -0.5:
             return "Sinkend"
+        else:
+            return "Stabil"
 
-    def _calculate_health_trend(self) -> str:
-        """Calculate health trend."""
-        health_sensor = self.hass.states.get(f"sensor.{self._dog_name}_health_score")
-        current_health = float(health_sensor.state) if health_sensor and health_sensor.state.replace('.', '').isdigit() else 5
+    def _calculate_health_trend(self, history: Optional[DailyHistory], days: int) -> str:
+        """Calculate health trend from the mean health score."""
+        current_health = history.mean("health_score", days) if history else None
+        if current_health is None:
+            current_health = self._data["health"]["score"]
         
         if current_health >= 8:
             return "Ausgezeichnet"
@@ -1465,6 +933,20 @@ class HundesystemWeeklySummarySensor(HundesystemSensorBase):
         else:
             return "Verbesserungswürdig"
 
+    def _calculate_monthly_metrics(self, history: Optional[DailyHistory]) -> Dict[str, Any]:
+        """Calculate the same metrics over the whole stored window."""
+        if not history:
+            return {}
+        
+        average_activities = history.mean("activities", HISTORY_DAYS)
+        return {
+            "average_daily_score": self._calculate_average_daily_score(history, HISTORY_DAYS),
+            "feeding_consistency": self._calculate_feeding_consistency(history, HISTORY_DAYS),
+            "activity_trend": self._calculate_activity_trend(history, HISTORY_DAYS),
+            "average_activities": round(average_activities, 1) if average_activities is not None else None,
+            "days_recorded": len(history.days(HISTORY_DAYS)),
+        }
+
     def _calculate_weekly_score(self, metrics: Dict[str, Any]) -> float:
         """Calculate overall weekly score."""
         daily_score = metrics.get("average_daily_score", 0)
@@ -1506,3 +988,229 @@ class HundesystemWeeklySummarySensor(HundesystemSensorBase):
             recommendations.append("Weiterhin exzellente Pflege!")
         
         return recommendations
+
+
+class HundesystemNotificationQueueSensor(HundesystemSensorBase):
+    """Diagnostic sensor for the outgoing notification queue."""
+
+    _data_sections = ()
+    _source_fields = ()
+    _time_dependent = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        dog_name: str,
+    ) -> None:
+        """Initialize the notification queue sensor."""
+        super().__init__(hass, config_entry, dog_name, ENTITIES["notification_queue"])
+        self._attr_icon = ICONS["bell"]
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = "messages"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        
+        # Follow queue changes
+        self._listeners.append(
+            async_get_notification_queue(self.hass).async_add_listener(
+                self._async_schedule_update, self._dog_name
+            )
+        )
+        
+        # Initial update
+        await self._async_update_state()
+
+    async def _async_update_state(self) -> None:
+        """Update the queue depth and counters."""
+        try:
+            queue = async_get_notification_queue(self.hass)
+            
+            self._attr_native_value = queue.dog_depth(self._dog_name)
+            
+            self._attr_extra_state_attributes = {
+                **queue.dog_stats(self._dog_name),
+                "last_updated": datetime.now().isoformat(),
+            }
+            
+        except Exception as e:
+            _LOGGER.error("Error updating notification queue sensor for %s: %s", self._dog_name, e)
+
+
+class HundesystemJournalSensor(HundesystemSensorBase):
+    """Sensor with the number of journal entries and the most recent ones as attributes."""
+
+    _data_sections = ()
+    _source_fields = ()
+    _time_dependent = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        dog_name: str,
+    ) -> None:
+        """Initialize the journal sensor."""
+        super().__init__(hass, config_entry, dog_name, ENTITIES["journal"])
+        self._attr_icon = ICONS["notes"]
+        self._attr_native_unit_of_measurement = "entries"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        
+        # Follow journal appends
+        journal = get_dog_journal(self.hass, self._dog_name)
+        if journal is not None:
+            self._listeners.append(journal.async_add_listener(self._async_schedule_update))
+        
+        # Initial update
+        await self._async_update_state()
+
+    async def _async_update_state(self) -> None:
+        """Update the entry count and the most recent entries."""
+        try:
+            journal = get_dog_journal(self.hass, self._dog_name)
+            if journal is None:
+                return
+            
+            recent = journal.recent(JOURNAL_RECENT_ENTRIES)
+            
+            self._attr_native_value = len(journal)
+            
+            self._attr_extra_state_attributes = {
+                "recent_entries": recent,
+                "last_entry": recent[0] if recent else None,
+                "last_updated": datetime.now().isoformat(),
+            }
+            
+        except Exception as e:
+            _LOGGER.error("Error updating journal sensor for %s: %s", self._dog_name, e)
+
+
+class HundesystemActivityTrendSensor(HundesystemSensorBase):
+    """Sensor with the 7-day activity average and the trends and anomalies of the recorded history."""
+
+    _data_sections = ()
+    _source_fields = ()
+    _time_dependent = False
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        dog_name: str,
+    ) -> None:
+        """Initialize the activity trend sensor."""
+        super().__init__(hass, config_entry, dog_name, ENTITIES["activity_trend"])
+        self._attr_icon = "mdi:chart-line"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = "activities/day"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # A restored "unknown" or "unavailable" is not a measurement
+        try:
+            self._attr_native_value = float(self._attr_native_value)
+        except (TypeError, ValueError):
+            self._attr_native_value = None
+
+        # Follow analytics refreshes
+        analytics = get_dog_analytics(self.hass, self._dog_name)
+        if analytics is not None:
+            self._listeners.append(analytics.async_add_listener(self._async_schedule_update))
+
+    async def _async_update_state(self) -> None:
+        """Update the moving average and the per-series statistics."""
+        try:
+            analytics = get_dog_analytics(self.hass, self._dog_name)
+            if analytics is None or analytics.refreshed is None:
+                return
+            
+            results = analytics.results
+            total = results.get(SERIES_ACTIVITY_TOTAL, {})
+            
+            self._attr_native_value = total.get("moving_average")
+            
+            self._attr_extra_state_attributes = {
+                "today": total.get("today"),
+                "today_z_score": total.get("today_z_score"),
+                "slope": total.get("slope"),
+                "anomalies": total.get("anomalies", []),
+                "hourly_profile": total.get("hourly_profile", []),
+                "series": {
+                    name: {key: value for key, value in summary.items() if key != "hourly_profile"}
+                    for name, summary in results.items()
+                    if name != SERIES_ACTIVITY_TOTAL
+                },
+                "analysed_days": ANALYTICS_DAYS,
+                "last_refresh": analytics.refreshed.isoformat(),
+            }
+            
+        except Exception as e:
+            _LOGGER.error("Error updating activity trend for %s: %s", self._dog_name, e)
+
+
+class HundesystemProfilingSensor(HundesystemSensorBase):
+    """Diagnostic sensor with the profiled update, service and setup timings (disabled by default).
+
+    It belongs to the entry rather than to a dog; the first dog only feeds
+    the base class's update scheduling.
+    """
+
+    _data_sections = ()
+    _source_fields = ()
+    _time_dependent = True
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the profiling sensor."""
+        super().__init__(hass, config_entry, entry_dog_names(config_entry)[0], ENTITIES["profiling"])
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{ENTITIES['profiling']}"
+        self._attr_name = f"Hundesystem {ENTITIES['profiling'].title()}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.title,
+            manufacturer="Hundesystem",
+            model="Dog Management System",
+            sw_version="2.0.3",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+        self._attr_icon = "mdi:timer-outline"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_entity_registry_enabled_default = False
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_native_unit_of_measurement = "ms"
+
+    async def _async_update_state(self) -> None:
+        """Update the slowest p90 entity update and the per-category percentiles."""
+        try:
+            profiler = async_get_profiler(self.hass)
+            summary = profiler.summary()
+            
+            self._attr_native_value = profiler.slowest(CATEGORY_ENTITY_UPDATE)
+            
+            self._attr_extra_state_attributes = {
+                "entity_update_p90_ms": {
+                    name: stats["p90_ms"] for name, stats in summary.get(CATEGORY_ENTITY_UPDATE, {}).items()
+                },
+                "service_p90_ms": {
+                    name: stats["p90_ms"] for name, stats in summary.get(CATEGORY_SERVICE, {}).items()
+                },
+                "setup_ms": {
+                    name: stats["max_ms"] for name, stats in summary.get(CATEGORY_SETUP, {}).items()
+                },
+                "slowest_service_p90_ms": profiler.slowest(CATEGORY_SERVICE),
+                "last_updated": datetime.now().isoformat(),
+            }
+            
+        except Exception as e:
+            _LOGGER.error("Error updating profiling sensor for %s: %s", self._config_entry.title, e)
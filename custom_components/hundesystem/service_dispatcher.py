@@ -0,0 +1,207 @@
+"""Single dispatcher for the hundesystem.* services, routing calls to dogs by name."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .profiling import CATEGORY_SERVICE, async_get_profiler
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SERVICE_DISPATCHER = f"{DOMAIN}_service_dispatcher"
+
+ATTR_DOG_NAME = "dog_name"
+
+# dog_name accepts a single dog or a list of dogs
+DOG_NAMES = vol.All(cv.ensure_list, [cv.string])
+
+# Handler of one dog: (dog_data, validated service data)
+DogServiceHandler = Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[None]]
+# Handler of all targeted dogs at once: (list of dog_data, validated service data)
+BatchServiceHandler = Callable[[List[Dict[str, Any]], Dict[str, Any]], Awaitable[None]]
+
+
+class ServiceDispatcher:
+    """Route hundesystem.* service calls to the handlers of the targeted dogs.
+
+    Every service is registered with Home Assistant once, validated by its
+    compiled schema (the first registration defines it). dog_name names one
+    dog or a list of dogs; without it the call targets every dog. Dogs are
+    found in a dict index kept current by async_add_dog/async_remove_dog. A
+    handler registered for a specific dog takes precedence over the default
+    handler of the service, and the targeted dogs are served concurrently.
+    Services supporting responses return the batch handler's result, or the
+    results of the per-dog handlers keyed by dog name.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self._hass = hass
+        self._profiler = async_get_profiler(hass)
+        self._dogs: Dict[str, Dict[str, Any]] = {}
+        self._services: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def dog_names(self) -> List[str]:
+        """Return the indexed dogs."""
+        return list(self._dogs)
+
+    def get_dog(self, dog_name: str) -> Optional[Dict[str, Any]]:
+        """Return the per-dog state of an indexed dog."""
+        return self._dogs.get(dog_name)
+
+    @callback
+    def async_add_dog(self, dog_data: Dict[str, Any]) -> None:
+        """Index the per-dog state of a dog."""
+        self._dogs[dog_data["dog_name"]] = dog_data
+
+    @callback
+    def async_remove_dog(self, dog_name: str) -> None:
+        """Drop a dog and its dog-specific handlers."""
+        self._dogs.pop(dog_name, None)
+        for service in self._services.values():
+            service["dogs"].pop(dog_name, None)
+
+    @callback
+    def async_register(
+        self,
+        service: str,
+        schema: Optional[vol.Schema],
+        handler: Optional[Callable[..., Awaitable[Any]]] = None,
+        batch: bool = False,
+        supports_response: SupportsResponse = SupportsResponse.NONE,
+    ) -> None:
+        """Register a service once; handler serves every dog without a handler of its own.
+
+        A batch handler is called once with all those dogs instead of once per dog.
+        """
+        entry = self._services.get(service)
+        if entry is None:
+            entry = {"handler": None, "batch": False, "dogs": {}, "supports_response": supports_response}
+            self._services[service] = entry
+            self._hass.services.async_register(
+                DOMAIN,
+                service,
+                self._profiler.wrap(CATEGORY_SERVICE, service, partial(self._async_dispatch, service)),
+                schema=schema,
+                supports_response=supports_response,
+            )
+            _LOGGER.debug("Registered service: %s", service)
+
+        if handler is not None:
+            entry["handler"] = handler
+            entry["batch"] = batch
+
+    @callback
+    def async_register_dog_handler(
+        self,
+        service: str,
+        dog_name: str,
+        handler: DogServiceHandler,
+        schema: Optional[vol.Schema] = None,
+    ) -> Callable[[], None]:
+        """Serve a service for one dog with its own handler; returns a remove callback."""
+        self.async_register(service, schema)
+        self._services[service]["dogs"][dog_name] = handler
+
+        @callback
+        def _remove() -> None:
+            entry = self._services.get(service)
+            if entry is not None and entry["dogs"].get(dog_name) is handler:
+                del entry["dogs"][dog_name]
+
+        return _remove
+
+    @callback
+    def async_stop(self) -> None:
+        """Unregister every service."""
+        for service in self._services:
+            if self._hass.services.has_service(DOMAIN, service):
+                self._hass.services.async_remove(DOMAIN, service)
+                _LOGGER.debug("Unregistered service: %s", service)
+        self._services.clear()
+        self._dogs.clear()
+
+    def _resolve_targets(self, dog_names: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """Return the per-dog state of the named dogs, or of every dog."""
+        if not dog_names:
+            return list(self._dogs.values())
+
+        missing = [dog_name for dog_name in dog_names if dog_name not in self._dogs]
+        if len(missing) == 1:
+            raise ServiceValidationError(f"Dog '{missing[0]}' not found")
+        if missing:
+            raise ServiceValidationError(f"Dogs not found: {', '.join(missing)}")
+
+        return [self._dogs[dog_name] for dog_name in dict.fromkeys(dog_names)]
+
+    async def _async_dispatch(self, service: str, call: ServiceCall) -> ServiceResponse:
+        """Run the handlers of all targeted dogs concurrently."""
+        entry = self._services[service]
+        data = dict(call.data)
+        targets = self._resolve_targets(data.pop(ATTR_DOG_NAME, None))
+
+        own = [dog_data for dog_data in targets if dog_data["dog_name"] in entry["dogs"]]
+        shared = [dog_data for dog_data in targets if dog_data["dog_name"] not in entry["dogs"]]
+        if shared and entry["handler"] is None:
+            raise ServiceValidationError(
+                f"Service {service} is not available for: "
+                f"{', '.join(dog_data['dog_name'] for dog_data in shared)}"
+            )
+
+        labels = [dog_data["dog_name"] for dog_data in own]
+        jobs: List[Awaitable[Any]] = [
+            entry["dogs"][dog_data["dog_name"]](dog_data, data) for dog_data in own
+        ]
+        if shared:
+            if entry["batch"]:
+                labels.append(", ".join(dog_data["dog_name"] for dog_data in shared))
+                jobs.append(entry["handler"](shared, data))
+            else:
+                for dog_data in shared:
+                    labels.append(dog_data["dog_name"])
+                    jobs.append(entry["handler"](dog_data, data))
+
+        results = await asyncio.gather(*jobs, return_exceptions=True)
+        errors = [(label, result) for label, result in zip(labels, results) if isinstance(result, Exception)]
+        if not errors:
+            if entry["supports_response"] is SupportsResponse.NONE:
+                return None
+            if entry["batch"] and not entry["dogs"]:
+                return results[0] if results else {}
+            return dict(zip(labels, results))
+
+        for label, error in errors:
+            _LOGGER.error("Service %s failed for %s: %s", service, label, error)
+        if len(errors) == 1 and isinstance(errors[0][1], ServiceValidationError):
+            raise errors[0][1]
+        raise ServiceValidationError(
+            f"Service {service} failed for {', '.join(label for label, _ in errors)}: {errors[0][1]}"
+        )
+
+
+@callback
+def async_get_service_dispatcher(hass: HomeAssistant) -> ServiceDispatcher:
+    """Return the shared service dispatcher, creating it on first use."""
+    dispatcher = hass.data.get(DATA_SERVICE_DISPATCHER)
+    if dispatcher is None:
+        dispatcher = ServiceDispatcher(hass)
+        hass.data[DATA_SERVICE_DISPATCHER] = dispatcher
+    return dispatcher
+
+
+@callback
+def async_stop_service_dispatcher(hass: HomeAssistant) -> None:
+    """Unregister the services and drop the shared dispatcher."""
+    dispatcher = hass.data.pop(DATA_SERVICE_DISPATCHER, None)
+    if dispatcher is not None:
+        dispatcher.async_stop()
@@ -0,0 +1,250 @@
+"""Per-dog state snapshot shared by all Hundesystem entities."""
+from __future__ import annotations
+
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    DOMAIN,
+    HELPER_DEFINITIONS,
+    FEEDING_TYPES,
+    ACTIVITY_TYPES,
+)
+from .entity_ids import DogEntityIds, dog_entity_ids
+from .household import get_dog_data
+
+_LOGGER = logging.getLogger(__name__)
+
+# Entities of other platforms that sensors read besides the helpers
+DERIVED_ENTITIES = [
+    ("binary_sensor", "needs_attention"),
+    ("binary_sensor", "feeding_complete"),
+    ("binary_sensor", "daily_tasks_complete"),
+    ("sensor", "status"),
+    ("sensor", "feeding_status"),
+    ("sensor", "activity"),
+    ("sensor", "last_activity"),
+    ("sensor", "daily_summary"),
+    ("sensor", "health_score"),
+]
+
+UNAVAILABLE_STATES = ["unknown", "unavailable"]
+
+
+class DogStateSnapshot:
+    """Cached view of one dog's helper states, kept current by a single listener."""
+
+    def __init__(self, hass: HomeAssistant, dog_name: str) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._dog_name = dog_name
+        self._ids = dog_entity_ids(dog_name)
+        self._states: Dict[str, Optional[State]] = {}
+        self._subscribers: Dict[str, List[Callable[[Event], None]]] = {}
+        self._unsub_state_listener: Optional[Callable[[], None]] = None
+
+    @property
+    def dog_name(self) -> str:
+        """Return the dog name."""
+        return self._dog_name
+
+    @property
+    def ids(self) -> DogEntityIds:
+        """Return the dog's entity ID table."""
+        return self._ids
+
+    @callback
+    def async_start(self) -> None:
+        """Load the current states and start the shared state listener."""
+        tracked = [
+            self._ids.get(domain, definition[0])
+            for domain, definitions in HELPER_DEFINITIONS.items()
+            for definition in definitions
+        ]
+        tracked.extend(self._ids.get(domain, suffix) for domain, suffix in DERIVED_ENTITIES)
+        for entity_id in tracked:
+            self._states[entity_id] = self._hass.states.get(entity_id)
+        self._async_resubscribe()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the shared state listener."""
+        if self._unsub_state_listener is not None:
+            self._unsub_state_listener()
+            self._unsub_state_listener = None
+        self._subscribers.clear()
+
+    @callback
+    def _async_resubscribe(self) -> None:
+        """(Re)create the single listener over every tracked entity."""
+        if self._unsub_state_listener is not None:
+            self._unsub_state_listener()
+        self._unsub_state_listener = async_track_state_change_event(
+            self._hass, list(self._states), self._async_state_changed
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the cached state, then notify the entities depending on it."""
+        entity_id = event.data.get("entity_id")
+        self._states[entity_id] = event.data.get("new_state")
+
+        for subscriber in list(self._subscribers.get(entity_id, [])):
+            try:
+                subscriber(event)
+            except Exception as e:
+                _LOGGER.error("Error in snapshot subscriber for %s: %s", entity_id, e)
+
+    @callback
+    def async_subscribe(
+        self, entity_ids: Iterable[str], callback_func: Callable[[Event], None]
+    ) -> Callable[[], None]:
+        """Call callback_func after the snapshot has applied a change to entity_ids."""
+        entity_ids = list(entity_ids)
+        new_entities = [entity_id for entity_id in entity_ids if entity_id not in self._states]
+        for entity_id in new_entities:
+            self._states[entity_id] = self._hass.states.get(entity_id)
+        if new_entities and self._unsub_state_listener is not None:
+            self._async_resubscribe()
+
+        for entity_id in entity_ids:
+            self._subscribers.setdefault(entity_id, []).append(callback_func)
+
+        @callback
+        def _unsubscribe() -> None:
+            for entity_id in entity_ids:
+                subscribers = self._subscribers.get(entity_id, [])
+                if callback_func in subscribers:
+                    subscribers.remove(callback_func)
+
+        return _unsubscribe
+
+    def entity_id(self, domain: str, suffix: str) -> str:
+        """Return the entity id of one of this dog's entities."""
+        return self._ids.get(domain, suffix)
+
+    def state_of(self, entity_id: str) -> Optional[State]:
+        """Return the cached state object of an entity id."""
+        if entity_id not in self._states:
+            return self._hass.states.get(entity_id)
+        return self._states[entity_id]
+
+    def value_of(self, entity_id: str) -> Optional[str]:
+        """Return the raw state string of an entity id if it is available."""
+        state = self.state_of(entity_id)
+        if state is None or state.state in UNAVAILABLE_STATES:
+            return None
+        return state.state
+
+    def state(self, domain: str, suffix: str) -> Optional[State]:
+        """Return the cached state object."""
+        return self.state_of(self._ids.get(domain, suffix))
+
+    def value(self, domain: str, suffix: str) -> Optional[str]:
+        """Return the raw state string if it is available."""
+        return self.value_of(self._ids.get(domain, suffix))
+
+    def attributes(self, domain: str, suffix: str) -> Dict[str, Any]:
+        """Return the cached state attributes."""
+        state = self.state(domain, suffix)
+        return dict(state.attributes) if state else {}
+
+    # Typed accessors
+
+    def is_on(self, suffix: str) -> bool:
+        """Return True if input_boolean.<dog>_<suffix> is on."""
+        return self.value("input_boolean", suffix) == "on"
+
+    def count(self, suffix: str) -> int:
+        """Return the value of counter.<dog>_<suffix>."""
+        return self._count_of(self._ids.get("counter", suffix))
+
+    def number(self, suffix: str, default: Optional[float] = None) -> Optional[float]:
+        """Return the value of input_number.<dog>_<suffix>."""
+        try:
+            return float(self.value("input_number", suffix))
+        except (TypeError, ValueError):
+            return default
+
+    def option(self, suffix: str, default: str = "") -> str:
+        """Return the selected option of input_select.<dog>_<suffix>."""
+        return self.value("input_select", suffix) or default
+
+    def text(self, suffix: str, default: str = "") -> str:
+        """Return the value of input_text.<dog>_<suffix>."""
+        return self.value("input_text", suffix) or default
+
+    def timestamp(self, suffix: str) -> Optional[str]:
+        """Return the value of input_datetime.<dog>_<suffix>."""
+        return self.value("input_datetime", suffix)
+
+    # Grouped views
+
+    def _count_of(self, entity_id: str) -> int:
+        """Return the value of a counter entity id."""
+        try:
+            return int(self.value_of(entity_id))
+        except (TypeError, ValueError):
+            return 0
+
+    def feeding(self, meal_type: str) -> Dict[str, Any]:
+        """Return fed flag, count, scheduled and last time of one meal."""
+        ids = self._ids.meals[meal_type]
+        return {
+            "fed": self.value_of(ids["fed"]) == "on",
+            "count": self._count_of(ids["count"]),
+            "scheduled_time": self.value_of(ids["scheduled_time"]),
+            "last_time": self.value_of(ids["last_time"]),
+        }
+
+    def activity(self, activity_type: str) -> Dict[str, Any]:
+        """Return count and last time of one activity."""
+        ids = self._ids.activities[activity_type]
+        return {
+            "count": self._count_of(ids["count"]),
+            "last_time": self.value_of(ids["last_time"]),
+        }
+
+    def health(self) -> Dict[str, Any]:
+        """Return the health related fields."""
+        return {
+            "health_status": self.option("health_status", "Gut"),
+            "mood": self.option("mood", "😊 Glücklich"),
+            "energy_level": self.option("energy_level_category", "Normal"),
+            "appetite_level": self.option("appetite_level", "Normal"),
+            "health_score": self.number("health_score"),
+            "emergency_mode": self.is_on("emergency_mode"),
+            "feeling_well": self.is_on("feeling_well"),
+        }
+
+    def feeding_entities(self) -> List[str]:
+        """Return all entity ids describing the feeding state."""
+        entity_ids = []
+        for meal_type in FEEDING_TYPES:
+            ids = self._ids.meals[meal_type]
+            entity_ids.extend([ids["fed"], ids["count"], ids["scheduled_time"]])
+        return entity_ids
+
+    def activity_entities(self) -> List[str]:
+        """Return all entity ids describing activities."""
+        entity_ids = []
+        for activity_type in ACTIVITY_TYPES:
+            ids = self._ids.activities[activity_type]
+            entity_ids.extend([ids["count"], ids["last_time"]])
+        return entity_ids
+
+
+def async_get_snapshot(hass: HomeAssistant, config_entry: ConfigEntry, dog_name: str) -> DogStateSnapshot:
+    """Return the snapshot of one dog of a config entry, creating it on first use."""
+    dog_data = get_dog_data(hass, config_entry, dog_name)
+    snapshot = dog_data.get("snapshot")
+    if snapshot is None:
+        snapshot = DogStateSnapshot(hass, dog_name)
+        snapshot.async_start()
+        dog_data["snapshot"] = snapshot
+        hass.data[DOMAIN][config_entry.entry_id].setdefault("listeners", []).append(snapshot.async_stop)
+    return snapshot
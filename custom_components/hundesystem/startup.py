@@ -0,0 +1,76 @@
+"""Staged setup bookkeeping: timing of critical and deferred setup stages."""
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+from .profiling import CATEGORY_SETUP, Profiler
+
+STAGE_CRITICAL = "critical"    # Stages async_setup_entry waits for
+STAGE_DEFERRED = "deferred"    # Stages run in the background after Home Assistant started
+
+
+class SetupTimings:
+    """Wall-clock durations of the setup stages of one config entry."""
+
+    def __init__(self, profiler: Optional[Profiler] = None) -> None:
+        """Start timing the setup; stages are also recorded as profiler spans."""
+        self._profiler = profiler
+        self._started = time.monotonic()
+        self._started_at = datetime.now().isoformat()
+        self._stages: Dict[str, Dict[str, float]] = {STAGE_CRITICAL: {}, STAGE_DEFERRED: {}}
+        self._failed: Dict[str, str] = {}
+        self._critical_done: Optional[float] = None
+        self._deferred_started: Optional[float] = None
+        self._deferred_done: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str, group: str = STAGE_CRITICAL) -> Iterator[None]:
+        """Time one stage; failures are recorded and re-raised."""
+        start = time.monotonic()
+        if group == STAGE_DEFERRED and self._deferred_started is None:
+            self._deferred_started = start
+        try:
+            yield
+        except Exception as e:
+            self._failed[name] = str(e)
+            raise
+        finally:
+            duration = time.monotonic() - start
+            self._stages[group][name] = round(duration, 3)
+            if self._profiler is not None:
+                self._profiler.record(CATEGORY_SETUP, name, duration)
+
+    def critical_done(self) -> None:
+        """Mark the end of the critical path (setup returns)."""
+        self._critical_done = time.monotonic()
+
+    def deferred_done(self) -> None:
+        """Mark the end of the deferred stages."""
+        self._deferred_done = time.monotonic()
+
+    @property
+    def critical_duration(self) -> Optional[float]:
+        """Return the seconds until setup returned."""
+        if self._critical_done is None:
+            return None
+        return round(self._critical_done - self._started, 3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the timing breakdown for diagnostics."""
+        return {
+            "started_at": self._started_at,
+            "critical_seconds": self.critical_duration,
+            "deferred_wait_seconds": (
+                round(self._deferred_started - self._critical_done, 3)
+                if self._deferred_started is not None and self._critical_done is not None else None
+            ),
+            "deferred_seconds": (
+                round(self._deferred_done - self._deferred_started, 3)
+                if self._deferred_done is not None and self._deferred_started is not None else None
+            ),
+            "stages": {group: dict(stages) for group, stages in self._stages.items()},
+            "failed_stages": dict(self._failed),
+        }